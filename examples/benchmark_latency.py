@@ -0,0 +1,43 @@
+# examples/benchmark_latency.py
+
+import os
+os.environ["TOKENIZERS_PARALLELISM"] = "false"
+
+from llm_test_suite.benchmarks.latency_benchmark import LatencyBenchmark, save_report
+
+# Models to benchmark
+models_to_benchmark = [
+    "gpt2",
+    "distilgpt2",
+]
+
+prompts = [
+    "Hello, my name is",
+    "Once upon a time in a small village",
+    "The meaning of life is",
+]
+
+benchmark = LatencyBenchmark(
+    models_to_benchmark,
+    warmup_iterations=3,   # Untimed runs to get caches and allocators warm
+    measured_runs=10,      # Timed runs per prompt
+    max_new_tokens=20
+)
+report = benchmark.run(prompts)
+
+print("\n" + "=" * 60)
+print("Latency Summary")
+print("=" * 60)
+for model_name, model_report in report['models'].items():
+    if 'error' in model_report:
+        print(f"{model_name}: failed ({model_report['error']})")
+        continue
+    overall = model_report['overall']
+    print(f"{model_name}:")
+    print(f"  Load time: {model_report['load_time']:.1f}s")
+    print(f"  p50: {overall['p50']:.3f}s | p90: {overall['p90']:.3f}s | p99: {overall['p99']:.3f}s")
+    print(f"  Std dev: {overall['stdev']:.3f}s | {overall['tokens_per_second']:.1f} tokens/s")
+
+# Save a JSON report that can be diffed against later runs
+os.makedirs("results/benchmarks", exist_ok=True)
+save_report(report, "results/benchmarks/latency_benchmark.json")
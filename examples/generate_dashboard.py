@@ -1,23 +1,33 @@
 from llm_test_suite.reporting.dashboard import DashboardGenerator
 import os
 
-# Create dashboard generator
-generator = DashboardGenerator("results")
-
-# Generate the dashboard
-dashboard_path = generator.generate_dashboard()
-
-if dashboard_path:
-    # Get absolute path
-    abs_path = os.path.abspath(dashboard_path)
-    
-    print(f"\n🎉 Dashboard ready!")
-    print(f"Open in your browser: file://{abs_path}")
-    
-    # Try to open in browser automatically
-    import webbrowser
-    try:
-        webbrowser.open(f"file://{abs_path}")
-        print("Opening in browser...")
-    except:
-        print("Please open the file manually in your browser")
\ No newline at end of file
+
+def main():
+    # Create dashboard generator
+    # Flag models/tests whose latest daily latency is 20% above the last week's
+    generator = DashboardGenerator("results", regression_threshold=0.2)
+
+    # Generate the dashboard
+    # Only re-parse result files that are new or changed since the last run
+    dashboard_path = generator.generate_dashboard(incremental=True)
+
+    if dashboard_path:
+        # Get absolute path
+        abs_path = os.path.abspath(dashboard_path)
+
+        print(f"\n🎉 Dashboard ready!")
+        print(f"Open in your browser: file://{abs_path}")
+
+        # Try to open in browser automatically
+        import webbrowser
+        try:
+            webbrowser.open(f"file://{abs_path}")
+            print("Opening in browser...")
+        except:
+            print("Please open the file manually in your browser")
+
+
+# Large result sets are parsed in worker processes, which re-import this
+# script on spawn platforms (macOS, Windows)
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# examples/http_backend.py
+# Run the suite against models served by an OpenAI-compatible server,
+# e.g. `vllm serve gpt2 --port 8000`
+
+import functools
+import os
+
+from llm_test_suite.backends.openai_http import OpenAICompatibleBackend
+from llm_test_suite.comparisons.model_comparator import ModelComparator
+from llm_test_suite.evaluators.length import LengthEvaluator
+from llm_test_suite.evaluators.quality import QualityEvaluator
+
+BASE_URL = os.environ.get("LLM_BASE_URL", "http://localhost:8000/v1")
+API_KEY = os.environ.get("LLM_API_KEY")
+
+# Model names as the server knows them
+served_models = ["gpt2"]
+
+test_cases = [
+    {"name": "greeting", "prompt": "Hello, my name is", "max_tokens": 30},
+    {"name": "story", "prompt": "Once upon a time", "max_tokens": 50},
+    {"name": "facts", "prompt": "The capital of France is", "max_tokens": 20},
+]
+
+backend = functools.partial(
+    OpenAICompatibleBackend,
+    BASE_URL,
+    api_key=API_KEY,
+    max_connections=8,  # Requests in flight per model
+    max_retries=3
+)
+
+with ModelComparator(served_models, backend=backend) as comparator:
+    results = comparator.run_comparison_suite(
+        test_cases,
+        evaluators=[LengthEvaluator(min_words=3, max_words=60), QualityEvaluator()],
+        streaming=True,   # Time-to-first-token from the SSE stream
+        pipelined=True    # Evaluate while the next request is in flight
+    )
+
+for model_name, stats in results['summary']['model_stats'].items():
+    print(f"{model_name}: p50 {stats.get('p50_generation_time', 0):.3f}s | "
+          f"TTFT {stats.get('avg_time_to_first_token', 0):.3f}s | "
+          f"{stats.get('avg_tokens_per_second', 0):.1f} tok/s | "
+          f"{stats['failed_responses']} failed")
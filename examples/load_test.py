@@ -0,0 +1,35 @@
+# examples/load_test.py
+# Throughput-vs-latency sweep against an OpenAI-compatible server
+
+import os
+
+from llm_test_suite.backends.openai_http import OpenAICompatibleBackend
+from llm_test_suite.benchmarks.latency_benchmark import save_report
+from llm_test_suite.benchmarks.load_test import LoadGenerator
+from llm_test_suite.cases import DEFAULT_TEST_CASES
+
+BASE_URL = os.environ.get("LLM_BASE_URL", "http://localhost:8000/v1")
+MODEL = os.environ.get("LLM_MODEL", "gpt2")
+
+# Enough pooled connections for the highest concurrency level
+backend = OpenAICompatibleBackend(BASE_URL, MODEL, max_connections=64, max_retries=0)
+generator = LoadGenerator(backend, DEFAULT_TEST_CASES, max_new_tokens=50, streaming=True)
+
+# Closed loop: N clients back to back
+closed = generator.sweep([1, 2, 4, 8, 16, 32, 64], mode="closed", duration=30)
+
+# Open loop: Poisson arrivals at a target rate (requests/second)
+opened = generator.sweep([1, 2, 5, 10, 20], mode="open", duration=30)
+
+for report in (closed, opened):
+    saturation = report['saturation_level']
+    if saturation is None:
+        print(f"{report['config']['mode']} loop: no saturation within the sweep")
+    else:
+        print(f"{report['config']['mode']} loop: saturates at level "
+              f"{report['config']['levels'][saturation]}")
+
+os.makedirs("results/benchmarks", exist_ok=True)
+save_report(closed, "results/benchmarks/load_closed.json")
+save_report(opened, "results/benchmarks/load_open.json")
+backend.close()
@@ -1,39 +1,79 @@
 
-from transformers import pipeline, set_seed
+from transformers import set_seed
+import torch
+import argparse
+import os
 import time
-from typing import Dict, Any, List, Optional
+from itertools import combinations, groupby, islice
+from typing import Dict, Any, List, Optional, Callable, Iterable, Union
 import json
 from datetime import datetime
 
+from llm_test_suite.backends.base import GenerationBackend
+from llm_test_suite.backends.local import PipelineBackend
+from llm_test_suite.cases import DEFAULT_TEST_CASES, GENERATION_PARAMS, iter_test_cases
+from llm_test_suite.evaluators.analysis import TextAnalysis, as_analysis
+from llm_test_suite.evaluators.pipeline import EvaluationPipeline
+from llm_test_suite.evaluators.registry import build_evaluators
+from llm_test_suite.evaluators.repetition import repetition_stats
+from llm_test_suite.runners.async_runner import AsyncSuiteRunner
+from llm_test_suite.runners.sharding import iter_shard, merge_shard_results, parse_shard, suite_summary
+from llm_test_suite.utils.response_cache import ResponseCache
+from llm_test_suite.utils.results_manager import ResultsManager
+
 
 class LLMTester:
     
     
-    def __init__(self, model_name: str = "gpt2", device: str = "cpu"):
-        """Initialize with a model from Hugging Face."""
-        print(f"Loading model: {model_name}...")
-        self.model_name = model_name
-        self.device = device
+    def __init__(
+        self,
+        model_name: str = "gpt2",
+        device: str = "cpu",
+        warmup_iterations: int = 1,
+        cache_dir: Optional[str] = None,
+        seed: int = 42,
+        backend: Optional[GenerationBackend] = None,
+    ):
+        """Initialize with a model from Hugging Face.
+        
+        With ``cache_dir`` set, ``test_completion`` reuses generations from
+        earlier runs with the same model revision, prompt, generation
+        parameters and ``seed``. The seed is then reset before every
+        generation so a cached response is exactly what the model would
+        produce again.
         
-        # Load model with explicit device setting
-        self.pipeline = pipeline(
-            "text-generation", 
-            model=model_name,
-            device=0 if device == "cuda" else -1  # -1 for CPU
+        Pass a ``backend`` (e.g. ``OpenAICompatibleBackend``) to test a model
+        served elsewhere; ``model_name`` and ``device`` are then ignored.
+        """
+        if backend is None:
+            print(f"Loading model: {model_name}...")
+            # Load model with explicit device setting
+            backend = PipelineBackend(model_name, device)
+            print("Model loaded! ✓")
+        
+        self.backend = backend
+        self.model_name = backend.model_name
+        self.device = device
+        self.seed = seed
+        self._evaluators = {}
+        # Only local backends expose a pipeline (used for padded batching)
+        self.pipeline = getattr(backend, "pipeline", None)
+        self.response_cache = (
+            ResponseCache(cache_dir, revisions={self.model_name: backend.revision})
+            if cache_dir else None
         )
         
         # Set random seed for reproducibility
-        set_seed(42)
-        
-        print("Model loaded! ✓")
+        set_seed(seed)
         
         # Warm up the model
-        self._warmup()
+        self._warmup(warmup_iterations)
     
-    def _warmup(self):
-        """Warm up the model with a dummy generation"""
+    def _warmup(self, iterations: int = 1):
+        """Warm up the model with dummy generations"""
         print("Warming up model...")
-        self.pipeline("Hello", max_new_tokens=5, temperature=0.1)
+        for _ in range(iterations):
+            self.backend.generate("Hello", max_new_tokens=5, temperature=0.1)
         print("Warmup complete! ✓")
     
     def test_completion(
@@ -42,201 +82,508 @@ class LLMTester:
         max_new_tokens: int = 50,
         temperature: float = 0.7,
         timeout: int = 15,  # Increased timeout
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
        
         print(f"\nTesting prompt: '{prompt}'")
         
+        cache = self.response_cache if use_cache else None
+        cache_kwargs = {"max_new_tokens": max_new_tokens, "temperature": temperature, "do_sample": True}
+        if cache is not None:
+            cached = cache.get(self.model_name, prompt, cache_kwargs, self.seed)
+            if cached is not None:
+                # Checks are re-run; the timing is the original generation's
+                result = self._build_result(prompt, cached["completion"], cached["full_text"],
+                                            cached["time_taken"], timeout)
+                result["cached"] = True
+                return result
+        
         # Measure time
         start_time = time.time()
         
         try:
-            # Generate text with explicit padding token
-            result = self.pipeline(
+            generation = self.backend.generate(
                 prompt,
                 max_new_tokens=max_new_tokens,
-                num_return_sequences=1,
                 temperature=temperature,
-                pad_token_id=self.pipeline.tokenizer.eos_token_id,
                 do_sample=True,  # Enable sampling for temperature to work
-            )[0]
-            
-            end_time = time.time()
-            
-            # Extract generated text
-            full_text = result["generated_text"]
-            completion = full_text[len(prompt):]
-            
-            # Enhanced checks
-            checks = {
-                "not_empty": len(completion.strip()) > 0,
-                "no_error_in_response": "error" not in completion.lower(),
-                "response_time_ok": (end_time - start_time) < timeout,
-                "reasonable_length": 5 < len(completion.split()) < 100,
-                "no_repetition": not self._has_excessive_repetition(completion),
-            }
-            
-            return {
-                "prompt": prompt,
-                "completion": completion.strip(),
+                seed=self.seed if cache is not None else None,
+            )
+        except Exception as e:
+            return self._error_result(prompt, time.time() - start_time, e)
+        
+        completion = generation["text"]
+        full_text = generation["full_text"]
+        elapsed = generation["generation_time"]
+        if cache is not None:
+            cache.put(self.model_name, prompt, cache_kwargs, self.seed, {
+                "completion": completion,
                 "full_text": full_text,
-                "time_taken": round(end_time - start_time, 2),
-                "token_count": len(self.pipeline.tokenizer.encode(completion)),
-                "checks": checks,
-                "all_passed": all(checks.values()),
-                "timestamp": datetime.now().isoformat()
-            }
-            
+                "time_taken": elapsed,
+            })
+        return self._build_result(prompt, completion, full_text, elapsed, timeout,
+                                  generation["token_count"])
+    
+    def test_completion_streaming(
+        self,
+        prompt: str,
+        max_new_tokens: int = 50,
+        temperature: float = 0.7,
+        timeout: int = 15,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> Dict[str, Any]:
+        """Generate with a token streamer and record latency breakdown.
+        
+        Returns the usual result dict plus ``time_to_first_token``,
+        ``inter_token_latency``, ``token_latencies`` and ``tokens_per_second``.
+        ``on_token`` is called with each text chunk as it is produced.
+        """
+        print(f"\nTesting prompt (streaming): '{prompt}'")
+        
+        start_time = time.time()
+        try:
+            generation = self.backend.generate_stream(
+                prompt,
+                max_new_tokens=max_new_tokens,
+                temperature=temperature,
+                do_sample=True,
+                timeout=timeout,
+                on_token=on_token,
+            )
         except Exception as e:
-            return {
-                "prompt": prompt,
-                "completion": "",
-                "full_text": "",
-                "time_taken": round(time.time() - start_time, 2),
-                "token_count": 0,
-                "checks": {"error_occurred": False},
-                "all_passed": False,
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
+            return self._error_result(prompt, time.time() - start_time, e)
+        
+        result = self._build_result(prompt, generation["text"], generation["full_text"],
+                                    generation["generation_time"], timeout,
+                                    generation["token_count"])
+        result.update({
+            "time_to_first_token": generation["time_to_first_token"],
+            "inter_token_latency": generation["inter_token_latency"],
+            "token_latencies": generation["token_latencies"],
+            "tokens_per_second": generation["tokens_per_second"],
+        })
+        return result
+    
+    def test_completion_batch(
+        self,
+        prompts: List[str],
+        max_new_tokens: int = 50,
+        temperature: float = 0.7,
+        timeout: int = 15,
+        batch_size: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """Run prompts through the model in padded batches.
+        
+        Prompts are left-padded so every sequence in a batch ends at the same
+        position, which causal LMs need to continue each one correctly. Each
+        prompt still gets its own result dict; ``time_taken`` is the wall time
+        of the batch it ran in, since that is the latency the prompt saw, and
+        ``response_time_ok`` allows ``timeout`` per prompt in the batch.
+        
+        Padded batches bypass the response cache: a sampled batch does not
+        reproduce what the same prompt generates on its own, which is what
+        the cache stores.
+        
+        Backends without a local pipeline batch on the server side, so their
+        prompts are sent one by one.
+        """
+        if self.pipeline is None:
+            return [self.test_completion(prompt, max_new_tokens, temperature, timeout)
+                    for prompt in prompts]
+        
+        tokenizer = self.pipeline.tokenizer
+        model = self.pipeline.model
+        
+        # The pipeline shares this tokenizer; change it only for the batch
+        original_pad_token = tokenizer.pad_token
+        original_padding_side = tokenizer.padding_side
+        # GPT-style tokenizers ship without a pad token
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
+        tokenizer.padding_side = "left"
+        
+        results = []
+        try:
+            for start in range(0, len(prompts), batch_size):
+                batch = prompts[start:start + batch_size]
+                print(f"\nTesting batch of {len(batch)} prompts: {batch}")
+            
+                start_time = time.time()
+                try:
+                    inputs = tokenizer(batch, return_tensors="pt", padding=True).to(model.device)
+                    with torch.no_grad():
+                        output_ids = model.generate(
+                            **inputs,
+                            max_new_tokens=max_new_tokens,
+                            temperature=temperature,
+                            pad_token_id=tokenizer.pad_token_id,
+                            do_sample=True,
+                        )
+                    end_time = time.time()
+                except Exception as e:
+                    elapsed = time.time() - start_time
+                    results.extend(self._error_result(prompt, elapsed, e) for prompt in batch)
+                    continue
+            
+                prompt_length = inputs["input_ids"].shape[1]
+                for prompt, ids in zip(batch, output_ids):
+                    # Decode the same way the pipeline does: full text minus decoded prompt
+                    prompt_text = tokenizer.decode(ids[:prompt_length], skip_special_tokens=True)
+                    full_text = tokenizer.decode(ids, skip_special_tokens=True)
+                    completion = full_text[len(prompt_text):]
+                    results.append(
+                        self._build_result(prompt, completion, prompt + completion,
+                                           end_time - start_time, timeout * len(batch))
+                    )
+        finally:
+            tokenizer.pad_token = original_pad_token
+            tokenizer.padding_side = original_padding_side
+        
+        return results
+    
+    def _build_result(
+        self,
+        prompt: str,
+        completion: str,
+        full_text: str,
+        elapsed: float,
+        timeout: int,
+        token_count: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Run the standard checks on a completion and build its result dict"""
+        # Split and lowercase the completion once for all checks
+        analysis = TextAnalysis(completion)
+        checks = {
+            "not_empty": len(analysis.stripped) > 0,
+            "no_error_in_response": "error" not in analysis.lower,
+            "response_time_ok": elapsed < timeout,
+            "reasonable_length": 5 < analysis.word_count < 100,
+            "no_repetition": not self._has_excessive_repetition(analysis),
+        }
+        
+        return {
+            "prompt": prompt,
+            "completion": analysis.stripped,
+            "full_text": full_text,
+            "time_taken": round(elapsed, 2),
+            "token_count": self.backend.count_tokens(completion) if token_count is None else token_count,
+            "checks": checks,
+            "all_passed": all(checks.values()),
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    def _error_result(self, prompt: str, elapsed: float, error: Exception) -> Dict[str, Any]:
+        """Build the result dict for a generation that raised"""
+        return {
+            "prompt": prompt,
+            "completion": "",
+            "full_text": "",
+            "time_taken": round(elapsed, 2),
+            "token_count": 0,
+            "checks": {"error_occurred": False},
+            "all_passed": False,
+            "error": str(error),
+            "timestamp": datetime.now().isoformat()
+        }
     
-    def _has_excessive_repetition(self, text: str, threshold: float = 0.5) -> bool:
-        """Check if text has excessive word repetition"""
-        words = text.lower().split()
+    def _has_excessive_repetition(self, text, threshold: float = 0.5) -> bool:
+        """Check if text (a string or TextAnalysis) has excessive word or phrase repetition"""
+        words = as_analysis(text).lower_words
         if len(words) < 10:
             return False
         
-        unique_words = set(words)
-        repetition_ratio = 1 - (len(unique_words) / len(words))
-        return repetition_ratio > threshold
+        # Unigram ratio is 1 - unique/total words; 4-grams catch looping phrases
+        ratios = repetition_stats(words, ngram_sizes=(1, 4))["repeated_ratios"]
+        return ratios[1] > threshold or ratios[4] > threshold
     
-    def test_consistency(self, prompt: str, num_runs: int = 3) -> Dict[str, Any]:
-        """Test if model gives consistent outputs for same prompt"""
+    def test_consistency(
+        self,
+        prompt: str,
+        num_runs: int = 3,
+        single_pass: bool = False,
+    ) -> Dict[str, Any]:
+        """Test if model gives consistent outputs for same prompt
+        
+        By default the prompt is re-run ``num_runs`` times and adjacent outputs
+        are compared. With ``single_pass`` all samples come from one generate
+        call (the prompt is encoded and prefilled once) and every pair of
+        samples is compared.
+        """
         print(f"\nTesting consistency for: '{prompt}'")
         
-        outputs = []
-        for i in range(num_runs):
-            result = self.test_completion(prompt, temperature=0.5)
-            outputs.append(result["completion"])
+        if single_pass:
+            outputs = self._sample_completions(prompt, num_runs, temperature=0.5)
+            pairs = list(combinations(range(len(outputs)), 2))
+        else:
+            outputs = []
+            for i in range(num_runs):
+                # Cached runs would all be identical and trivially consistent
+                result = self.test_completion(prompt, temperature=0.5, use_cache=False)
+                outputs.append(result["completion"])
+            pairs = [(i, i + 1) for i in range(len(outputs) - 1)]
         
         # Check similarity between outputs
+        similarities = [
+            self._jaccard_similarity(outputs[i], outputs[j])
+            for i, j in pairs
+        ]
         all_similar = all(
-            self._are_similar(outputs[i], outputs[i+1]) 
-            for i in range(len(outputs)-1)
+            self._are_similar(outputs[i], outputs[j])
+            for i, j in pairs
         )
         
         return {
             "prompt": prompt,
             "outputs": outputs,
             "consistent": all_similar,
-            "num_runs": num_runs
+            "num_runs": num_runs,
+            "pairs_compared": len(pairs),
+            "mean_similarity": round(sum(similarities) / len(similarities), 3) if similarities else 0.0,
+            "min_similarity": round(min(similarities), 3) if similarities else 0.0,
         }
     
-    def _are_similar(self, text1: str, text2: str, threshold: float = 0.3) -> bool:
-        """Simple similarity check based on common words"""
+    def _sample_completions(
+        self,
+        prompt: str,
+        num_samples: int,
+        max_new_tokens: int = 50,
+        temperature: float = 0.7,
+    ) -> List[str]:
+        """Draw several sampled completions from a single generate call"""
+        if self.pipeline is None:
+            # Remote backends get one request per sample
+            return [
+                self.backend.generate(prompt, max_new_tokens, temperature, do_sample=True)["text"].strip()
+                for _ in range(num_samples)
+            ]
+        
+        results = self.pipeline(
+            prompt,
+            max_new_tokens=max_new_tokens,
+            num_return_sequences=num_samples,
+            temperature=temperature,
+            pad_token_id=self.pipeline.tokenizer.eos_token_id,
+            do_sample=True,
+        )
+        return [result["generated_text"][len(prompt):].strip() for result in results]
+    
+    def _jaccard_similarity(self, text1: str, text2: str) -> float:
+        """Jaccard similarity of the lowercase word sets of two texts"""
         words1 = set(text1.lower().split())
         words2 = set(text2.lower().split())
         
         if not words1 or not words2:
-            return False
+            return 0.0
         
         intersection = words1.intersection(words2)
         union = words1.union(words2)
         
-        jaccard_similarity = len(intersection) / len(union)
-        return jaccard_similarity > threshold
+        return len(intersection) / len(union)
     
-    def run_test_suite(self, include_consistency: bool = False) -> Dict[str, Any]:
-        """Run comprehensive test suite"""
-        test_cases = [
-            {
-                "prompt": "Hello, my name is",
-                "expected_words": ["name", "I", "am"],
-                "category": "introduction"
-            },
-            {
-                "prompt": "The weather today is",
-                "expected_words": ["sunny", "cloudy", "rain", "weather", "day"],
-                "category": "description"
-            },
-            {
-                "prompt": "def fibonacci(n):",
-                "expected_words": ["return", "if", "def", "fibonacci"],
-                "category": "code"
-            },
-            {
-                "prompt": "The capital of France is",
-                "expected_words": ["Paris"],
-                "category": "factual"
-            },
-            {
-                "prompt": "Once upon a time",
-                "expected_words": ["there", "was", "lived", "story"],
-                "category": "narrative"
-            }
-        ]
+    def _are_similar(self, text1: str, text2: str, threshold: float = 0.3) -> bool:
+        """Simple similarity check based on common words"""
+        return self._jaccard_similarity(text1, text2) > threshold
+    
+    def run_test_suite(
+        self,
+        include_consistency: bool = False,
+        batch_size: Optional[int] = None,
+        single_pass_consistency: bool = False,
+        streaming: bool = False,
+        pipelined: bool = False,
+        max_pending: int = 4,
+        test_cases: Optional[Union[str, Iterable[Dict[str, Any]]]] = None,
+        shard: Optional[str] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ) -> Dict[str, Any]:
+        """Run comprehensive test suite
+        
+        ``test_cases`` is a test-case file (.jsonl, .yaml, .json; see
+        ``llm_test_suite.cases``) or an iterable of test-case dicts, consumed
+        lazily; the built-in cases are used when it is omitted. Cases may
+        carry their own ``generation`` params, ``evaluators`` and
+        ``expected_answers`` (scored by a "semantic" evaluator).
+        
+        With ``batch_size`` set, completion prompts are generated in padded
+        batches via ``test_completion_batch`` instead of one at a time,
+        bypassing the response cache; it cannot be combined with
+        ``streaming`` or ``pipelined``.
+        With ``streaming`` each prompt goes through ``test_completion_streaming``
+        so results carry time-to-first-token and tokens/second.
+        With ``pipelined`` a completion's expected-word check and configured
+        evaluators run on a worker thread while the next prompt generates
+        (the standard checks run with generation); at most ``max_pending``
+        completions wait to be evaluated.
+        ``single_pass_consistency`` is forwarded to ``test_consistency``.
+        With ``shard`` ("i/N") only the cases hashed into shard i of N are
+        run, and consistency tests only on shard 0; combine the shard
+        results with ``merge_shard_results``.
+        With ``on_result`` each completion result is handed to it as soon
+        as it is checked (e.g. ``ResultsManager(storage="jsonl")``'s
+        ``save_result``) instead of being collected: ``completion_tests``
+        is then empty and only the pass counts are kept, so suites of any
+        size run in constant memory.
+        """
+        if batch_size and (streaming or pipelined):
+            raise ValueError("batch_size cannot be combined with streaming or pipelined")
+        
+        if test_cases is None:
+            test_cases = DEFAULT_TEST_CASES
+        elif isinstance(test_cases, str):
+            test_cases = iter_test_cases(test_cases)
+        
+        shard_index = 0
+        if shard is not None:
+            shard_index, shard_count = parse_shard(shard)
+            test_cases = iter_shard(test_cases, shard_index, shard_count)
         
         results = []
         consistency_results = []
+        passed = total = 0
+        
+        def record(test_case, result):
+            nonlocal passed, total
+            self._print_completion(test_case, result)
+            passed += result["all_passed"]
+            total += 1
+            if on_result is not None:
+                on_result(result)
+            else:
+                results.append(result)
         
         print("\n" + "="*60)
         print("Running Comprehensive Test Suite")
         print("="*60)
         
         # Basic completion tests
-        for test_case in test_cases:
-            result = self.test_completion(test_case["prompt"])
-            
-            # Check for expected words
-            completion_lower = result["completion"].lower()
-            has_expected = any(
-                word in completion_lower 
-                for word in test_case["expected_words"]
+        generate = self.test_completion_streaming if streaming else self.test_completion
+        if pipelined:
+            runner = AsyncSuiteRunner(
+                lambda test_case: generate(test_case["prompt"], **self._generation_params(test_case)),
+                self._annotate_completion,
+                # Evaluators and their embedding caches are shared and not
+                # thread-safe, so evaluate one completion at a time
+                evaluation_concurrency=1,
+                max_pending=max_pending,
             )
-            
-            result["has_expected_words"] = has_expected
-            result["category"] = test_case["category"]
-            results.append(result)
-            
-            # Print summary
-            status = "✓ PASS" if result["all_passed"] else "✗ FAIL"
-            print(f"{status} | {test_case['category']:10} | Time: {result['time_taken']}s | Tokens: {result['token_count']}")
-            print(f"     Generated: {result['completion'][:60]}...")
+            runner.run(
+                test_cases,
+                on_result=lambda index, test_case, result: record(test_case, result),
+                keep_results=False,
+            )
+        else:
+            for test_case, result in self._generate_completions(test_cases, batch_size, generate):
+                record(test_case, self._annotate_completion(test_case, result))
         
         # Consistency tests
-        if include_consistency:
+        if include_consistency and shard_index == 0:
             print("\n" + "-"*60)
             print("Running Consistency Tests")
             print("-"*60)
             
             for prompt in ["Hello, my name is", "The weather today is"]:
-                consistency_result = self.test_consistency(prompt)
+                consistency_result = self.test_consistency(
+                    prompt, single_pass=single_pass_consistency
+                )
                 consistency_results.append(consistency_result)
                 
                 status = "✓ CONSISTENT" if consistency_result["consistent"] else "✗ INCONSISTENT"
                 print(f"{status} | {prompt}")
         
         # Summary
-        passed = sum(1 for r in results if r["all_passed"])
-        total = len(results)
+        summary = suite_summary(passed, total)
         
         print(f"\n{'='*60}")
-        print(f"Summary: {passed}/{total} tests passed")
+        print(f"Summary: {summary['passed']}/{summary['total_tests']} tests passed")
         if consistency_results:
             consistent = sum(1 for r in consistency_results if r["consistent"])
             print(f"Consistency: {consistent}/{len(consistency_results)} consistent")
         print(f"{'='*60}\n")
         
-        return {
+        suite_result = {
+            "model": self.model_name,
             "completion_tests": results,
             "consistency_tests": consistency_results,
-            "summary": {
-                "total_tests": total,
-                "passed": passed,
-                "failed": total - passed,
-                "pass_rate": f"{(passed/total)*100:.1f}%",
-                "timestamp": datetime.now().isoformat()
-            }
+            "summary": summary
         }
+        if shard is not None:
+            suite_result["shard"] = {"index": shard_index, "count": shard_count}
+        return suite_result
+    
+    def _generate_completions(self, test_cases: Iterable[Dict[str, Any]], batch_size: Optional[int],
+                              generate: Callable[..., Dict[str, Any]]):
+        """Yield (test_case, result) pairs, reading test cases only as needed"""
+        test_cases = iter(test_cases)
+        if not batch_size:
+            for test_case in test_cases:
+                yield test_case, generate(test_case["prompt"], **self._generation_params(test_case))
+            return
+        
+        while True:
+            chunk = list(islice(test_cases, batch_size))
+            if not chunk:
+                return
+            # Cases in one generate call must share their generation params
+            for params, group in groupby(chunk, key=lambda tc: sorted(self._generation_params(tc).items())):
+                group = list(group)
+                completions = self.test_completion_batch(
+                    [test_case["prompt"] for test_case in group],
+                    batch_size=batch_size,
+                    **dict(params),
+                )
+                yield from zip(group, completions)
+    
+    def _generation_params(self, test_case: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-case overrides for test_completion's generation arguments"""
+        generation = test_case.get("generation") or {}
+        return {key: generation[key] for key in GENERATION_PARAMS if key in generation}
+    
+    def _annotate_completion(self, test_case: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the test case's expected-word check, evaluators and category to a result
+        
+        Each configured evaluator's ``passed`` becomes one of the result's
+        ``checks``, so it counts towards ``all_passed``.
+        """
+        # Check for expected words
+        completion_lower = result["completion"].lower()
+        has_expected = any(
+            word in completion_lower 
+            for word in test_case.get("expected_words", [])
+        )
+        
+        result["has_expected_words"] = has_expected
+        result["category"] = test_case.get("category", "general")
+        if "name" in test_case:
+            result["test_name"] = test_case["name"]
+        if "case_index" in test_case:
+            # Position in the full suite, for merging shard results
+            result["case_index"] = test_case["case_index"]
+        if test_case.get("evaluators"):
+            result["evaluations"] = self._run_evaluators(test_case, result["completion"])
+            # A configured evaluator is a check like any other; one that
+            # raised reports passed=False and fails the case
+            for evaluator_name, evaluation in result["evaluations"].items():
+                result["checks"][evaluator_name] = bool(evaluation.get("passed", False))
+            result["all_passed"] = all(result["checks"].values())
+        return result
+    
+    def _run_evaluators(self, test_case: Dict[str, Any], completion: str) -> Dict[str, Any]:
+        """Run the evaluators configured on a test case against its completion"""
+        # Evaluators are built once per distinct config and reused across cases
+        config_key = json.dumps(test_case["evaluators"], sort_keys=True)
+        if config_key not in self._evaluators:
+            self._evaluators[config_key] = EvaluationPipeline(build_evaluators(test_case["evaluators"]))
+        
+        # Reference-based scoring uses the case's expected answers
+        return self._evaluators[config_key].evaluate(completion, test_case.get("expected_answers"))
+    
+    def _print_completion(self, test_case: Dict[str, Any], result: Dict[str, Any]):
+        """Print the one-line summary of a completion test"""
+        status = "✓ PASS" if result["all_passed"] else "✗ FAIL"
+        print(f"{status} | {result['category']:10} | Time: {result['time_taken']}s | Tokens: {result['token_count']}")
+        if result.get("time_to_first_token") is not None:
+            print(f"     TTFT: {result['time_to_first_token']:.3f}s | {result['tokens_per_second'] or 0:.1f} tok/s")
+        print(f"     Generated: {result['completion'][:60]}...")
     
     def save_results(self, results: Dict[str, Any], filename: str = None):
         """Save test results to JSON file"""
@@ -250,20 +597,105 @@ class LLMTester:
         print(f"Results saved to: {filename}")
 
 
-def main():
-    """Main function with enhanced features"""
-    print("Welcome to LLMTest Enhanced! 🧪")
-    print("=" * 60)
+def main(argv: Optional[List[str]] = None):
+    """Main function with enhanced features
     
-    # Create tester
-    tester = LLMTester("gpt2")
+    Without arguments, runs the built-in suite on gpt2 and saves the results
+    to ``--results-dir`` (``results/``). To spread a large suite over several workers
+    or machines, run each with the same ``--run-id`` and its own
+    ``--shard i/N``, then combine them once all have finished::
     
-    # Run comprehensive tests
-    results = tester.run_test_suite(include_consistency=True)
+        python llmtest.py --cases corpus.jsonl --run-id nightly --shard 0/4
+        ...
+        python llmtest.py --cases corpus.jsonl --run-id nightly --shard 3/4
+        python llmtest.py --run-id nightly --merge
     
-    # Save results
-    tester.save_results(results)
+    Shard results go to ``<results-dir>/shards/<run-id>/``; the merged
+    result is saved to ``<results-dir>`` like a single-process run.
+    With ``--stream`` each completion result is appended to a JSON Lines
+    run file as soon as it is checked instead of being held until the end,
+    which large suites need to run in constant memory.
+    """
+    parser = argparse.ArgumentParser(description="Run the LLMTest suite")
+    parser.add_argument("--model", default="gpt2", help="Hugging Face model name")
+    parser.add_argument("--cases", help="Test-case file (.jsonl, .yaml or .json)")
+    parser.add_argument("--shard", help="Run only shard i of N, e.g. 0/4")
+    parser.add_argument("--run-id", help="Groups the shards of one run (needed with --shard and --merge)")
+    parser.add_argument("--merge", action="store_true", help="Merge the finished shards of --run-id")
+    parser.add_argument("--results-dir", default="results", help="Where results (and shard results) are saved")
+    parser.add_argument("--cache-dir", help="Reuse generations cached by earlier runs")
+    parser.add_argument("--stream", action="store_true",
+                        help="Write each result to a JSON Lines run file as it completes")
+    args = parser.parse_args(argv)
     
+    if (args.shard or args.merge) and not args.run_id:
+        parser.error("--shard and --merge need a --run-id")
+    if args.shard and args.merge:
+        parser.error("--shard and --merge are separate steps")
+    if args.shard:
+        try:
+            parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    print("Welcome to LLMTest Enhanced! 🧪")
+    print("=" * 60)
+    
+    shard_dir = os.path.join(args.results_dir, "shards", args.run_id or "")
+    if args.merge:
+        shard_results = [
+            record for record in ResultsManager(shard_dir).iter_results()
+            if "shard" in record
+        ]
+        results = merge_shard_results(shard_results)
+        print(f"Merged {len(shard_results)} shard results: "
+              f"{results['summary']['passed']}/{results['summary']['total_tests']} tests passed")
+        ResultsManager(args.results_dir, run_id=args.run_id).save_result("llm_test_suite", results)
+    else:
+        # Create tester
+        tester = LLMTester(args.model, cache_dir=args.cache_dir)
+        
+        output_dir, run_id = args.results_dir, args.run_id
+        if args.shard:
+            index, count = parse_shard(args.shard)
+            output_dir, run_id = shard_dir, f"{args.run_id}_shard{index}of{count}"
+            # A re-run shard replaces its earlier streamed attempt instead of appending to it
+            previous_run_file = os.path.join(output_dir, f"run_{run_id}.jsonl")
+            if args.stream and os.path.exists(previous_run_file):
+                os.remove(previous_run_file)
+        sink = ResultsManager(output_dir, storage="jsonl", run_id=run_id) if args.stream else None
+        
+        try:
+            # Run comprehensive tests
+            results = tester.run_test_suite(
+                include_consistency=True,
+                test_cases=args.cases,
+                shard=args.shard,
+                on_result=(
+                    (lambda result: sink.save_result(result.get("test_name", "completion_test"), result))
+                    if sink is not None else None
+                ),
+            )
+            
+            # Save results
+            if args.shard:
+                results["run_id"] = args.run_id
+                (sink or ResultsManager(shard_dir, run_id=args.run_id)).save_result(
+                    f"llm_test_suite_shard{index}of{count}", results
+                )
+            else:
+                (sink or ResultsManager(args.results_dir, run_id=args.run_id)).save_result(
+                    "llm_test_suite", results
+                )
+        finally:
+            if sink is not None:
+                sink.close()
+    
+    _print_analysis(results)
+
+
+def _print_analysis(results: Dict[str, Any]):
+    """Print pass rates by category and the failed tests of a suite result"""
     # Show detailed analysis
     print("\nDetailed Analysis:")
     print("-" * 60)
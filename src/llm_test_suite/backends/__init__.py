@@ -0,0 +1 @@
+"""Generation backend modules."""
@@ -0,0 +1,78 @@
+# src/llm_test_suite/backends/base.py
+"""Interface shared by everything that turns a prompt into generated text."""
+
+from abc import ABC, abstractmethod
+
+
+class BackendError(RuntimeError):
+    """A generation request failed and was not (or no longer) retryable."""
+
+
+class GenerationBackend(ABC):
+    """
+    Base class for generation backends.
+
+    Subclasses must implement ``generate`` and ``generate_stream``; a
+    backend missing either fails when it is created.
+
+    ``generate`` and ``generate_stream`` return a dictionary with:
+
+    - text: generated text only (prompt excluded)
+    - full_text: prompt followed by the generated text
+    - generation_time: wall time of the request in seconds
+    - token_count: generated tokens
+
+    ``generate_stream`` adds time_to_first_token, inter_token_latency,
+    token_latencies and tokens_per_second.
+    """
+
+    model_name = None
+
+    @abstractmethod
+    def generate(self, prompt, max_new_tokens=50, temperature=0.7, do_sample=None, seed=None):
+        """
+        Generate a completion.
+
+        Args:
+            prompt: Input prompt
+            max_new_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            do_sample: Sample (True) or decode greedily (False); None keeps
+                the backend's default
+            seed: Seed for reproducible sampling (None: don't reseed)
+        """
+
+    @abstractmethod
+    def generate_stream(self, prompt, max_new_tokens=50, temperature=0.7, do_sample=None,
+                        seed=None, timeout=None, on_token=None):
+        """
+        Generate a completion token by token, recording latency metrics.
+
+        Args:
+            timeout: Seconds to wait for each chunk (None waits forever)
+            on_token: Called with each text chunk as it arrives
+
+        Other arguments are as for generate().
+        """
+
+    @property
+    def revision(self):
+        """Model revision for cache keys (None when unknown)."""
+        return None
+
+    def count_tokens(self, text):
+        """Token count of text; whitespace words unless the backend has a tokenizer."""
+        return len(text.split())
+
+    def size_bytes(self):
+        """Local memory held by the model (0 for remote backends)."""
+        return 0
+
+    def close(self):
+        """Release connections or other resources."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,91 @@
+# src/llm_test_suite/backends/local.py
+"""In-process generation with a Hugging Face transformers pipeline."""
+
+import time
+
+from transformers import pipeline, set_seed
+
+from .base import GenerationBackend
+from ..utils.streaming import StreamingGeneration
+
+
+class PipelineBackend(GenerationBackend):
+    """Generates with a local text-generation pipeline."""
+
+    def __init__(self, model_name="gpt2", device="cpu", text_pipeline=None):
+        """
+        Load the model (or wrap an already loaded pipeline).
+
+        Args:
+            model_name: Hugging Face model name
+            device: "cpu" or "cuda"
+            text_pipeline: Existing text-generation pipeline to use instead
+                of loading model_name
+        """
+        self.model_name = model_name
+        self.pipeline = text_pipeline or pipeline(
+            "text-generation",
+            model=model_name,
+            device=0 if device == "cuda" else -1  # -1 for CPU
+        )
+
+    def _generation_kwargs(self, max_new_tokens, temperature, do_sample, seed):
+        if seed is not None:
+            set_seed(seed)
+        kwargs = {
+            'max_new_tokens': max_new_tokens,
+            'temperature': temperature,
+            'pad_token_id': self.pipeline.tokenizer.eos_token_id
+        }
+        if do_sample is not None:
+            kwargs['do_sample'] = do_sample
+        return kwargs
+
+    def generate(self, prompt, max_new_tokens=50, temperature=0.7, do_sample=None, seed=None):
+        kwargs = self._generation_kwargs(max_new_tokens, temperature, do_sample, seed)
+
+        start_time = time.time()
+        output = self.pipeline(prompt, num_return_sequences=1, **kwargs)[0]
+        generation_time = time.time() - start_time
+
+        full_text = output['generated_text']
+        text = full_text[len(prompt):]
+        return {
+            'text': text,
+            'full_text': full_text,
+            'generation_time': generation_time,
+            'token_count': self.count_tokens(text)
+        }
+
+    def generate_stream(self, prompt, max_new_tokens=50, temperature=0.7, do_sample=None,
+                        seed=None, timeout=None, on_token=None):
+        kwargs = self._generation_kwargs(max_new_tokens, temperature, do_sample, seed)
+
+        stream = StreamingGeneration(self.pipeline, prompt, timeout=timeout, **kwargs)
+        for chunk in stream:
+            if on_token is not None:
+                on_token(chunk)
+
+        metrics = stream.metrics()
+        return {
+            'text': stream.text,
+            'full_text': prompt + stream.text,
+            'generation_time': metrics['total_time'],
+            'token_count': self.count_tokens(stream.text),
+            'time_to_first_token': metrics['time_to_first_token'],
+            'inter_token_latency': metrics['inter_token_latency'],
+            'token_latencies': metrics['token_latencies'],
+            'tokens_per_second': metrics['tokens_per_second']
+        }
+
+    @property
+    def revision(self):
+        return getattr(self.pipeline.model.config, '_commit_hash', None)
+
+    def count_tokens(self, text):
+        return len(self.pipeline.tokenizer.encode(text))
+
+    def size_bytes(self):
+        module = self.pipeline.model
+        tensors = list(module.parameters()) + list(module.buffers())
+        return sum(t.numel() * t.element_size() for t in tensors)
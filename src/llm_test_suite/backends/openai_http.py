@@ -0,0 +1,268 @@
+# src/llm_test_suite/backends/openai_http.py
+"""Client for OpenAI-compatible inference servers (vLLM, TGI, llama.cpp, ...)."""
+
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+import json
+import queue
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .base import BackendError, GenerationBackend
+from ..utils.stats import token_timing_metrics
+
+# Statuses worth retrying: overload, rate limits and transient gateway errors
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+class OpenAICompatibleBackend(GenerationBackend):
+    """
+    Generates through the /completions (or /chat/completions) endpoint.
+
+    Connections are HTTP/1.1 keep-alive and pooled, and the backend is
+    thread-safe: up to max_connections requests are in flight at once, the
+    rest wait for a free connection. Connection errors and retryable
+    statuses are retried with exponential backoff (honouring Retry-After).
+    """
+
+    def __init__(self, base_url, model_name, api_key=None, chat=False, max_connections=8,
+                 timeout=60.0, max_retries=3, backoff=0.5, extra_body=None):
+        """
+        Initialize the client. No connection is opened until the first request.
+
+        Args:
+            base_url: API root, e.g. "http://localhost:8000/v1"
+            model_name: Model name the server knows the model by
+            api_key: Sent as a Bearer token when given
+            chat: Use /chat/completions with the prompt as a user message
+            max_connections: Pooled connections, i.e. maximum in-flight requests
+            timeout: Socket timeout in seconds
+            max_retries: Retries per request after the first attempt
+            backoff: First retry delay in seconds, doubled on every retry
+            extra_body: Additional fields sent with every request
+        """
+        parts = urlsplit(base_url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {base_url!r}")
+
+        self.base_url = base_url
+        self.model_name = model_name
+        self.chat = chat
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.extra_body = dict(extra_body or {})
+        self.max_connections = max_connections
+        self.requests = 0
+        self.retries = 0
+
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parts.hostname
+        self._port = parts.port
+        self._path = parts.path.rstrip("/") + ("/chat/completions" if chat else "/completions")
+        self._headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+
+        # Most recently used first: it is the least likely to have timed out
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    def generate(self, prompt, max_new_tokens=50, temperature=0.7, do_sample=None, seed=None):
+        body = self._body(prompt, max_new_tokens, temperature, do_sample, seed, stream=False)
+
+        start_time = time.perf_counter()
+        connection, response = self._open(body)
+        try:
+            data = json.loads(response.read())
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            self._release(connection, reusable=False)
+            raise BackendError(f"Bad response from {self.base_url}: {e}") from e
+        self._release(connection, reusable=not response.will_close)
+        generation_time = time.perf_counter() - start_time
+
+        text = self._choice_text(data["choices"][0]) if data.get("choices") else ""
+        token_count = (data.get("usage") or {}).get("completion_tokens")
+        return {
+            'text': text,
+            'full_text': prompt + text,
+            'generation_time': generation_time,
+            'token_count': token_count if token_count is not None else self.count_tokens(text)
+        }
+
+    def generate_stream(self, prompt, max_new_tokens=50, temperature=0.7, do_sample=None,
+                        seed=None, timeout=None, on_token=None):
+        body = self._body(prompt, max_new_tokens, temperature, do_sample, seed, stream=True)
+
+        start_time = time.perf_counter()
+        connection, response = self._open(body)
+        if timeout is not None and connection.sock is not None:
+            connection.sock.settimeout(timeout)
+
+        chunks = []
+        token_times = []
+        usage = None
+        reusable = False
+        try:
+            for event in self._iter_events(response):
+                usage = event.get("usage") or usage
+                for choice in event.get("choices") or []:
+                    piece = self._choice_text(choice)
+                    if not piece:
+                        continue
+                    token_times.append(time.perf_counter())
+                    chunks.append(piece)
+                    if on_token is not None:
+                        on_token(piece)
+            # Drain the end of the chunked body so the connection can be reused
+            response.read()
+            reusable = not response.will_close
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            raise BackendError(f"Stream from {self.base_url} broke off: {e}") from e
+        finally:
+            self._release(connection, reusable)
+
+        text = "".join(chunks)
+        metrics = token_timing_metrics(start_time, time.perf_counter(), token_times)
+        # Servers send about one token per event; prefer the reported usage
+        token_count = (usage or {}).get("completion_tokens") or len(token_times)
+        return {
+            'text': text,
+            'full_text': prompt + text,
+            'generation_time': metrics['total_time'],
+            'token_count': token_count,
+            'time_to_first_token': metrics['time_to_first_token'],
+            'inter_token_latency': metrics['inter_token_latency'],
+            'token_latencies': metrics['token_latencies'],
+            'tokens_per_second': metrics['tokens_per_second']
+        }
+
+    def generate_many(self, prompts, **kwargs):
+        """
+        Generate for many prompts with up to max_connections requests in flight.
+
+        Args:
+            prompts: Input prompts
+            **kwargs: Passed to generate()
+
+        Returns:
+            Results in prompt order
+        """
+        with ThreadPoolExecutor(self.max_connections) as executor:
+            return list(executor.map(lambda prompt: self.generate(prompt, **kwargs), prompts))
+
+    def close(self):
+        """Close all idle pooled connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _body(self, prompt, max_new_tokens, temperature, do_sample, seed, stream):
+        body = {
+            "model": self.model_name,
+            "max_tokens": max_new_tokens,
+            # The API has no do_sample switch; temperature 0 is greedy
+            "temperature": 0.0 if do_sample is False else temperature,
+            "stream": stream,
+        }
+        if self.chat:
+            body["messages"] = [{"role": "user", "content": prompt}]
+        else:
+            body["prompt"] = prompt
+        if seed is not None:
+            body["seed"] = seed
+        body.update(self.extra_body)
+        return body
+
+    def _choice_text(self, choice):
+        """Text of a choice from a full response or a stream event."""
+        if self.chat:
+            message = choice.get("delta") or choice.get("message") or {}
+            return message.get("content") or ""
+        return choice.get("text") or ""
+
+    def _iter_events(self, response):
+        """Parse server-sent events until the [DONE] marker or end of stream."""
+        while True:
+            line = response.readline()
+            if not line:
+                return
+            line = line.strip()
+            # Blank separators, comments and event names carry no data
+            if not line.startswith(b"data:"):
+                continue
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                return
+            yield json.loads(data)
+
+    def _open(self, body):
+        """
+        Send a request, retrying failures.
+
+        Returns:
+            (connection, response) for a 200 response whose body is unread;
+            the caller must hand the connection back through _release
+        """
+        payload = json.dumps(body).encode("utf-8")
+        attempt = 0
+        while True:
+            connection, reused = self._acquire()
+            try:
+                connection.request("POST", self._path, body=payload, headers=self._headers)
+                response = connection.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                self._release(connection, reusable=False)
+                if reused:
+                    # The server closed an idle keep-alive connection; not a real failure
+                    continue
+                error = f"{type(e).__name__}: {e}"
+                delay = self.backoff * 2 ** attempt
+            else:
+                self.requests += 1
+                if response.status == 200:
+                    return connection, response
+
+                detail = response.read().decode("utf-8", "replace")[:500]
+                self._release(connection, reusable=not response.will_close)
+                error = f"HTTP {response.status}: {detail}"
+                if response.status not in RETRY_STATUSES:
+                    raise BackendError(error)
+                delay = _retry_after(response) or self.backoff * 2 ** attempt
+
+            if attempt >= self.max_retries:
+                raise BackendError(f"Request to {self.base_url} failed after "
+                                   f"{attempt + 1} attempts: {error}")
+            attempt += 1
+            self.retries += 1
+            time.sleep(delay)
+
+    def _acquire(self):
+        """Wait for a free slot; returns (connection, whether it was pooled)."""
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._connection_class(self._host, self._port, timeout=self.timeout), False
+
+    def _release(self, connection, reusable):
+        if reusable:
+            if connection.sock is not None:
+                connection.sock.settimeout(self.timeout)
+            self._idle.put(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+
+def _retry_after(response):
+    """Delay requested by a Retry-After header in seconds (dates are ignored)."""
+    try:
+        return float(response.getheader("Retry-After"))
+    except (TypeError, ValueError):
+        return None
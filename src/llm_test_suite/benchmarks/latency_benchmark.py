@@ -0,0 +1,189 @@
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+import json
+import time
+from transformers import pipeline
+
+from ..utils.stats import summarize_latencies
+
+
+class LatencyBenchmark:
+    """Measure generation latency distributions for one or more models."""
+
+    def __init__(self, model_names: List[str], warmup_iterations: int = 3,
+                 measured_runs: int = 10, max_new_tokens: int = 20):
+        """
+        Initialize the benchmark.
+
+        Args:
+            model_names: List of Hugging Face model names
+            warmup_iterations: Untimed generations per model before measuring
+            measured_runs: Timed generations per prompt
+            max_new_tokens: Maximum tokens to generate per run
+        """
+        if measured_runs < 1:
+            raise ValueError("measured_runs must be at least 1")
+        if warmup_iterations < 0:
+            raise ValueError("warmup_iterations cannot be negative")
+
+        self.model_names = model_names
+        self.warmup_iterations = warmup_iterations
+        self.measured_runs = measured_runs
+        self.max_new_tokens = max_new_tokens
+
+    def run(self, prompts: List[str]) -> Dict[str, Any]:
+        """
+        Benchmark every model on every prompt.
+
+        Models are loaded one at a time and released before the next, so the
+        load time of each is measured on its own.
+
+        Args:
+            prompts: Prompts to measure
+
+        Returns:
+            Report with per-prompt and overall latency statistics per model
+        """
+        if not prompts:
+            raise ValueError("LatencyBenchmark needs at least one prompt")
+
+        report = {
+            'benchmark': 'latency',
+            'created': datetime.now().isoformat(),
+            'config': {
+                'warmup_iterations': self.warmup_iterations,
+                'measured_runs': self.measured_runs,
+                'max_new_tokens': self.max_new_tokens,
+                'prompts': prompts
+            },
+            'models': {}
+        }
+
+        print(f"⏱️  Benchmarking {len(self.model_names)} models on {len(prompts)} prompts")
+
+        for model_name in self.model_names:
+            report['models'][model_name] = self._benchmark_model(model_name, prompts)
+
+        return report
+
+    def _benchmark_model(self, model_name: str, prompts: List[str]) -> Dict[str, Any]:
+        """Load, warm up and measure a single model."""
+        print(f"  Loading {model_name}...", end="", flush=True)
+        start_time = time.perf_counter()
+        try:
+            model = pipeline("text-generation", model=model_name, device=-1)
+        except Exception as e:
+            print(f" ✗ Failed: {str(e)}")
+            return {'error': str(e)}
+        load_time = time.perf_counter() - start_time
+        print(f" ✓ ({load_time:.1f}s)")
+
+        for _ in range(self.warmup_iterations):
+            self._generate(model, prompts[0])
+
+        all_latencies = []
+        all_tokens = 0
+        prompt_stats = {}
+        for prompt in prompts:
+            latencies = []
+            tokens = 0
+            for _ in range(self.measured_runs):
+                latency, token_count = self._generate(model, prompt)
+                latencies.append(latency)
+                tokens += token_count
+
+            stats = summarize_latencies(latencies)
+            stats['tokens_per_second'] = tokens / sum(latencies) if sum(latencies) > 0 else None
+            prompt_stats[prompt] = stats
+
+            all_latencies.extend(latencies)
+            all_tokens += tokens
+            print(f"    p50 {stats['p50']:.3f}s | p99 {stats['p99']:.3f}s | {prompt[:40]}")
+
+        overall = summarize_latencies(all_latencies)
+        overall['tokens_per_second'] = all_tokens / sum(all_latencies) if sum(all_latencies) > 0 else None
+
+        return {
+            'load_time': load_time,
+            'overall': overall,
+            'prompts': prompt_stats
+        }
+
+    def _generate(self, model, prompt: str):
+        """Run one greedy generation and return (latency, generated token count)."""
+        start_time = time.perf_counter()
+        output = model(
+            prompt,
+            max_new_tokens=self.max_new_tokens,
+            do_sample=False,
+            pad_token_id=model.tokenizer.eos_token_id
+        )
+        latency = time.perf_counter() - start_time
+
+        generated_only = output[0]['generated_text'][len(prompt):]
+        return latency, len(model.tokenizer.encode(generated_only))
+
+
+def save_report(report: Dict[str, Any], filepath: str) -> str:
+    """
+    Save a benchmark report as JSON with stable key order.
+
+    Sorted keys keep files from different runs line-diffable. The report's
+    'created' timestamp is left out of the file (the file's modification
+    time records it), so reports of identical runs are identical files.
+
+    Args:
+        report: Report returned by ``LatencyBenchmark.run``
+        filepath: Where to write it
+    """
+    payload = {key: value for key, value in report.items() if key != 'created'}
+    with open(filepath, 'w') as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+    print(f"✅ Benchmark report saved to: {filepath}")
+    return filepath
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 0.1,
+                    metrics: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Find latency regressions between two benchmark reports.
+
+    Only the per-model overall statistics are compared; run metadata such
+    as 'created' is ignored.
+
+    Args:
+        baseline: Earlier report
+        current: Newer report
+        threshold: Relative slowdown that counts as a regression (0.1 = 10%)
+        metrics: Overall statistics to compare (default p50, p90, p99)
+
+    Returns:
+        One entry per model and metric that got slower than the threshold
+    """
+    metrics = metrics or ['p50', 'p90', 'p99']
+    regressions = []
+
+    for model_name, current_model in current.get('models', {}).items():
+        baseline_model = baseline.get('models', {}).get(model_name)
+        if not baseline_model or 'overall' not in baseline_model or 'overall' not in current_model:
+            continue
+
+        for metric in metrics:
+            before = baseline_model['overall'].get(metric)
+            after = current_model['overall'].get(metric)
+            if not before or after is None:
+                continue
+
+            change = (after - before) / before
+            if change > threshold:
+                regressions.append({
+                    'model': model_name,
+                    'metric': metric,
+                    'baseline': before,
+                    'current': after,
+                    'change': change
+                })
+
+    return regressions
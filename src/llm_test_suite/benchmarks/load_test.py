@@ -0,0 +1,260 @@
+from typing import List, Dict, Any, Optional, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import itertools
+import random
+import threading
+import time
+
+from ..backends.base import GenerationBackend
+from ..utils.stats import summarize_latencies
+
+
+class LoadGenerator:
+    """
+    Drive a generation backend under load and measure how latency holds up.
+
+    Closed loop: a fixed number of clients each send their next request as
+    soon as the previous one returns. Open loop: requests arrive at a target
+    rate regardless of how fast they complete, and latency is measured from
+    the scheduled arrival, so queueing delay is included.
+    """
+
+    def __init__(self, backend: GenerationBackend, test_cases: List[Dict[str, Any]],
+                 max_new_tokens: int = 50, streaming: bool = False,
+                 warmup_requests: int = 2):
+        """
+        Initialize the load generator.
+
+        Args:
+            backend: Backend to load (thread-safe, e.g. OpenAICompatibleBackend)
+            test_cases: Request mix; each case needs a 'prompt' and may set
+                'max_tokens'. Cases are sent in rotation.
+            max_new_tokens: Tokens per request for cases without 'max_tokens'
+            streaming: Stream responses to also measure time-to-first-token
+            warmup_requests: Untimed requests sent before each sweep
+        """
+        if not test_cases:
+            raise ValueError("LoadGenerator needs at least one test case")
+
+        self.backend = backend
+        self.test_cases = test_cases
+        self.max_new_tokens = max_new_tokens
+        self.streaming = streaming
+        self.warmup_requests = warmup_requests
+
+    def sweep(self, levels: Sequence[float], mode: str = "closed",
+              duration: float = 30.0, max_in_flight: int = 256,
+              poisson: bool = True) -> Dict[str, Any]:
+        """
+        Run one load level after another.
+
+        Args:
+            levels: Concurrency levels (closed loop) or request rates in
+                requests/second (open loop)
+            mode: "closed" or "open"
+            duration: Seconds to run each level
+            max_in_flight: Open loop only: cap on outstanding requests
+            poisson: Open loop only: exponential inter-arrival times instead
+                of a fixed interval
+
+        Returns:
+            Report with one entry per level and the first saturated level
+        """
+        if mode not in ("closed", "open"):
+            raise ValueError(f"Unknown load mode: {mode!r}")
+
+        report = {
+            'benchmark': 'load',
+            'created': datetime.now().isoformat(),
+            'config': {
+                'model': self.backend.model_name,
+                'mode': mode,
+                'levels': list(levels),
+                'duration': duration,
+                'streaming': self.streaming,
+                'test_cases': len(self.test_cases)
+            },
+            'levels': []
+        }
+
+        print(f"📈 {mode}-loop load sweep of {self.backend.model_name}: {list(levels)}")
+        self._warmup()
+
+        for level in levels:
+            if mode == "closed":
+                result = self.run_closed_loop(int(level), duration)
+            else:
+                result = self.run_open_loop(level, duration, max_in_flight, poisson)
+            report['levels'].append(result)
+
+            latency = result['latency']
+            print(f"  {mode} {level:>7}: {result['throughput']:.2f} req/s | "
+                  f"p50 {latency.get('p50') or 0:.3f}s | p99 {latency.get('p99') or 0:.3f}s | "
+                  f"errors {result['error_rate']:.1%}")
+
+        report['saturation_level'] = find_saturation(report['levels'])
+        return report
+
+    def run_closed_loop(self, concurrency: int, duration: float = 30.0) -> Dict[str, Any]:
+        """
+        Run `concurrency` clients back to back for `duration` seconds.
+
+        Returns:
+            Level result (see _summarize)
+        """
+        requests = self._request_stream()
+        samples = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + duration
+
+        def client():
+            while time.perf_counter() < deadline:
+                with lock:
+                    test_case = next(requests)
+                sample = self._send(test_case, time.perf_counter())
+                with lock:
+                    samples.append(sample)
+
+        start_time = time.perf_counter()
+        threads = [threading.Thread(target=client, daemon=True) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start_time
+
+        result = self._summarize(samples, elapsed)
+        result.update({'mode': 'closed', 'concurrency': concurrency})
+        return result
+
+    def run_open_loop(self, rate: float, duration: float = 30.0, max_in_flight: int = 256,
+                      poisson: bool = True, seed: int = 0) -> Dict[str, Any]:
+        """
+        Send requests at `rate` per second for `duration` seconds.
+
+        Requests that would exceed max_in_flight wait for a free slot; their
+        wait counts towards their latency.
+
+        Returns:
+            Level result (see _summarize) plus the achieved request rate
+        """
+        if rate <= 0:
+            raise ValueError("Request rate must be positive")
+
+        requests = self._request_stream()
+        arrivals = random.Random(seed)
+        futures = []
+
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            scheduled = start_time
+            while scheduled < start_time + duration:
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(self._send, next(requests), scheduled))
+                scheduled += arrivals.expovariate(rate) if poisson else 1.0 / rate
+            issued_time = time.perf_counter() - start_time
+            samples = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start_time
+
+        result = self._summarize(samples, elapsed)
+        result.update({
+            'mode': 'open',
+            'target_rate': rate,
+            'achieved_rate': len(futures) / issued_time if issued_time > 0 else None
+        })
+        return result
+
+    def _request_stream(self):
+        """Endless rotation through the test cases."""
+        return itertools.cycle(self.test_cases)
+
+    def _warmup(self):
+        for test_case in itertools.islice(self._request_stream(), self.warmup_requests):
+            self._send(test_case, time.perf_counter())
+
+    def _send(self, test_case: Dict[str, Any], arrival_time: float) -> Dict[str, Any]:
+        """Send one request; latency is measured from its arrival time."""
+        generate = self.backend.generate_stream if self.streaming else self.backend.generate
+        try:
+            generation = generate(
+                test_case['prompt'],
+                max_new_tokens=test_case.get('max_tokens', self.max_new_tokens)
+            )
+        except Exception as e:
+            return {'latency': time.perf_counter() - arrival_time, 'error': str(e)}
+
+        return {
+            'latency': time.perf_counter() - arrival_time,
+            'token_count': generation['token_count'],
+            'time_to_first_token': generation.get('time_to_first_token'),
+            'error': None
+        }
+
+    def _summarize(self, samples: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+        """
+        Aggregate the samples of one level.
+
+        Returns:
+            Dictionary with requests, errors, error_rate, duration,
+            throughput (successful requests/second), tokens_per_second,
+            latency statistics and (streaming) time-to-first-token statistics
+        """
+        succeeded = [sample for sample in samples if sample['error'] is None]
+        errors = len(samples) - len(succeeded)
+        tokens = sum(sample['token_count'] or 0 for sample in succeeded)
+
+        result = {
+            'requests': len(samples),
+            'errors': errors,
+            'error_rate': errors / len(samples) if samples else 0.0,
+            'duration': elapsed,
+            'throughput': len(succeeded) / elapsed if elapsed > 0 else 0.0,
+            'tokens_per_second': tokens / elapsed if elapsed > 0 else 0.0,
+            'latency': summarize_latencies([sample['latency'] for sample in succeeded])
+        }
+
+        first_token_times = [sample['time_to_first_token'] for sample in succeeded
+                             if sample['time_to_first_token'] is not None]
+        if first_token_times:
+            result['time_to_first_token'] = summarize_latencies(first_token_times)
+
+        # A few error messages help tell overload from misconfiguration
+        messages = sorted({sample['error'] for sample in samples if sample['error']})
+        if messages:
+            result['error_samples'] = messages[:5]
+        return result
+
+
+def find_saturation(levels: List[Dict[str, Any]], latency_factor: float = 2.0,
+                    min_throughput_gain: float = 0.05,
+                    max_error_rate: float = 0.01) -> Optional[int]:
+    """
+    Index of the first level past which more load stops paying off.
+
+    A level is saturated when its p99 latency is latency_factor times the
+    first level's, its throughput gains less than min_throughput_gain over
+    the previous level, or its error rate exceeds max_error_rate.
+
+    Args:
+        levels: Level results from a sweep, in increasing load order
+
+    Returns:
+        Index into levels, or None if no level is saturated
+    """
+    baseline_p99 = None
+    previous_throughput = None
+    for index, level in enumerate(levels):
+        p99 = level['latency'].get('p99')
+        if level['error_rate'] > max_error_rate:
+            return index
+        if baseline_p99 is None:
+            baseline_p99 = p99
+        elif p99 is not None and baseline_p99 and p99 > baseline_p99 * latency_factor:
+            return index
+        if previous_throughput and level['throughput'] < previous_throughput * (1 + min_throughput_gain):
+            return index
+        previous_throughput = level['throughput']
+    return None
@@ -0,0 +1,151 @@
+# src/llm_test_suite/cases.py
+"""Test cases: the built-in set and a streaming loader for test-case files."""
+
+import json
+
+try:
+    import yaml
+except ImportError:  # Only needed for .yaml test-case files
+    yaml = None
+
+from .utils.jsonl_store import iter_jsonl
+
+DEFAULT_TEST_CASES = [
+    {
+        "prompt": "Hello, my name is",
+        "expected_words": ["name", "I", "am"],
+        "category": "introduction"
+    },
+    {
+        "prompt": "The weather today is",
+        "expected_words": ["sunny", "cloudy", "rain", "weather", "day"],
+        "category": "description"
+    },
+    {
+        "prompt": "def fibonacci(n):",
+        "expected_words": ["return", "if", "def", "fibonacci"],
+        "category": "code"
+    },
+    {
+        "prompt": "The capital of France is",
+        "expected_words": ["Paris"],
+        "category": "factual"
+    },
+    {
+        "prompt": "Once upon a time",
+        "expected_words": ["there", "was", "lived", "story"],
+        "category": "narrative"
+    }
+]
+
+
+# Per-case generation parameters the test runners understand
+GENERATION_PARAMS = ("max_new_tokens", "temperature", "timeout")
+
+
+def normalize_test_case(raw, index=0):
+    """
+    Validate a test case read from a file and fill in defaults.
+
+    Args:
+        raw: Dictionary with at least a "prompt". Optional: id, name,
+            category, expected_words, expected_answers, generation
+            ({max_new_tokens, temperature, timeout}) and evaluators (names
+            or {"type": ..., **options}, see evaluators.registry)
+        index: Position in its file, used for the default id
+
+    Returns:
+        Normalized test case dictionary
+    """
+    if not isinstance(raw, dict):
+        raise ValueError(f"Test case {index} is not a mapping")
+    if not isinstance(raw.get("prompt"), str):
+        raise ValueError(f"Test case {index} needs a string 'prompt'")
+
+    generation = dict(raw.get("generation") or {})
+    # "max_tokens" is what ModelComparator test cases have always used
+    if "max_tokens" in raw:
+        generation.setdefault("max_new_tokens", raw["max_tokens"])
+    unknown = set(generation) - set(GENERATION_PARAMS)
+    if unknown:
+        raise ValueError(f"Test case {index}: unsupported generation params {sorted(unknown)}")
+
+    case_id = str(raw.get("id") or raw.get("name") or f"case-{index}")
+    test_case = {
+        "id": case_id,
+        "name": raw.get("name") or case_id,
+        "prompt": raw["prompt"],
+        "category": raw.get("category", "general"),
+        "expected_words": list(raw.get("expected_words") or []),
+        "expected_answers": list(raw.get("expected_answers") or []),
+        "generation": generation,
+        "evaluators": list(raw.get("evaluators") or []),
+    }
+    if "max_new_tokens" in generation:
+        test_case["max_tokens"] = generation["max_new_tokens"]
+    return test_case
+
+
+def iter_test_cases(filepath):
+    """
+    Stream test cases from a file, one at a time.
+
+    Supported formats, by extension:
+
+    - .jsonl (optionally .gz / .zst): one test case per line
+    - .yaml / .yml: a top-level list of test cases, or one test case per
+      YAML document; list items are parsed one by one (needs PyYAML)
+    - .json: a list of test cases (loaded whole)
+
+    Args:
+        filepath: Test-case file
+
+    Yields:
+        Normalized test cases (see normalize_test_case)
+    """
+    name = filepath.lower()
+    if name.endswith((".yaml", ".yml")):
+        raw_cases = _iter_yaml(filepath)
+    elif name.endswith(".json"):
+        with open(filepath, "r") as f:
+            raw_cases = json.load(f)
+        if not isinstance(raw_cases, list):
+            raise ValueError(f"{filepath}: expected a list of test cases")
+    else:
+        raw_cases = iter_jsonl(filepath)
+
+    for index, raw in enumerate(raw_cases):
+        try:
+            yield normalize_test_case(raw, index)
+        except ValueError as e:
+            raise ValueError(f"{filepath}: {e}") from None
+
+
+def load_test_cases(filepath):
+    """Read all test cases of a file into a list."""
+    return list(iter_test_cases(filepath))
+
+
+def _iter_yaml(filepath):
+    """Yield the items of top-level YAML sequences, or whole documents otherwise."""
+    if yaml is None:
+        raise ImportError("Reading YAML test cases needs the 'PyYAML' package")
+
+    with open(filepath, "r") as f:
+        loader = yaml.SafeLoader(f)
+        try:
+            loader.get_event()  # StreamStart
+            while not loader.check_event(yaml.StreamEndEvent):
+                loader.get_event()  # DocumentStart
+                if loader.check_event(yaml.SequenceStartEvent):
+                    # Compose one item at a time instead of the whole list
+                    loader.get_event()
+                    while not loader.check_event(yaml.SequenceEndEvent):
+                        yield loader.construct_document(loader.compose_node(None, None))
+                    loader.get_event()
+                elif not loader.check_event(yaml.DocumentEndEvent):
+                    yield loader.construct_document(loader.compose_node(None, None))
+                loader.get_event()  # DocumentEnd
+                loader.anchors = {}
+        finally:
+            loader.dispose()
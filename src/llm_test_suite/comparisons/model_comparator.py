@@ -1,22 +1,168 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Callable
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
+import multiprocessing
+import os
 import time
-from transformers import pipeline
+
+from .model_pool import ModelPool
+from ..backends.base import GenerationBackend
+from ..backends.local import PipelineBackend
+from ..evaluators.pipeline import EvaluationPipeline
+from ..runners.async_runner import AsyncSuiteRunner
+from ..utils.response_cache import ResponseCache
+from ..utils.stats import summarize_latencies
+
+
+def _load_local_backend(model_name: str) -> GenerationBackend:
+    """Load a model as a local transformers pipeline on CPU."""
+    return PipelineBackend(model_name, device="cpu")
+
+
+TEMPERATURE = 0.7
+
+
+def _generate_response(model, prompt: str, max_new_tokens: int,
+                       streaming: bool = False, seed: Optional[int] = None) -> Dict[str, Any]:
+    """Generate one response with a backend and package it as a model_responses entry."""
+    start_time = time.time()
+    try:
+        generate = model.generate_stream if streaming else model.generate
+        generation = generate(prompt, max_new_tokens=max_new_tokens,
+                              temperature=TEMPERATURE, seed=seed)
+        
+        response = {
+            'response': generation['text'].strip(),
+            'full_text': generation['full_text'],
+            'generation_time': generation['generation_time'],
+            'token_count': generation['token_count'],
+            'error': False
+        }
+        if streaming:
+            response.update({
+                'time_to_first_token': generation['time_to_first_token'],
+                'inter_token_latency': generation['inter_token_latency'],
+                'tokens_per_second': generation['tokens_per_second']
+            })
+        return response
+        
+    except Exception as e:
+        return {
+            'response': f"Generation failed: {str(e)}",
+            'error': True,
+            'generation_time': time.time() - start_time
+        }
+
+
+def _load_failed_response() -> Dict[str, Any]:
+    """model_responses entry for a model that could not be loaded."""
+    return {
+        'response': "Model failed to load",
+        'error': True,
+        'generation_time': 0
+    }
+
+
+# State of a parallel-mode worker process; each worker owns one model
+_worker_model = None
+_worker_load_time = 0.0
+_worker_error = None
+
+
+def _init_worker(model_name: str, num_threads: int,
+                 loader: Callable[[str], GenerationBackend] = _load_local_backend):
+    """Process pool initializer: pin the thread count and load the model."""
+    global _worker_model, _worker_load_time, _worker_error
+    import torch
+    torch.set_num_threads(num_threads)
+    
+    start_time = time.time()
+    try:
+        _worker_model = loader(model_name)
+    except Exception as e:
+        # Reported back through _worker_status instead of breaking the pool
+        _worker_error = str(e)
+    _worker_load_time = time.time() - start_time
+
+
+def _worker_status():
+    """Report how the worker's model load went, and the model's revision."""
+    revision = _worker_model.revision if _worker_model is not None else None
+    return _worker_load_time, _worker_error, revision
+
+
+def _worker_generate(prompt: str, max_new_tokens: int, streaming: bool,
+                     seed: Optional[int] = None) -> Dict[str, Any]:
+    """Generate with the worker's model."""
+    if _worker_model is None:
+        return _load_failed_response()
+    return _generate_response(_worker_model, prompt, max_new_tokens, streaming, seed)
 
 
 class ModelComparator:
     """Compare multiple models on the same tests."""
     
-    def __init__(self, model_names: List[str]):
+    def __init__(self, model_names: List[str], parallel: bool = False,
+                 threads_per_worker: Optional[int] = None, lazy: bool = False,
+                 memory_budget_mb: Optional[float] = None,
+                 cache_dir: Optional[str] = None, seed: int = 42,
+                 backend: Optional[Callable[[str], GenerationBackend]] = None):
         """
         Initialize with list of model names to compare.
         
         Args:
             model_names: List of Hugging Face model names
+            parallel: Run each model in its own worker process so different
+                models generate concurrently
+            threads_per_worker: Torch threads per worker in parallel mode
+                (default: CPU cores split evenly between models)
+            lazy: Load models on first use instead of all up front, in this
+                process (cannot be combined with parallel)
+            memory_budget_mb: With lazy loading, evict least recently used
+                models to keep combined weight size under this budget
+            cache_dir: Reuse responses generated earlier with the same model
+                revision, prompt, generation parameters and seed. Models whose
+                responses are all cached are never loaded in lazy mode.
+                Revisions are those the loaded backends report; custom
+                backends loaded lazily are keyed without one.
+            seed: Random seed set before each generation when caching
+            backend: Factory returning the GenerationBackend for a model
+                name, e.g. ``functools.partial(OpenAICompatibleBackend, url)``
+                to compare models behind an inference server (default: local
+                transformers pipelines). Must be picklable in parallel mode.
         """
+        if lazy and parallel:
+            raise ValueError("lazy and parallel cannot be combined: lazy loading "
+                             "runs models one at a time in this process")
+        
         self.model_names = model_names
         self.models = {}
-        self._load_models()
+        self.parallel = parallel
+        self.lazy = lazy
+        self.pool = None
+        self._workers = {}
+        self.loader = backend or _load_local_backend
+        # Reseeding only matters when responses are cached and replayed
+        self.seed = seed if cache_dir else None
+        # Revisions reported by the loaded backends, for cache keys
+        self._revisions = {}
+        
+        if lazy:
+            self.pool = ModelPool(self.loader, memory_budget_mb)
+        elif parallel:
+            self.threads_per_worker = threads_per_worker or max(
+                1, (os.cpu_count() or 1) // max(1, len(model_names))
+            )
+            self._start_workers()
+        else:
+            self._load_models()
+        
+        # Models not loaded up front (lazy mode) are looked up on the Hub,
+        # which only makes sense for the default local backend
+        self.response_cache = (
+            ResponseCache(cache_dir, revisions=self._revisions, lookup_revisions=backend is None)
+            if cache_dir else None
+        )
         
     def _load_models(self):
         """Load all models."""
@@ -27,76 +173,171 @@ class ModelComparator:
             start_time = time.time()
             
             try:
-                self.models[model_name] = pipeline(
-                    "text-generation",
-                    model=model_name,
-                    device=-1  # CPU
-                )
+                self.models[model_name] = self.loader(model_name)
+                self._revisions[model_name] = self.models[model_name].revision
                 load_time = time.time() - start_time
                 print(f" ✓ ({load_time:.1f}s)")
             except Exception as e:
                 print(f" ✗ Failed: {str(e)}")
                 self.models[model_name] = None
     
-    def compare_single_prompt(self, prompt: str, max_new_tokens: int = 20) -> Dict[str, Any]:
+    def _start_workers(self):
+        """Start one single-process pool per model and wait for the loads."""
+        print(f"🤖 Starting {len(self.model_names)} model workers "
+              f"({self.threads_per_worker} threads each)...")
+        
+        # Spawn rather than fork: torch and tokenizers don't survive forking
+        context = multiprocessing.get_context("spawn")
+        for model_name in self.model_names:
+            self._workers[model_name] = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(model_name, self.threads_per_worker, self.loader)
+            )
+        
+        # Models load concurrently; the status call returns once each is ready
+        statuses = {name: worker.submit(_worker_status) for name, worker in self._workers.items()}
+        for model_name, status in statuses.items():
+            load_time, error, revision = status.result()
+            if error:
+                print(f"  {model_name} ✗ Failed: {error}")
+            else:
+                self._revisions[model_name] = revision
+                print(f"  {model_name} ✓ ({load_time:.1f}s)")
+    
+    def _get_model(self, model_name: str):
+        """Return a loaded model (None if it failed to load)."""
+        if self.pool is not None:
+            return self.pool.get(model_name)
+        return self.models.get(model_name)
+    
+    def close(self):
+        """Shut down worker processes (parallel mode) and close backends."""
+        for worker in self._workers.values():
+            worker.shutdown()
+        self._workers = {}
+        
+        models = list(self.models.values())
+        if self.pool is not None:
+            models.extend(self.pool.loaded.values())
+        for model in models:
+            if model is not None:
+                model.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def compare_single_prompt(self, prompt: str, max_new_tokens: int = 20,
+                              streaming: bool = False) -> Dict[str, Any]:
         """
         Compare all models on a single prompt.
         
         Args:
             prompt: Input prompt
             max_new_tokens: Maximum tokens to generate
+            streaming: Stream tokens to record time-to-first-token,
+                inter-token latency and tokens/second
             
         Returns:
             Dictionary with comparison results
         """
+        if self._workers:
+            return self._collect_responses(
+                prompt, self._submit_prompt(prompt, max_new_tokens, streaming),
+                max_new_tokens, streaming
+            )
+        
         results = {
             'prompt': prompt,
             'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S"),
             'model_responses': {}
         }
         
-        for model_name, model in self.models.items():
-            if model is None:
-                results['model_responses'][model_name] = {
-                    'response': "Model failed to load",
-                    'error': True,
-                    'generation_time': 0
-                }
-                continue
-            
-            # Generate response
-            start_time = time.time()
-            try:
-                output = model(
-                    prompt,
-                    max_new_tokens=max_new_tokens,
-                    temperature=0.7,
-                    pad_token_id=model.tokenizer.eos_token_id
+        for model_name in self.model_names:
+            response = self._cached_response(model_name, prompt, max_new_tokens, streaming)
+            if response is None:
+                model = self._get_model(model_name)
+                if model is None:
+                    response = _load_failed_response()
+                else:
+                    response = _generate_response(model, prompt, max_new_tokens, streaming, self.seed)
+                    self._cache_response(model_name, prompt, max_new_tokens, streaming, response)
+            results['model_responses'][model_name] = response
+        
+        return results
+    
+    def _cache_kwargs(self, max_new_tokens: int, streaming: bool) -> Dict[str, Any]:
+        """Generation parameters that go into response cache keys."""
+        return {'max_new_tokens': max_new_tokens, 'temperature': TEMPERATURE, 'streaming': streaming}
+    
+    def _cached_response(self, model_name: str, prompt: str, max_new_tokens: int,
+                         streaming: bool) -> Optional[Dict[str, Any]]:
+        """Cached response for a model and prompt, or None."""
+        if self.response_cache is None:
+            return None
+        response = self.response_cache.get(
+            model_name, prompt, self._cache_kwargs(max_new_tokens, streaming), self.seed
+        )
+        if response is not None:
+            response['cached'] = True
+        return response
+    
+    def _cache_response(self, model_name: str, prompt: str, max_new_tokens: int,
+                        streaming: bool, response: Dict[str, Any]):
+        """Store a freshly generated response (failures are not cached)."""
+        if self.response_cache is None or response['error'] or response.get('cached'):
+            return
+        self.response_cache.put(
+            model_name, prompt, self._cache_kwargs(max_new_tokens, streaming), self.seed, response
+        )
+    
+    def _submit_prompt(self, prompt: str, max_new_tokens: int,
+                       streaming: bool) -> Dict[str, Any]:
+        """Queue a prompt on every model worker; returns futures by model."""
+        futures = {}
+        for model_name, worker in self._workers.items():
+            cached = self._cached_response(model_name, prompt, max_new_tokens, streaming)
+            if cached is None:
+                futures[model_name] = worker.submit(
+                    _worker_generate, prompt, max_new_tokens, streaming, self.seed
                 )
-                generation_time = time.time() - start_time
-                
-                full_text = output[0]['generated_text']
-                generated_only = full_text[len(prompt):].strip()
-                
-                results['model_responses'][model_name] = {
-                    'response': generated_only,
-                    'full_text': full_text,
-                    'generation_time': generation_time,
-                    'token_count': len(model.tokenizer.encode(generated_only)),
-                    'error': False
-                }
-                
+            else:
+                # Already-resolved future so collection works the same way
+                futures[model_name] = Future()
+                futures[model_name].set_result(cached)
+        return futures
+    
+    def _collect_responses(self, prompt: str, futures: Dict[str, Any],
+                           max_new_tokens: int, streaming: bool) -> Dict[str, Any]:
+        """Wait for a prompt's worker futures and merge them into one result."""
+        results = {
+            'prompt': prompt,
+            'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S"),
+            'model_responses': {}
+        }
+        
+        for model_name, future in futures.items():
+            try:
+                results['model_responses'][model_name] = future.result()
+                self._cache_response(model_name, prompt, max_new_tokens, streaming,
+                                     results['model_responses'][model_name])
             except Exception as e:
+                # A crashed worker process takes its whole pool down
                 results['model_responses'][model_name] = {
                     'response': f"Generation failed: {str(e)}",
                     'error': True,
-                    'generation_time': time.time() - start_time
+                    'generation_time': 0
                 }
         
         return results
     
     def compare_with_evaluators(self, prompt: str, evaluators: List[Any], 
-                               max_new_tokens: int = 20) -> Dict[str, Any]:
+                               max_new_tokens: int = 20,
+                               streaming: bool = False) -> Dict[str, Any]:
         """
         Compare models and evaluate each response.
         
@@ -104,45 +345,51 @@ class ModelComparator:
             prompt: Input prompt
             evaluators: List of evaluator instances
             max_new_tokens: Maximum tokens to generate
+            streaming: Record streaming latency metrics
             
         Returns:
             Comparison results with evaluations
         """
         # First, get all model responses
-        comparison = self.compare_single_prompt(prompt, max_new_tokens)
+        comparison = self.compare_single_prompt(prompt, max_new_tokens, streaming)
         
         # Then evaluate each response
+        self._evaluate_responses(comparison, evaluators)
+        return comparison
+    
+    def _evaluate_responses(self, comparison: Dict[str, Any], evaluators: List[Any]):
+        """Attach evaluator results to every successful response in place."""
+        # Semantic similarity needs an expected answer, which comparisons lack
+        pipeline = EvaluationPipeline([
+            evaluator for evaluator in evaluators
+            if hasattr(evaluator, 'evaluate') and evaluator.__class__.__name__ != 'SemanticSimilarityEvaluator'
+        ])
         for model_name, model_result in comparison['model_responses'].items():
             if model_result['error']:
                 continue
-                
-            model_result['evaluations'] = {}
             
-            for evaluator in evaluators:
-                evaluator_name = evaluator.__class__.__name__
-                
-                try:
-                    # Simple evaluation (just response)
-                    if hasattr(evaluator, 'evaluate') and evaluator.__class__.__name__ != 'SemanticSimilarityEvaluator':
-                        eval_result = evaluator.evaluate(model_result['response'])
-                        model_result['evaluations'][evaluator_name] = eval_result
-                        
-                except Exception as e:
-                    model_result['evaluations'][evaluator_name] = {
-                        'error': str(e),
-                        'passed': False
-                    }
-        
-        return comparison
+            model_result['evaluations'] = pipeline.evaluate(model_result['response'])
     
     def run_comparison_suite(self, test_cases: List[Dict[str, Any]], 
-                           evaluators: List[Any] = None) -> Dict[str, Any]:
+                           evaluators: List[Any] = None,
+                           streaming: bool = False,
+                           model_major: Optional[bool] = None,
+                           pipelined: bool = False,
+                           max_pending: int = 4) -> Dict[str, Any]:
         """
         Run complete comparison suite.
         
         Args:
             test_cases: List of test cases with prompts
             evaluators: Optional list of evaluators
+            streaming: Record time-to-first-token and tokens/second
+            model_major: Run every test case on one model before moving to
+                the next, so each model is loaded once (default: on when
+                loading lazily)
+            pipelined: Evaluate each test's responses on worker threads while
+                the next test generates (ignored in model-major order)
+            max_pending: With pipelined, generated tests allowed to wait for
+                evaluation before generation pauses
             
         Returns:
             Complete comparison results
@@ -157,36 +404,67 @@ class ModelComparator:
         print(f"\n🏁 Running comparison suite with {len(test_cases)} tests")
         print("=" * 60)
         
-        for i, test_case in enumerate(test_cases, 1):
-            print(f"\nTest {i}/{len(test_cases)}: {test_case.get('name', 'Unnamed')}")
-            print(f"Prompt: {test_case['prompt']}")
+        # In parallel mode queue every prompt up front so each model worker
+        # runs through the whole suite without waiting on the slower models
+        if model_major is None:
+            model_major = self.lazy
+        
+        if pipelined and not model_major:
+            def evaluate(test_case, result):
+                if evaluators:
+                    self._evaluate_responses(result, evaluators)
+                return result
             
-            if evaluators:
-                result = self.compare_with_evaluators(
-                    test_case['prompt'], 
-                    evaluators,
-                    test_case.get('max_tokens', 20)
+            # With workers a second prompt in flight keeps every model busy
+            runner = AsyncSuiteRunner(
+                lambda test_case: self.compare_single_prompt(
+                    test_case['prompt'], test_case.get('max_tokens', 20), streaming
+                ),
+                evaluate,
+                generation_concurrency=2 if self._workers else 1,
+                max_pending=max_pending
+            )
+            
+            def finish(index, test_case, result):
+                result['test_name'] = test_case.get('name', f'test_{index + 1}')
+                self._print_test_result(index + 1, len(test_cases), test_case, result)
+            
+            suite_results['test_results'] = runner.run(test_cases, on_result=finish)
+            suite_results['summary'] = self._calculate_summary(suite_results['test_results'])
+            suite_results['end_time'] = datetime.now().strftime("%Y%m%d_%H%M%S")
+            return suite_results
+        
+        pending = None
+        precomputed = None
+        if self._workers:
+            pending = [
+                self._submit_prompt(test_case['prompt'], test_case.get('max_tokens', 20), streaming)
+                for test_case in test_cases
+            ]
+        elif model_major:
+            precomputed = self._run_model_major(test_cases, streaming)
+        
+        for i, test_case in enumerate(test_cases, 1):
+            if pending is not None:
+                result = self._collect_responses(
+                    test_case['prompt'], pending[i - 1],
+                    test_case.get('max_tokens', 20), streaming
                 )
+            elif precomputed is not None:
+                result = precomputed[i - 1]
             else:
                 result = self.compare_single_prompt(
                     test_case['prompt'],
-                    test_case.get('max_tokens', 20)
+                    test_case.get('max_tokens', 20),
+                    streaming
                 )
             
+            if evaluators:
+                self._evaluate_responses(result, evaluators)
+            
             result['test_name'] = test_case.get('name', f'test_{i}')
             suite_results['test_results'].append(result)
-            
-            # Print responses
-            for model_name, model_result in result['model_responses'].items():
-                if not model_result['error']:
-                    print(f"\n  {model_name}:")
-                    print(f"    Response: {model_result['response'][:80]}...")
-                    print(f"    Time: {model_result['generation_time']:.2f}s")
-                    
-                    if 'evaluations' in model_result:
-                        for eval_name, eval_result in model_result['evaluations'].items():
-                            status = "" if eval_result.get('passed', False) else ""
-                            print(f"    {eval_name}: {status}")
+            self._print_test_result(i, len(test_cases), test_case, result)
         
         # Calculate summary statistics
         suite_results['summary'] = self._calculate_summary(suite_results['test_results'])
@@ -194,6 +472,74 @@ class ModelComparator:
         
         return suite_results
     
+    def _print_test_result(self, number: int, total: int, test_case: Dict[str, Any],
+                           result: Dict[str, Any]):
+        """Print one test's prompt and every model's response."""
+        print(f"\nTest {number}/{total}: {test_case.get('name', 'Unnamed')}")
+        print(f"Prompt: {test_case['prompt']}")
+        
+        # Print responses
+        for model_name, model_result in result['model_responses'].items():
+            if not model_result['error']:
+                print(f"\n  {model_name}:")
+                print(f"    Response: {model_result['response'][:80]}...")
+                print(f"    Time: {model_result['generation_time']:.2f}s")
+                if model_result.get('time_to_first_token') is not None:
+                    print(f"    TTFT: {model_result['time_to_first_token']:.3f}s")
+                
+                if 'evaluations' in model_result:
+                    for eval_name, eval_result in model_result['evaluations'].items():
+                        status = "" if eval_result.get('passed', False) else ""
+                        print(f"    {eval_name}: {status}")
+    
+    def _run_model_major(self, test_cases: List[Dict[str, Any]],
+                         streaming: bool) -> List[Dict[str, Any]]:
+        """
+        Generate all test cases one model at a time.
+        
+        Each model is loaded once, runs the whole suite, and (when loading
+        lazily) is evicted before the next one loads.
+        
+        Returns:
+            One comparison result per test case, in test case order
+        """
+        results = [
+            {
+                'prompt': test_case['prompt'],
+                'timestamp': datetime.now().strftime("%Y%m%d_%H%M%S"),
+                'model_responses': {}
+            }
+            for test_case in test_cases
+        ]
+        
+        for model_name in self.model_names:
+            model = None
+            loaded = False
+            for test_case, result in zip(test_cases, results):
+                max_new_tokens = test_case.get('max_tokens', 20)
+                response = self._cached_response(
+                    model_name, test_case['prompt'], max_new_tokens, streaming
+                )
+                if response is None:
+                    # Load only once a test case actually needs the model
+                    if not loaded:
+                        model = self._get_model(model_name)
+                        loaded = True
+                    if model is None:
+                        response = _load_failed_response()
+                    else:
+                        response = _generate_response(
+                            model, test_case['prompt'], max_new_tokens, streaming, self.seed
+                        )
+                        self._cache_response(model_name, test_case['prompt'], max_new_tokens,
+                                             streaming, response)
+                result['model_responses'][model_name] = response
+            
+            if self.pool is not None and loaded:
+                self.pool.evict(model_name)
+        
+        return results
+    
     def _calculate_summary(self, test_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate summary statistics."""
         summary = {
@@ -210,6 +556,9 @@ class ModelComparator:
             }
             
             times = []
+            first_token_times = []
+            token_latencies = []
+            token_rates = []
             for result in test_results:
                 if model_name in result['model_responses']:
                     model_result = result['model_responses'][model_name]
@@ -219,11 +568,28 @@ class ModelComparator:
                         stats['failed_responses'] += 1
                     else:
                         times.append(model_result['generation_time'])
+                        if model_result.get('time_to_first_token') is not None:
+                            first_token_times.append(model_result['time_to_first_token'])
+                        if model_result.get('inter_token_latency') is not None:
+                            token_latencies.append(model_result['inter_token_latency'])
+                        if model_result.get('tokens_per_second') is not None:
+                            token_rates.append(model_result['tokens_per_second'])
             
             if times:
                 stats['avg_generation_time'] = sum(times) / len(times)
                 stats['total_time'] = sum(times)
+                latency = summarize_latencies(times)
+                for key in ('stdev', 'p50', 'p90', 'p99'):
+                    stats[f'{key}_generation_time'] = latency[key]
+            
+            # Only present when the suite ran with streaming=True
+            if first_token_times:
+                stats['avg_time_to_first_token'] = sum(first_token_times) / len(first_token_times)
+            if token_latencies:
+                stats['avg_inter_token_latency'] = sum(token_latencies) / len(token_latencies)
+            if token_rates:
+                stats['avg_tokens_per_second'] = sum(token_rates) / len(token_rates)
             
             summary['model_stats'][model_name] = stats
         
-        return summary
\ No newline at end of file
+        return summary
@@ -0,0 +1,149 @@
+from typing import Callable, Dict, Any, Optional
+from collections import OrderedDict
+import gc
+import time
+
+try:
+    from huggingface_hub import get_safetensors_metadata
+except ImportError:  # Sizes are then only known once a model has loaded
+    get_safetensors_metadata = None
+
+# Bytes per element of the safetensors dtypes
+DTYPE_BYTES = {
+    'F64': 8, 'I64': 8, 'U64': 8,
+    'F32': 4, 'I32': 4, 'U32': 4,
+    'F16': 2, 'BF16': 2, 'I16': 2, 'U16': 2,
+    'F8_E4M3': 1, 'F8_E5M2': 1, 'I8': 1, 'U8': 1, 'BOOL': 1,
+}
+
+
+def model_size_bytes(model) -> int:
+    """
+    Memory held by a model's weights.
+
+    Args:
+        model: A GenerationBackend or a transformers pipeline
+
+    Returns:
+        Total bytes of the model's parameters and buffers
+    """
+    if hasattr(model, 'size_bytes'):
+        return model.size_bytes()
+    module = model.model
+    tensors = list(module.parameters()) + list(module.buffers())
+    return sum(t.numel() * t.element_size() for t in tensors)
+
+
+def estimate_model_size(model_name: str) -> Optional[int]:
+    """
+    Weight size of a Hugging Face model before loading it.
+
+    Reads the parameter counts per dtype from the repo's safetensors
+    metadata (file headers only, no weights are downloaded).
+
+    Returns:
+        Size in bytes, or None when it cannot be determined (no
+        huggingface_hub, no safetensors weights, offline, not a Hub model)
+    """
+    if get_safetensors_metadata is None:
+        return None
+    try:
+        metadata = get_safetensors_metadata(model_name)
+    except Exception:
+        return None
+    return sum(count * DTYPE_BYTES.get(dtype, 4) for dtype, count in metadata.parameter_count.items())
+
+
+class ModelPool:
+    """Load models on demand and keep them in an LRU bounded by memory."""
+
+    def __init__(self, loader: Callable[[str], Any],
+                 memory_budget_mb: Optional[float] = None,
+                 size_estimator: Optional[Callable[[str], Optional[int]]] = estimate_model_size):
+        """
+        Initialize the pool.
+
+        Args:
+            loader: Function that loads a model by name
+            memory_budget_mb: Maximum combined weight size of loaded models
+                (None keeps everything loaded)
+            size_estimator: Function giving a model's size in bytes before
+                its first load, or None if unknown. Models are evicted
+                before loading, so the budget holds during the load too; when
+                the size is unknown every loaded model is evicted first.
+        """
+        self.loader = loader
+        self.size_estimator = size_estimator
+        self.memory_budget = memory_budget_mb * 1024 * 1024 if memory_budget_mb else None
+        self.loaded = OrderedDict()  # model name -> pipeline, oldest use first
+        self.sizes: Dict[str, int] = {}
+        self.failed: Dict[str, str] = {}
+
+    def get(self, model_name: str):
+        """
+        Return a loaded model, loading (and evicting others) if needed.
+
+        Args:
+            model_name: Hugging Face model name
+
+        Returns:
+            The pipeline, or None if it failed to load
+        """
+        if model_name in self.loaded:
+            self.loaded.move_to_end(model_name)
+            return self.loaded[model_name]
+
+        if model_name in self.failed:
+            return None
+
+        # Free room before loading, so old and new weights never exceed the
+        # budget together
+        if self.memory_budget is not None:
+            size = self.sizes.get(model_name)
+            if size is None and self.size_estimator is not None:
+                size = self.size_estimator(model_name)
+            if size is None:
+                for name in list(self.loaded):
+                    self.evict(name)
+            else:
+                self._evict_until_fits(size)
+
+        print(f"  Loading {model_name}...", end="", flush=True)
+        start_time = time.time()
+        try:
+            model = self.loader(model_name)
+        except Exception as e:
+            print(f" ✗ Failed: {str(e)}")
+            self.failed[model_name] = str(e)
+            return None
+
+        size = model_size_bytes(model)
+        self.sizes[model_name] = size
+        print(f" ✓ ({time.time() - start_time:.1f}s, {size / 1024 / 1024:.0f} MB)")
+
+        # The estimate can be off; correct with the measured size
+        self._evict_until_fits(size)
+        self.loaded[model_name] = model
+        return model
+
+    def evict(self, model_name: str):
+        """Drop a model from memory."""
+        model = self.loaded.pop(model_name, None)
+        if model is not None:
+            if hasattr(model, 'close'):
+                model.close()
+            print(f"  Evicted {model_name}")
+            gc.collect()
+
+    def loaded_bytes(self) -> int:
+        """Combined weight size of the currently loaded models."""
+        return sum(self.sizes[name] for name in self.loaded)
+
+    def _evict_until_fits(self, incoming_size: int):
+        """Evict least recently used models until incoming_size fits the budget."""
+        if self.memory_budget is None:
+            return
+
+        while self.loaded and self.loaded_bytes() + incoming_size > self.memory_budget:
+            oldest = next(iter(self.loaded))
+            self.evict(oldest)
@@ -0,0 +1,68 @@
+import re
+from functools import cached_property
+
+_SENTENCE_TEXT = re.compile(r'[^.!?]+')
+_SPECIAL_CHARS = re.compile(r'[@#$%^&*]')
+
+
+class TextAnalysis:
+    """A response tokenized and normalized once, shared by every evaluator.
+
+    Each view (words, lowercase words, sentences, character classes) is
+    computed on first access and cached, so evaluators that need the same
+    view don't redo the string work.
+    """
+
+    def __init__(self, text):
+        self.text = text
+
+    @cached_property
+    def stripped(self):
+        return self.text.strip()
+
+    @cached_property
+    def lower(self):
+        return self.text.lower()
+
+    @cached_property
+    def words(self):
+        return self.text.split()
+
+    @cached_property
+    def lower_words(self):
+        return self.lower.split()
+
+    @property
+    def word_count(self):
+        return len(self.words)
+
+    @cached_property
+    def sentence_spans(self):
+        """(start, end) offsets of each non-empty sentence, whitespace trimmed."""
+        spans = []
+        for match in _SENTENCE_TEXT.finditer(self.text):
+            segment = match.group()
+            content = segment.strip()
+            if content:
+                start = match.start() + segment.index(content)
+                spans.append((start, start + len(content)))
+        return spans
+
+    @cached_property
+    def sentences(self):
+        return [self.text[start:end] for start, end in self.sentence_spans]
+
+    @cached_property
+    def has_upper(self):
+        return any(c.isupper() for c in self.text)
+
+    @cached_property
+    def has_special_chars(self):
+        return _SPECIAL_CHARS.search(self.text) is not None
+
+
+def as_analysis(response):
+    """Return response as a TextAnalysis, wrapping plain strings."""
+    if isinstance(response, TextAnalysis):
+        return response
+    return TextAnalysis(response)
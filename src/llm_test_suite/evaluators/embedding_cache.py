@@ -0,0 +1,77 @@
+from collections import OrderedDict
+import hashlib
+import os
+
+import numpy as np
+
+from ..utils.cache_files import atomic_write, entry_path
+
+
+class EmbeddingCache:
+    """Content-addressed embedding cache: in-memory LRU plus optional disk store."""
+
+    def __init__(self, model_name, max_entries=1024, cache_dir=None, normalized=False):
+        """
+        Initialize the cache.
+
+        Args:
+            model_name: Embedding model name, part of every key so different
+                models never share entries
+            max_entries: Embeddings kept in memory
+            cache_dir: Directory for persistent .npy files (None: memory only)
+            normalized: Whether stored embeddings are unit length. Part of the
+                key, so raw vectors cached earlier are never served as unit
+                vectors (or the other way round)
+        """
+        self.model_name = model_name
+        self.normalized = normalized
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, text):
+        """Cache key for a text: hash of model name, normalization and content."""
+        namespace = f"{self.model_name}\0normalized" if self.normalized else self.model_name
+        return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8")).hexdigest()
+
+    def get(self, text):
+        """Return the cached embedding for text, or None."""
+        key = self.key(text)
+
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        if self.cache_dir:
+            path = self._path(key)
+            if os.path.exists(path):
+                embedding = np.load(path)
+                self._remember(key, embedding)
+                self.hits += 1
+                return embedding
+
+        self.misses += 1
+        return None
+
+    def put(self, text, embedding):
+        """Store the embedding for text."""
+        key = self.key(text)
+        self._remember(key, embedding)
+
+        if self.cache_dir:
+            atomic_write(self._path(key), lambda f: np.save(f, embedding), mode="wb")
+
+    def _remember(self, key, embedding):
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return entry_path(self.cache_dir, key, ".npy")
@@ -1,6 +1,13 @@
+import numpy as np
+
+from .analysis import as_analysis
+
 
 class LengthEvaluator:
     
+    # evaluate() accepts a shared TextAnalysis as well as a plain string
+    accepts_analysis = True
+    
     def __init__(self, min_words=5, max_words=50):
         
         self.min_words = min_words
@@ -9,8 +16,7 @@ class LengthEvaluator:
     def evaluate(self, response):
         
         # Count words
-        words = response.split()
-        word_count = len(words)
+        word_count = as_analysis(response).word_count
         
         # Check if within range
         is_good_length = self.min_words <= word_count <= self.max_words
@@ -24,6 +30,39 @@ class LengthEvaluator:
             'message': self._get_message(word_count, is_good_length)
         }
     
+    def evaluate_batch(self, responses, as_columns=False):
+        """
+        Evaluate many responses in one pass.
+        
+        Args:
+            responses: List of responses
+            as_columns: Return a dict of arrays instead of per-item dicts
+        
+        Returns:
+            List of dicts (same format as evaluate) or, with as_columns,
+            {'word_count': int array, 'passed': bool array}
+        """
+        word_counts = np.fromiter(
+            (as_analysis(response).word_count for response in responses),
+            dtype=np.int64,
+            count=len(responses)
+        )
+        passed = (word_counts >= self.min_words) & (word_counts <= self.max_words)
+        
+        if as_columns:
+            return {'word_count': word_counts, 'passed': passed}
+        
+        return [
+            {
+                'word_count': word_count,
+                'min_words': self.min_words,
+                'max_words': self.max_words,
+                'passed': is_good_length,
+                'message': self._get_message(word_count, is_good_length)
+            }
+            for word_count, is_good_length in zip(word_counts.tolist(), passed.tolist())
+        ]
+    
     def _get_message(self, word_count, passed):
         if passed:
             return f" Good length: {word_count} words"
@@ -0,0 +1,59 @@
+from .analysis import TextAnalysis
+
+
+class EvaluationPipeline:
+    """Run several evaluators over a response that is analyzed only once."""
+
+    def __init__(self, evaluators):
+        """
+        Initialize with the evaluators to run.
+
+        Args:
+            evaluators: Evaluator instances; those with ``accepts_analysis``
+                get the shared TextAnalysis, reference-based ones (with
+                ``evaluate_references``) the references, the rest the raw
+                string
+        """
+        self.evaluators = evaluators
+
+    def evaluate(self, response, references=None):
+        """
+        Run every evaluator on one response.
+
+        An evaluator that raises is reported as {'error': ..., 'passed': False}
+        rather than stopping the others.
+
+        Args:
+            response: Response text (or an existing TextAnalysis)
+            references: Acceptable answers for reference-based evaluators
+
+        Returns:
+            Dictionary of evaluator class name -> evaluation result
+        """
+        analysis = response if isinstance(response, TextAnalysis) else TextAnalysis(response)
+
+        results = {}
+        for evaluator in self.evaluators:
+            evaluator_name = evaluator.__class__.__name__
+            try:
+                if hasattr(evaluator, 'evaluate_references'):
+                    if not references:
+                        raise ValueError("no reference answers to score against")
+                    results[evaluator_name] = evaluator.evaluate_references(
+                        analysis.text, references
+                    )[0]
+                elif getattr(evaluator, 'accepts_analysis', False):
+                    results[evaluator_name] = evaluator.evaluate(analysis)
+                else:
+                    results[evaluator_name] = evaluator.evaluate(analysis.text)
+            except Exception as e:
+                results[evaluator_name] = {
+                    'error': str(e),
+                    'passed': False
+                }
+
+        return results
+
+    def evaluate_batch(self, responses, references=None):
+        """Run every evaluator on each response; returns one dict per response."""
+        return [self.evaluate(response, references) for response in responses]
@@ -1,18 +1,78 @@
+import numpy as np
+
+from .analysis import as_analysis
+from .repetition import repetition_stats
+
+
 class QualityEvaluator:
     
+    # evaluate() accepts a shared TextAnalysis as well as a plain string
+    accepts_analysis = True
+    
     def __init__(self):
         pass
     
     def evaluate(self, response):
     
-        checks = {
-            'has_content': len(response.strip()) > 0,
-            'ends_properly': response.strip()[-1] in '.!?:' if response.strip() else False,
-            'no_repetition': not self._has_repetition(response),
-            'reasonable_length': 10 < len(response) < 500,
-            'has_capital': any(c.isupper() for c in response) if response else False,
-            'no_special_chars': not any(c in response for c in ['@', '#', '$', '%', '^', '&', '*'])
+        return self._build_result(self._run_checks(response))
+    
+    def evaluate_batch(self, responses, as_columns=False):
+        """
+        Evaluate many responses in one pass.
+        
+        Args:
+            responses: List of responses
+            as_columns: Return a dict of arrays instead of per-item dicts
+        
+        Returns:
+            List of dicts (same format as evaluate) or, with as_columns, one
+            bool array per check plus 'passed_checks', 'quality_score' and
+            'passed' arrays
+        """
+        analyses = [as_analysis(response) for response in responses]
+        count = len(analyses)
+        
+        def column(values, dtype=bool):
+            return np.fromiter(values, dtype=dtype, count=count)
+        
+        # One array per check, in the order of _run_checks
+        stripped_lengths = column((len(a.stripped) for a in analyses), np.int64)
+        text_lengths = column((len(a.text) for a in analyses), np.int64)
+        columns = {
+            'has_content': stripped_lengths > 0,
+            'ends_properly': column(a.stripped.endswith(('.', '!', '?', ':')) for a in analyses),
+            'no_repetition': ~column(self._has_repetition(a) for a in analyses),
+            'reasonable_length': (text_lengths > 10) & (text_lengths < 500),
+            'has_capital': column(a.has_upper for a in analyses),
+            'no_special_chars': ~column(a.has_special_chars for a in analyses)
         }
+        check_names = list(columns)
+        passed_checks = np.sum([columns[name] for name in check_names], axis=0, dtype=np.int64)
+        
+        if as_columns:
+            columns.update({
+                'passed_checks': passed_checks,
+                'quality_score': passed_checks / len(check_names),
+                'passed': passed_checks >= 4
+            })
+            return columns
+        
+        rows = zip(*(columns[name].tolist() for name in check_names))
+        return [self._build_result(dict(zip(check_names, row))) for row in rows]
+    
+    def _run_checks(self, response):
+        analysis = as_analysis(response)
+        stripped = analysis.stripped
+        return {
+            'has_content': len(stripped) > 0,
+            'ends_properly': stripped[-1] in '.!?:' if stripped else False,
+            'no_repetition': not self._has_repetition(analysis),
+            'reasonable_length': 10 < len(analysis.text) < 500,
+            'has_capital': analysis.has_upper,
+            'no_special_chars': not analysis.has_special_chars
+        }
+    
+    def _build_result(self, checks):
         
         passed_checks = sum(checks.values())
         total_checks = len(checks)
@@ -35,24 +95,15 @@ class QualityEvaluator:
         }
     
     def _has_repetition(self, text):
-        """Check if text has word repetition."""
-        words = text.lower().split()
+        """Check if text has word or phrase repetition."""
+        words = as_analysis(text).lower_words
         if len(words) < 3:
             return False
         
-        # Check for repeated words in sequence
-        for i in range(len(words) - 2):
-            if words[i] == words[i + 1] == words[i + 2]:
-                return True
-        
-        # Check for excessive repetition of any word
-        if words:
-            word_counts = {}
-            for word in words:
-                word_counts[word] = word_counts.get(word, 0) + 1
-            
-            max_count = max(word_counts.values())
-            if max_count > len(words) * 0.3:  # If any word is more than 30% of text
-                return True
-        
-        return False
\ No newline at end of file
+        stats = repetition_stats(words, ngram_sizes=(4,))
+        
+        return (
+            stats['longest_run'] >= 3  # Same word three times in a row
+            or stats['most_common_share'] > 0.3  # One word is more than 30% of text
+            or stats['repeated_ratios'][4] > 0.5  # Looping phrase
+        )
\ No newline at end of file
@@ -0,0 +1,45 @@
+import importlib
+
+# Names usable in test-case files -> (module, class). Imported on first use so
+# that configs without "semantic" don't load sentence-transformers.
+EVALUATORS = {
+    'length': ('.length', 'LengthEvaluator'),
+    'sentence': ('.sentence', 'SentenceEvaluator'),
+    'quality': ('.quality', 'QualityEvaluator'),
+    'repetition': ('.repetition', 'RepetitionEvaluator'),
+    'semantic': ('.semantic', 'SemanticSimilarityEvaluator'),
+}
+
+
+def build_evaluator(spec):
+    """
+    Create an evaluator from its config.
+
+    Args:
+        spec: Evaluator name ("length") or a dict with a "type" and the
+            constructor arguments, e.g. {"type": "length", "max_words": 80}
+
+    Returns:
+        Evaluator instance
+    """
+    if isinstance(spec, str):
+        spec = {'type': spec}
+    options = dict(spec)
+    name = options.pop('type', None)
+    if name not in EVALUATORS:
+        raise ValueError(f"Unknown evaluator {name!r}; expected one of {sorted(EVALUATORS)}")
+
+    if name == 'repetition' and 'max_repeated_ratio' in options:
+        # JSON object keys are strings; n-gram sizes are ints
+        options['max_repeated_ratio'] = {
+            int(n): limit for n, limit in options['max_repeated_ratio'].items()
+        }
+
+    module_name, class_name = EVALUATORS[name]
+    evaluator_class = getattr(importlib.import_module(module_name, __package__), class_name)
+    return evaluator_class(**options)
+
+
+def build_evaluators(specs):
+    """Create evaluators for a list of configs (see build_evaluator)."""
+    return [build_evaluator(spec) for spec in specs or []]
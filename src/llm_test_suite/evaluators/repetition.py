@@ -0,0 +1,122 @@
+from .analysis import as_analysis
+
+# Rolling hash parameters: Mersenne-prime modulus keeps collisions negligible
+_MODULUS = (1 << 61) - 1
+_BASE = 1000003
+
+
+def repetition_stats(tokens, ngram_sizes=(1, 2, 3, 4)):
+    """
+    Count repeated n-grams for several n in a single pass over the tokens.
+
+    Tokens are interned to integer ids and each n-gram is identified by a
+    polynomial rolling hash updated in O(1) per token, so the cost is linear
+    in the length of the text for every n.
+
+    Args:
+        tokens: List of tokens (usually lowercase words)
+        ngram_sizes: n-gram lengths to measure
+
+    Returns:
+        Dictionary with the token count, repeated ratio per n (share of
+        n-grams that repeat an earlier one), the longest run of one token
+        and the share of the most frequent token
+    """
+    sizes = sorted(set(ngram_sizes))
+    powers = {n: pow(_BASE, n, _MODULUS) for n in sizes}
+    hashes = {n: 0 for n in sizes}
+    counts = {n: set() for n in sizes}
+
+    token_ids = {}
+    token_frequency = []
+    history = []
+    longest_run = run = 0
+    previous = None
+
+    for i, token in enumerate(tokens):
+        token_id = token_ids.get(token)
+        if token_id is None:
+            token_id = token_ids[token] = len(token_ids)
+            token_frequency.append(0)
+        token_frequency[token_id] += 1
+        history.append(token_id + 1)  # +1 so no token hashes to zero
+
+        run = run + 1 if token_id == previous else 1
+        longest_run = max(longest_run, run)
+        previous = token_id
+
+        for n in sizes:
+            value = (hashes[n] * _BASE + token_id + 1) % _MODULUS
+            if i >= n:
+                # Drop the token that just left the window
+                value = (value - history[i - n] * powers[n]) % _MODULUS
+            hashes[n] = value
+            if i >= n - 1:
+                counts[n].add(value)
+
+    token_count = len(history)
+    ratios = {}
+    for n in sizes:
+        total = token_count - n + 1
+        ratios[n] = 1 - len(counts[n]) / total if total > 0 else 0.0
+
+    return {
+        'token_count': token_count,
+        'repeated_ratios': ratios,
+        'longest_run': longest_run,
+        'most_common_share': max(token_frequency) / token_count if token_count else 0.0
+    }
+
+
+class RepetitionEvaluator:
+    """Flag degenerate repetition, including phrase-level loops."""
+
+    # evaluate() accepts a shared TextAnalysis as well as a plain string
+    accepts_analysis = True
+
+    def __init__(self, ngram_sizes=(1, 2, 3, 4), max_repeated_ratio=None):
+        """
+        Initialize the evaluator.
+
+        Args:
+            ngram_sizes: n-gram lengths to measure
+            max_repeated_ratio: n -> highest allowed repeated ratio. Only the
+                listed sizes decide pass/fail (default: 0.3 for 3- and
+                4-grams, which natural text rarely exceeds)
+        """
+        self.ngram_sizes = tuple(ngram_sizes)
+        if max_repeated_ratio is None:
+            max_repeated_ratio = {3: 0.3, 4: 0.3}
+        self.max_repeated_ratio = max_repeated_ratio
+
+    def evaluate(self, response):
+        stats = repetition_stats(
+            as_analysis(response).lower_words,
+            set(self.ngram_sizes) | set(self.max_repeated_ratio)
+        )
+        ratios = stats['repeated_ratios']
+
+        exceeded = [
+            n for n, limit in sorted(self.max_repeated_ratio.items())
+            if ratios[n] > limit
+        ]
+        passed = not exceeded
+
+        if passed:
+            message = f" No excessive repetition ({stats['token_count']} tokens)"
+        else:
+            details = ', '.join(f"{n}-grams {ratios[n]:.0%}" for n in exceeded)
+            message = f" Repetitive text: {details} repeated"
+
+        return {
+            'passed': passed,
+            'repeated_ratios': {n: ratios[n] for n in self.ngram_sizes},
+            'token_count': stats['token_count'],
+            'longest_run': stats['longest_run'],
+            'most_common_share': stats['most_common_share'],
+            'message': message
+        }
+
+    def evaluate_batch(self, responses):
+        """Evaluate many responses; returns one dict per response."""
+        return [self.evaluate(response) for response in responses]
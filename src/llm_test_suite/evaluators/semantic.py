@@ -1,24 +1,114 @@
 from sentence_transformers import SentenceTransformer
 import numpy as np
 
+from .embedding_cache import EmbeddingCache
+
 class SemanticSimilarityEvaluator:
     
-    def __init__(self, similarity_threshold=0.7):
+    def __init__(self, similarity_threshold=0.7, model_name='all-MiniLM-L6-v2',
+                 cache_size=1024, cache_dir=None):
        
         self.threshold = similarity_threshold
         print("Loading semantic model... (this may take a moment)")
        
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.model = SentenceTransformer(model_name)
         print("Semantic model loaded!")
         
+        # Reference answers repeat across models and runs; encode each text once
+        self.cache = EmbeddingCache(model_name, max_entries=cache_size, cache_dir=cache_dir,
+                                    normalized=True)
+        
     def evaluate(self, response, expected_answer):
         
-        embeddings = self.model.encode([response, expected_answer])
+        embeddings = self._encode([response, expected_answer])
         response_embedding = embeddings[0]
         expected_embedding = embeddings[1]
         
         similarity = self._cosine_similarity(response_embedding, expected_embedding)
         
+        return self._build_result(response, expected_answer, similarity)
+    
+    def evaluate_batch(self, responses, expected):
+        """
+        Evaluate many response/expected pairs at once.
+        
+        All texts go through a single encode call and similarities are computed
+        as one row-wise dot product of unit-length embeddings.
+        
+        Args:
+            responses: List of responses
+            expected: List of expected answers (same length), or one answer
+                shared by every response
+        
+        Returns:
+            List of result dicts, same format as evaluate()
+        """
+        if isinstance(expected, str):
+            expected = [expected] * len(responses)
+        if len(expected) != len(responses):
+            raise ValueError(f"Got {len(responses)} responses but {len(expected)} expected answers")
+        if not responses:
+            return []
+        
+        embeddings = self._encode(list(responses) + list(expected))
+        response_embeddings = embeddings[:len(responses)]
+        expected_embeddings = embeddings[len(responses):]
+        
+        similarities = np.einsum('ij,ij->i', response_embeddings, expected_embeddings)
+        
+        return [
+            self._build_result(response, expected_answer, similarity)
+            for response, expected_answer, similarity in zip(responses, expected, similarities)
+        ]
+    
+    def evaluate_references(self, responses, references):
+        """
+        Score responses against a set of acceptable reference answers.
+        
+        Builds one responses x references similarity matrix; a response passes
+        when its best-matching reference reaches the threshold.
+        
+        Args:
+            responses: A response or list of responses
+            references: List of acceptable answers for this test case
+        
+        Returns:
+            List of result dicts (one per response) with max/mean similarity
+            and the best-matching reference
+        """
+        if isinstance(responses, str):
+            responses = [responses]
+        if not references:
+            raise ValueError("At least one reference answer is required")
+        if not responses:
+            return []
+        
+        embeddings = self._encode(list(responses) + list(references))
+        similarity_matrix = embeddings[:len(responses)] @ embeddings[len(responses):].T
+        
+        best_indices = similarity_matrix.argmax(axis=1)
+        max_similarities = similarity_matrix.max(axis=1)
+        mean_similarities = similarity_matrix.mean(axis=1)
+        
+        results = []
+        for response, best_index, max_similarity, mean_similarity in zip(
+            responses, best_indices, max_similarities, mean_similarities
+        ):
+            best_reference = references[best_index]
+            result = self._build_result(response, best_reference, max_similarity)
+            result.update({
+                'max_similarity': float(max_similarity),
+                'mean_similarity': float(mean_similarity),
+                'best_reference': best_reference,
+                'best_reference_index': int(best_index),
+                'num_references': len(references)
+            })
+            results.append(result)
+        
+        return results
+    
+    def _build_result(self, response, expected_answer, similarity):
+        """Package a similarity score as an evaluation result."""
         passed = similarity >= self.threshold
         
         if passed:
@@ -35,6 +125,26 @@ class SemanticSimilarityEvaluator:
             'expected': expected_answer
         }
     
+    def _encode(self, texts):
+        """Embed texts as unit vectors, encoding only uncached ones (in one call)."""
+        embeddings = [self.cache.get(text) for text in texts]
+        
+        missing = list(dict.fromkeys(
+            text for text, embedding in zip(texts, embeddings) if embedding is None
+        ))
+        if missing:
+            # Normalized so cosine similarity is a plain dot product
+            encoded = dict(zip(missing, self.model.encode(missing, normalize_embeddings=True)))
+            for text, embedding in encoded.items():
+                # A row view would keep the whole batch matrix alive in the cache
+                self.cache.put(text, embedding.copy())
+            embeddings = [
+                encoded[text] if embedding is None else embedding
+                for text, embedding in zip(texts, embeddings)
+            ]
+        
+        return np.stack(embeddings)
+    
     def _cosine_similarity(self, vec1, vec2):
         """Calculate cosine similarity between two vectors."""
         dot_product = np.dot(vec1, vec2)
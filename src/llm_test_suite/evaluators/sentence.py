@@ -1,6 +1,12 @@
-import re
+import numpy as np
+
+from .analysis import as_analysis
+
+
 class SentenceEvaluator:
 
+    # evaluate() accepts a shared TextAnalysis as well as a plain string
+    accepts_analysis = True
     
     def __init__(self, max_sentences=2):
      
@@ -8,12 +14,45 @@ class SentenceEvaluator:
     
     def evaluate(self, response):
        
-        sentences = re.split(r'[.!?]+', response)
-       
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = as_analysis(response).sentences
+        
+        return self._build_result(sentences, len(sentences) <= self.max_sentences)
+    
+    def evaluate_batch(self, responses, as_columns=False):
+        """
+        Evaluate many responses in one pass.
+        
+        Args:
+            responses: List of responses
+            as_columns: Return a dict of columns instead of per-item dicts
+        
+        Returns:
+            List of dicts (same format as evaluate) or, with as_columns,
+            {'sentence_count': int array, 'passed': bool array,
+            'first_sentence': list}
+        """
+        all_sentences = [as_analysis(response).sentences for response in responses]
+        sentence_counts = np.fromiter(
+            (len(sentences) for sentences in all_sentences),
+            dtype=np.int64,
+            count=len(all_sentences)
+        )
+        passed = sentence_counts <= self.max_sentences
         
+        if as_columns:
+            return {
+                'sentence_count': sentence_counts,
+                'passed': passed,
+                'first_sentence': [sentences[0] if sentences else "" for sentences in all_sentences]
+            }
+        
+        return [
+            self._build_result(sentences, is_passed)
+            for sentences, is_passed in zip(all_sentences, passed.tolist())
+        ]
+    
+    def _build_result(self, sentences, passed):
         sentence_count = len(sentences)
-        passed = sentence_count <= self.max_sentences
         
         if passed:
             message = f" Good: {sentence_count} sentence(s)"
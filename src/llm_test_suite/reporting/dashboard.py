@@ -1,53 +1,274 @@
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+import io
 import json
 import os
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # Faster parsing when available; stdlib json otherwise
+    orjson = None
+
+from .trends import build_series, daily_buckets, detect_regressions, render_trends
+
+MANIFEST_NAME = ".dashboard_manifest.json"
+MANIFEST_VERSION = 3
+DEFAULT_PAGE_SIZE = 1000
+ROWS_PER_WRITE = 500
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+
+def _summarize_result(data, filename):
+    """Keep only the fields the dashboard renders."""
+    row = {
+        key: data[key]
+        for key in ('test_name', 'passed', 'message', 'timestamp', 'word_count', 'prompt')
+        if key in data
+    }
+    row['filename'] = filename
+    return row
+
+
+def _parse_result_file(path):
+    """
+    Parse one result file into its dashboard row and daily trend buckets.
+    
+    Runs in worker processes, so only the small summarized row and buckets
+    are sent back.
+    
+    Returns:
+        (row, buckets, None) on success or (None, [], error message) for
+        files that cannot be read or do not have the shape of a result
+    """
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if not isinstance(data, dict):
+            return None, [], "not a JSON object"
+        return _summarize_result(data, os.path.basename(path)), daily_buckets(data), None
+    except Exception as e:
+        # Malformed fields surface as TypeError, AttributeError, KeyError...;
+        # one bad file must not take down the whole dashboard
+        return None, [], f"{type(e).__name__}: {e}"
+
 
 class DashboardGenerator:
     
-    def __init__(self, results_dir="results"):
+    def __init__(self, results_dir="results", max_workers=None,
+                 regression_threshold=0.2, baseline_days=7):
+        """
+        Args:
+            results_dir: Directory with JSON result files
+            max_workers: Processes used to parse result files (None: one per
+                CPU, 1: parse in this process)
+            regression_threshold: Relative slowdown of the latest day's mean
+                latency over its baseline that is flagged (0.2 = 20%)
+            baseline_days: Days of history the baseline is taken from
+        """
         self.results_dir = results_dir
+        self.manifest_path = os.path.join(results_dir, MANIFEST_NAME)
+        self.max_workers = max_workers
+        self.regression_threshold = regression_threshold
+        self.baseline_days = baseline_days
+        self.load_errors = {}
+        self.regressions = []
         
-    def generate_dashboard(self):
+    def generate_dashboard(self, incremental=False, page_size=DEFAULT_PAGE_SIZE):
+        """
+        Build results_dir/dashboard.html from the JSON result files.
+        
+        Args:
+            incremental: Reuse the manifest of already-processed files and
+                only parse files that are new or changed (by mtime and size)
+            page_size: Results per HTML page; further pages are written as
+                dashboard_page_N.html (None puts everything on one page)
+        """
         # Find all JSON files
-        json_files = list(Path(self.results_dir).glob("*.json"))
+        json_files = [
+            path for path in Path(self.results_dir).glob("*.json")
+            if path.name != MANIFEST_NAME
+        ]
         
         if not json_files:
             return None
         
-        # Load all results
-        all_results = []
-        for json_file in json_files:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
-                data['filename'] = json_file.name
-                all_results.append(data)
+        manifest = self._load_manifest() if incremental else self._empty_manifest()
+        parsed = self._update_manifest(manifest, json_files)
+        if incremental:
+            self._save_manifest(manifest)
+            print(f"Parsed {parsed} new or changed of {len(json_files)} result files")
         
-        # Sort by timestamp (newest first)
-        all_results.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        self.load_errors = {
+            name: entry['error'] for name, entry in manifest['files'].items() if entry.get('error')
+        }
+        if self.load_errors:
+            print(f"⚠️  Skipped {len(self.load_errors)} unreadable result files:")
+            for name, error in sorted(self.load_errors.items()):
+                print(f"    {name}: {error}")
         
-        # Generate HTML
-        html = self._generate_html(all_results)
+        # Daily trends from the cached per-file buckets
+        series = build_series(entry.get('trend', []) for entry in manifest['files'].values())
+        self.regressions = detect_regressions(series, self.regression_threshold, self.baseline_days)
+        for r in self.regressions:
+            print(f"⚠️  Latency regression: {r['model']} / {r['test_name']} on {r['day']} "
+                  f"({r['latency']:.2f}s vs {r['baseline']:.2f}s, +{r['change']:.0%})")
+        
+        # Sort by timestamp (newest first)
+        all_results = [entry['row'] for entry in manifest['files'].values() if entry['row']]
+        all_results.sort(key=lambda x: str(x.get('timestamp', '')), reverse=True)
         
-        # Save dashboard
-        dashboard_path = os.path.join(self.results_dir, "dashboard.html")
-        with open(dashboard_path, 'w') as f:
-            f.write(html)
+        # Stream the HTML pages to disk
+        dashboard_path = self._write_pages(all_results, manifest['stats'], page_size,
+                                           render_trends(series, self.regressions))
         
         print(f"✅ Dashboard generated: {dashboard_path}")
         return dashboard_path
     
-    def _generate_html(self, results):
-        """Generate the HTML content."""
-        # Count statistics
-        total_tests = len(results)
-        passed_tests = sum(1 for r in results if r.get('passed', False))
+    def _update_manifest(self, manifest, json_files):
+        """
+        Bring the manifest in line with the files on disk.
+        
+        Unchanged files keep their cached rows and trend buckets; new or
+        modified files are
+        parsed and removed files dropped, with the aggregate counts adjusted
+        as rows come and go. Unreadable files are recorded with their error
+        and skipped until they change.
+        
+        Returns:
+            Number of files parsed
+        """
+        files = manifest['files']
+        stats = manifest['stats']
+        seen = set()
+        stale = []
+        
+        for json_file in json_files:
+            name = json_file.name
+            seen.add(name)
+            stat = json_file.stat()
+            entry = files.get(name)
+            if entry and entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+                continue
+            stale.append((json_file, stat))
+        
+        parsed = self._parse_files([str(json_file) for json_file, _ in stale])
+        for (json_file, stat), (row, trend, error) in zip(stale, parsed):
+            name = json_file.name
+            entry = files.get(name)
+            if entry:
+                self._count_row(stats, entry['row'], -1)
+            self._count_row(stats, row, 1)
+            files[name] = {'mtime': stat.st_mtime, 'size': stat.st_size, 'row': row, 'trend': trend}
+            if error:
+                files[name]['error'] = error
+        
+        for name in set(files) - seen:
+            self._count_row(stats, files.pop(name)['row'], -1)
+        
+        return len(stale)
+    
+    def _parse_files(self, paths):
+        """Parse result files, in a process pool when there are many."""
+        if self.max_workers == 1 or len(paths) < PARALLEL_MIN_FILES:
+            return [_parse_result_file(path) for path in paths]
+        
+        workers = self.max_workers or os.cpu_count() or 1
+        # Large chunks keep inter-process overhead low for small files
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_parse_result_file, paths, chunksize=chunksize))
+    
+    def _count_row(self, stats, row, sign):
+        if row is None:
+            return
+        stats['total'] += sign
+        if row.get('passed', False):
+            stats['passed'] += sign
+    
+    def _empty_manifest(self):
+        return {'version': MANIFEST_VERSION, 'files': {}, 'stats': {'total': 0, 'passed': 0}}
+    
+    def _load_manifest(self):
+        """Load the manifest, starting fresh if it is missing or outdated."""
+        try:
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return self._empty_manifest()
+        
+        if manifest.get('version') != MANIFEST_VERSION:
+            return self._empty_manifest()
+        return manifest
+    
+    def _save_manifest(self, manifest):
+        # Write then rename so an interrupted run can't leave a torn manifest
+        tmp_path = f"{self.manifest_path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+    
+    def _generate_html(self, results, stats=None):
+        """Generate the HTML content as a single page."""
+        out = io.StringIO()
+        self._write_html(out, results, self._compute_stats(results) if stats is None else stats)
+        return out.getvalue()
+    
+    def _write_pages(self, results, stats, page_size, trends=""):
+        """
+        Write the dashboard in pages of page_size rows.
+        
+        Page 1 is dashboard.html (with the trends section), later pages
+        dashboard_page_N.html. Pages left over from an earlier, longer run
+        are removed.
+        
+        Returns:
+            Path of the first page
+        """
+        num_pages = max(1, -(-len(results) // page_size)) if page_size else 1
+        page_size = page_size or max(1, len(results))
+        
+        for page in range(1, num_pages + 1):
+            rows = results[(page - 1) * page_size:page * page_size]
+            with open(self._page_path(page), 'w') as f:
+                self._write_html(f, rows, stats, page, num_pages,
+                                 trends if page == 1 else "")
+        
+        # Drop stale pages from a previous run with more results
+        page = num_pages + 1
+        while os.path.exists(self._page_path(page)):
+            os.remove(self._page_path(page))
+            page += 1
+        
+        return self._page_path(1)
+    
+    def _page_path(self, page):
+        filename = "dashboard.html" if page == 1 else f"dashboard_page_{page}.html"
+        return os.path.join(self.results_dir, filename)
+    
+    def _compute_stats(self, results):
+        """Total and passed counts in one pass."""
+        stats = {'total': 0, 'passed': 0}
+        for result in results:
+            self._count_row(stats, result, 1)
+        return stats
+    
+    def _write_html(self, out, results, stats, page=1, num_pages=1, trends=""):
+        """
+        Stream one dashboard page to a file-like object.
+        
+        Rows are rendered and written in chunks so memory use doesn't grow
+        with the size of the page.
+        """
+        total_tests = stats['total']
+        passed_tests = stats['passed']
         failed_tests = total_tests - passed_tests
+        nav = self._pagination(page, num_pages)
         
-        # Generate HTML
-        html = f"""
-<!DOCTYPE html>
+        out.write(f"""<!DOCTYPE html>
 <html>
 <head>
     <title>LLM Test Results Dashboard</title>
@@ -126,6 +347,35 @@ class DashboardGenerator:
             color: #6c757d;
             font-size: 14px;
         }}
+        .pagination {{
+            margin-bottom: 20px;
+        }}
+        .pagination a, .pagination span {{
+            margin-right: 8px;
+        }}
+        .trends {{
+            margin-bottom: 30px;
+        }}
+        .regressions {{
+            background-color: #fff3cd;
+            padding: 10px 20px;
+            border-radius: 5px;
+            margin-bottom: 15px;
+        }}
+        .trend-grid {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 15px;
+        }}
+        .trend-card {{
+            background-color: white;
+            padding: 10px;
+            border-radius: 5px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }}
+        .trend-card.regressed {{
+            border: 2px solid #dc3545;
+        }}
     </style>
 </head>
 <body>
@@ -149,6 +399,8 @@ class DashboardGenerator:
         </div>
     </div>
     
+    {trends}
+    {nav}
     <div class="results-table">
         <table>
             <thead>
@@ -161,24 +413,41 @@ class DashboardGenerator:
                 </tr>
             </thead>
             <tbody>
-"""
+""")
         
-        # Add each result
+        chunk = []
         for result in results:
-            status = "PASS" if result.get('passed', False) else "FAIL"
-            badge_class = "pass-badge" if result.get('passed', False) else "fail-badge"
-            message = result.get('message', 'No message')
-            timestamp = result.get('timestamp', 'N/A')
-            test_name = result.get('test_name', result.get('filename', 'Unknown'))
-            
-            # Extract details
-            details = []
-            if 'word_count' in result:
-                details.append(f"Words: {result['word_count']}")
-            if 'prompt' in result:
-                details.append(f"Prompt: {result['prompt'][:30]}...")
-            
-            html += f"""
+            chunk.append(self._render_row(result))
+            if len(chunk) >= ROWS_PER_WRITE:
+                out.write("".join(chunk))
+                chunk = []
+        out.write("".join(chunk))
+        
+        out.write(f"""
+            </tbody>
+        </table>
+    </div>
+    {nav}
+</body>
+</html>
+""")
+    
+    def _render_row(self, result):
+        """HTML table row for one result."""
+        status = "PASS" if result.get('passed', False) else "FAIL"
+        badge_class = "pass-badge" if result.get('passed', False) else "fail-badge"
+        message = escape(str(result.get('message', 'No message')))
+        timestamp = escape(str(result.get('timestamp', 'N/A')))
+        test_name = escape(str(result.get('test_name', result.get('filename', 'Unknown'))))
+        
+        # Extract details
+        details = []
+        if 'word_count' in result:
+            details.append(f"Words: {result['word_count']}")
+        if 'prompt' in result:
+            details.append(f"Prompt: {escape(str(result['prompt'])[:30])}...")
+        
+        return f"""
                 <tr>
                     <td><strong>{test_name}</strong></td>
                     <td><span class="{badge_class}">{status}</span></td>
@@ -187,13 +456,17 @@ class DashboardGenerator:
                     <td>{' | '.join(details)}</td>
                 </tr>
 """
+    
+    def _pagination(self, page, num_pages):
+        """Links to the other pages (empty for a single page)."""
+        if num_pages <= 1:
+            return ""
         
-        html += """
-            </tbody>
-        </table>
-    </div>
-</body>
-</html>
-"""
-        
-        return html
\ No newline at end of file
+        links = []
+        for number in range(1, num_pages + 1):
+            if number == page:
+                links.append(f"<span><strong>{number}</strong></span>")
+            else:
+                href = os.path.basename(self._page_path(number))
+                links.append(f'<a href="{href}">{number}</a>')
+        return f'<div class="pagination">Page {page} of {num_pages}: {" ".join(links)}</div>'
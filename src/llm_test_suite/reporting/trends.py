@@ -0,0 +1,196 @@
+# src/llm_test_suite/reporting/trends.py
+"""Daily performance trends and latency regression detection."""
+
+from html import escape
+
+from ..utils.records import iter_response_rows
+from ..utils.stats import percentile
+
+# Fields of a daily bucket, stored as plain lists so they fit in the manifest
+_COUNT, _PASSED, _JUDGED, _LATENCY_SUM, _LATENCY_COUNT, _TOKENS, _TOKEN_TIME = range(7)
+
+
+def daily_buckets(record):
+    """
+    Pre-aggregate a result record into per-model, per-test daily buckets.
+
+    Buckets are additive, so buckets from many files can be merged without
+    going back to the files.
+
+    Args:
+        record: Any result dictionary the suite writes
+
+    Returns:
+        List of [model, test_name, day, count, passed, judged, latency_sum,
+        latency_count, tokens, token_time]
+    """
+    buckets = {}
+    for row in iter_response_rows(record):
+        if not row['timestamp']:
+            continue
+        # Names go into HTML and sort together, so they must be strings
+        key = (str(row['model'] or '-'), str(row['test_name'] or '-'), row['timestamp'][:10])
+        bucket = buckets.setdefault(key, [0, 0, 0, 0.0, 0, 0, 0.0])
+        _add_row(bucket, row)
+
+    return [list(key) + values for key, values in buckets.items()]
+
+
+def _add_row(bucket, row):
+    bucket[_COUNT] += 1
+    if row['passed'] is not None:
+        bucket[_JUDGED] += 1
+        bucket[_PASSED] += int(bool(row['passed']))
+    if row['latency'] is not None and not row['error']:
+        bucket[_LATENCY_SUM] += row['latency']
+        bucket[_LATENCY_COUNT] += 1
+        if row['token_count'] is not None:
+            bucket[_TOKENS] += row['token_count']
+            bucket[_TOKEN_TIME] += row['latency']
+
+
+def build_series(bucket_lists):
+    """
+    Merge buckets and turn them into a daily time series per model and test.
+
+    Args:
+        bucket_lists: Iterable of bucket lists from daily_buckets
+
+    Returns:
+        Dictionary (model, test_name) -> list of points sorted by day, each
+        with day, count, pass_rate, mean_latency and tokens_per_second
+        (None where there was nothing to measure)
+    """
+    merged = {}
+    for buckets in bucket_lists:
+        for bucket in buckets:
+            key = tuple(bucket[:3])
+            values = merged.setdefault(key, [0, 0, 0, 0.0, 0, 0, 0.0])
+            for i, value in enumerate(bucket[3:]):
+                values[i] += value
+
+    series = {}
+    for (model, test_name, day), values in sorted(merged.items()):
+        series.setdefault((model, test_name), []).append({
+            'day': day,
+            'count': values[_COUNT],
+            'pass_rate': values[_PASSED] / values[_JUDGED] if values[_JUDGED] else None,
+            'mean_latency': (values[_LATENCY_SUM] / values[_LATENCY_COUNT]
+                             if values[_LATENCY_COUNT] else None),
+            'tokens_per_second': (values[_TOKENS] / values[_TOKEN_TIME]
+                                  if values[_TOKEN_TIME] else None)
+        })
+    return series
+
+
+def detect_regressions(series, threshold=0.2, baseline_days=7):
+    """
+    Flag series whose latest daily latency is well above its recent baseline.
+
+    The baseline is the median daily mean latency of up to baseline_days
+    days before the latest one.
+
+    Args:
+        series: Output of build_series
+        threshold: Relative slowdown that counts as a regression (0.2 = 20%)
+        baseline_days: Days of history to compare against
+
+    Returns:
+        List of dicts with model, test_name, day, latency, baseline and change
+    """
+    regressions = []
+    for (model, test_name), points in series.items():
+        timed = [point for point in points if point['mean_latency'] is not None]
+        if len(timed) < 2:
+            continue
+
+        latest = timed[-1]
+        baseline = percentile([p['mean_latency'] for p in timed[-baseline_days - 1:-1]], 50)
+        if not baseline:
+            continue
+
+        change = (latest['mean_latency'] - baseline) / baseline
+        if change > threshold:
+            regressions.append({
+                'model': model,
+                'test_name': test_name,
+                'day': latest['day'],
+                'latency': latest['mean_latency'],
+                'baseline': baseline,
+                'change': change
+            })
+
+    return sorted(regressions, key=lambda r: r['change'], reverse=True)
+
+
+def render_trends(series, regressions, max_charts=200):
+    """
+    HTML section with latency and pass-rate sparklines per model and test.
+
+    Args:
+        series: Output of build_series
+        regressions: Output of detect_regressions
+        max_charts: Cap on charts drawn (regressed series are drawn first)
+
+    Returns:
+        HTML string (empty when there is no time-series data)
+    """
+    if not series:
+        return ""
+
+    flagged = {(r['model'], r['test_name']): r for r in regressions}
+    keys = sorted(series, key=lambda key: (key not in flagged, key))[:max_charts]
+
+    parts = ['<div class="trends"><h2>Performance Trends (daily)</h2>']
+    if regressions:
+        parts.append('<div class="regressions"><strong>Latency regressions:</strong><ul>')
+        for r in regressions:
+            parts.append(
+                f"<li>{escape(str(r['model']))} / {escape(str(r['test_name']))} on {r['day']}: "
+                f"{r['latency']:.2f}s vs {r['baseline']:.2f}s baseline (+{r['change']:.0%})</li>"
+            )
+        parts.append('</ul></div>')
+
+    parts.append('<div class="trend-grid">')
+    for key in keys:
+        points = series[key]
+        latest = points[-1]
+        css_class = "trend-card regressed" if key in flagged else "trend-card"
+        tokens = latest['tokens_per_second']
+        pass_rate = latest['pass_rate']
+        parts.append(
+            f'<div class="{css_class}">'
+            f'<div><strong>{escape(str(key[0]))}</strong> / {escape(str(key[1]))}</div>'
+            f'{_sparkline([p["mean_latency"] for p in points], "#007bff")}'
+            f'{_sparkline([p["pass_rate"] for p in points], "#28a745", fixed_max=1.0)}'
+            f'<div class="timestamp">{points[0]["day"]} → {latest["day"]} | '
+            f'latency {_format(latest["mean_latency"], "{:.2f}s")} | '
+            f'{_format(tokens, "{:.1f} tok/s")} | '
+            f'pass {_format(pass_rate, "{:.0%}")}</div>'
+            '</div>'
+        )
+    parts.append('</div></div>')
+
+    return "\n".join(parts)
+
+
+def _format(value, template):
+    return "n/a" if value is None else template.format(value)
+
+
+def _sparkline(values, color, width=240, height=40, fixed_max=None):
+    """Inline SVG polyline of values (None gaps are skipped)."""
+    present = [(i, v) for i, v in enumerate(values) if v is not None]
+    if not present:
+        return ""
+
+    top = fixed_max if fixed_max is not None else max(v for _, v in present) or 1.0
+    step = width / max(1, len(values) - 1)
+    coordinates = " ".join(
+        f"{i * step:.1f},{height - (v / top) * (height - 4) - 2:.1f}" for i, v in present
+    )
+    return (
+        f'<svg width="{width}" height="{height}" class="sparkline">'
+        f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{coordinates}"/>'
+        '</svg>'
+    )
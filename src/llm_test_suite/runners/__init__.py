@@ -0,0 +1 @@
+"""Suite runner modules."""
@@ -0,0 +1,125 @@
+# src/llm_test_suite/runners/async_runner.py
+"""Pipelined suite execution: generation and evaluation overlap on executor threads."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Marks the end of the generated-results queue for an evaluation worker
+_DONE = object()
+
+
+class AsyncSuiteRunner:
+    """
+    Runs test cases through a generate stage and an evaluate stage concurrently.
+
+    Generation runs on one thread pool and evaluation on another, so CPU
+    evaluators and I/O for one test case overlap with model time for the
+    next. A bounded queue between the stages provides backpressure: when
+    evaluation falls behind, generation waits instead of piling up results.
+    """
+
+    def __init__(self, generate, evaluate=None, generation_concurrency=1,
+                 evaluation_concurrency=2, max_pending=4):
+        """
+        Initialize the runner.
+
+        Args:
+            generate: Blocking callable test_case -> result
+            evaluate: Optional blocking callable (test_case, result) -> result
+            generation_concurrency: Test cases generating at the same time
+                (keep at 1 for a single in-process model)
+            evaluation_concurrency: Results being evaluated at the same time
+            max_pending: Generated results allowed to wait for evaluation
+                before generation pauses
+        """
+        if generation_concurrency < 1 or evaluation_concurrency < 1 or max_pending < 1:
+            raise ValueError("Concurrency limits and max_pending must be at least 1")
+
+        self.generate = generate
+        self.evaluate = evaluate
+        self.generation_concurrency = generation_concurrency
+        self.evaluation_concurrency = evaluation_concurrency
+        self.max_pending = max_pending
+
+    def run(self, test_cases, on_result=None, keep_results=True):
+        """
+        Run the suite from synchronous code.
+
+        Args:
+            test_cases: Iterable of test cases (consumed lazily)
+            on_result: Optional callable (index, test_case, result), called in
+                test case order as soon as each result and all earlier ones
+                are done
+            keep_results: Collect the results for the return value. Turn off
+                when on_result writes them out, so that only results waiting
+                for an earlier one stay in memory
+
+        Returns:
+            List of results in test case order (empty without keep_results)
+        """
+        return asyncio.run(self.run_async(test_cases, on_result, keep_results))
+
+    async def run_async(self, test_cases, on_result=None, keep_results=True):
+        """Coroutine version of run()."""
+        loop = asyncio.get_running_loop()
+        cases = enumerate(test_cases)
+        queue = asyncio.Queue(maxsize=self.max_pending)
+        results = {}
+        kept = []
+        next_index = 0
+
+        def emit_ready():
+            # Hand results to on_result in order, whatever order they finish in
+            nonlocal next_index
+            while next_index in results:
+                test_case, result = results.pop(next_index)
+                if on_result is not None:
+                    on_result(next_index, test_case, result)
+                if keep_results:
+                    kept.append(result)
+                next_index += 1
+
+        async def generation_worker(executor):
+            # Workers share one iterator, so test cases are read only as needed
+            for index, test_case in cases:
+                result = await loop.run_in_executor(executor, self.generate, test_case)
+                await queue.put((index, test_case, result))
+
+        async def evaluation_worker(executor):
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    return
+                index, test_case, result = item
+                if self.evaluate is not None:
+                    result = await loop.run_in_executor(executor, self.evaluate, test_case, result)
+                results[index] = (test_case, result)
+                emit_ready()
+
+        with ThreadPoolExecutor(self.generation_concurrency, thread_name_prefix="generate") as gen_pool, \
+                ThreadPoolExecutor(self.evaluation_concurrency, thread_name_prefix="evaluate") as eval_pool:
+            generators = [
+                asyncio.ensure_future(generation_worker(gen_pool))
+                for _ in range(self.generation_concurrency)
+            ]
+            evaluators = [
+                asyncio.ensure_future(evaluation_worker(eval_pool))
+                for _ in range(self.evaluation_concurrency)
+            ]
+
+            async def finish_generation():
+                await asyncio.gather(*generators)
+                for _ in evaluators:
+                    await queue.put(_DONE)
+
+            tasks = generators + evaluators + [asyncio.ensure_future(finish_generation())]
+            # Stop at the first failure in either stage; otherwise a stage
+            # could wait forever on a queue the failed stage no longer serves
+            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            for task in done:
+                if task.exception() is not None:
+                    raise task.exception()
+
+        return kept
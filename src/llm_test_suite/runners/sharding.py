@@ -0,0 +1,125 @@
+# src/llm_test_suite/runners/sharding.py
+"""Split a test suite into deterministic shards and merge the shard results."""
+
+import hashlib
+from datetime import datetime
+
+
+def parse_shard(spec):
+    """
+    Parse a shard spec of the form "i/N".
+
+    Args:
+        spec: Shard index and shard count, e.g. "0/4" for the first of four
+            shards (indices run from 0 to N-1)
+
+    Returns:
+        (index, count) tuple
+    """
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"Shard spec {spec!r} is not of the form i/N") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Shard spec {spec!r}: need N >= 1 and 0 <= i < N")
+    return index, count
+
+
+def case_id(test_case, index):
+    """Id a test case is sharded by: its 'id', else its position in the suite."""
+    return str(test_case.get("id") or f"case-{index}")
+
+
+def shard_of(test_id, num_shards):
+    """
+    Shard a test id belongs to.
+
+    Uses sha256 rather than hash(), which is salted per process, so every
+    worker and machine assigns the same ids to the same shards.
+    """
+    digest = hashlib.sha256(test_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % num_shards
+
+
+def iter_shard(test_cases, shard_index, num_shards):
+    """
+    Yield the test cases of one shard, lazily.
+
+    Each yielded case is a copy with a "case_index" key (its position in the
+    full suite), which run_test_suite carries into the result so that
+    merge_shard_results can restore the single-process order.
+
+    Args:
+        test_cases: Iterable of test-case dicts (the full suite)
+        shard_index: Shard to keep, 0 <= shard_index < num_shards
+        num_shards: Total number of shards
+    """
+    for index, test_case in enumerate(test_cases):
+        if shard_of(case_id(test_case, index), num_shards) == shard_index:
+            yield dict(test_case, case_index=index)
+
+
+def suite_summary(passed, total):
+    """Summary block of a run_test_suite result from its pass counts."""
+    return {
+        "total_tests": total,
+        "passed": passed,
+        "failed": total - passed,
+        "pass_rate": f"{(passed/total)*100 if total else 0:.1f}%",
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+def merge_shard_results(shard_results):
+    """
+    Combine the run_test_suite results of all shards of a run.
+
+    Args:
+        shard_results: Results of every shard, each with a "shard" entry
+            {"index": i, "count": N} as written by a sharded run. A shard
+            that was re-run may appear more than once; its newest result
+            (by summary timestamp) is used
+
+    Returns:
+        A run_test_suite result equal to what a single process running the
+        whole suite would return. The summary adds up the shard summaries,
+        so shards whose results were streamed to an on_result sink (and have
+        no completion_tests) merge too
+    """
+    if not shard_results:
+        raise ValueError("No shard results to merge")
+
+    count = shard_results[0]["shard"]["count"]
+    if any(r["shard"]["count"] != count for r in shard_results):
+        raise ValueError("Shard results come from runs with different shard counts")
+
+    # Retrying a failed shard is routine; the latest attempt wins
+    newest = {}
+    for r in shard_results:
+        index = r["shard"]["index"]
+        if index not in newest or r["summary"]["timestamp"] > newest[index]["summary"]["timestamp"]:
+            newest[index] = r
+    missing = sorted(set(range(count)) - set(newest))
+    if missing:
+        raise ValueError(f"Incomplete shard set for {count} shards: missing {missing}")
+    shard_results = [newest[index] for index in range(count)]
+    models = {r["model"] for r in shard_results}
+    if len(models) > 1:
+        raise ValueError(f"Shard results come from different models: {sorted(models)}")
+
+    completion_tests = sorted(
+        (dict(test) for r in shard_results for test in r["completion_tests"]),
+        key=lambda test: test["case_index"]
+    )
+    for test in completion_tests:
+        del test["case_index"]
+
+    return {
+        "model": shard_results[0]["model"],
+        "completion_tests": completion_tests,
+        "consistency_tests": [test for r in shard_results for test in r["consistency_tests"]],
+        "summary": suite_summary(
+            sum(r["summary"]["passed"] for r in shard_results),
+            sum(r["summary"]["total_tests"] for r in shard_results)
+        )
+    }
@@ -0,0 +1,32 @@
+# src/llm_test_suite/utils/cache_files.py
+"""File layout shared by the on-disk caches (responses, embeddings)."""
+
+import os
+import threading
+
+
+def entry_path(cache_dir, key, suffix):
+    """
+    Path of the cache file for a hex key.
+
+    Entries are fanned out over subdirectories named by the key's first two
+    characters, which keeps directories small.
+    """
+    return os.path.join(cache_dir, key[:2], f"{key}{suffix}")
+
+
+def atomic_write(path, write, mode="w"):
+    """
+    Write a file and rename it into place, so readers never see a partial file.
+
+    Args:
+        path: Destination path (parent directories are created)
+        write: Called with the open temporary file
+        mode: File mode, "w" or "wb"
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Unique per writer, so concurrent puts of the same entry don't collide
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, mode) as f:
+        write(f)
+    os.replace(tmp_path, path)
@@ -0,0 +1,174 @@
+# src/llm_test_suite/utils/columnar.py
+"""Columnar export of per-response metrics for large-scale analysis."""
+
+import math
+import os
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pa_parquet
+except ImportError:  # Parquet/Arrow output is optional; .npz is the fallback
+    pa = None
+
+_FORMATS_BY_SUFFIX = {
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".npz": "npz",
+}
+
+_STRING_COLUMNS = ("run_id", "test_name", "model", "prompt", "timestamp")
+
+
+def rows_to_columns(rows):
+    """
+    Turn flat response rows into typed columns.
+
+    Evaluator results become ``eval_<name>_passed`` / ``eval_<name>_score``
+    columns. Missing values are None at this stage.
+
+    Args:
+        rows: Iterable of rows from ``records.iter_response_rows`` (or
+            ``SqliteResultStore.query``)
+
+    Returns:
+        Dictionary of column name -> list of values
+    """
+    columns = {name: [] for name in _STRING_COLUMNS}
+    columns.update({"passed": [], "error": [], "latency": [], "token_count": [],
+                    "tokens_per_second": []})
+    count = 0
+
+    for row in rows:
+        for name in _STRING_COLUMNS:
+            columns[name].append(row.get(name))
+        columns["passed"].append(row.get("passed"))
+        columns["error"].append(bool(row.get("error")))
+        latency = row.get("latency")
+        token_count = row.get("token_count")
+        columns["latency"].append(latency)
+        columns["token_count"].append(token_count)
+        columns["tokens_per_second"].append(
+            token_count / latency if latency and token_count is not None else None
+        )
+
+        for evaluator, result in (row.get("evaluations") or {}).items():
+            for field in ("passed", "score"):
+                column = columns.setdefault(f"eval_{evaluator}_{field}", [None] * count)
+                column.append(result.get(field))
+        count += 1
+        # Evaluator columns this row didn't have
+        for column in columns.values():
+            if len(column) < count:
+                column.append(None)
+
+    return columns
+
+
+def export_columnar(rows, filepath, format=None):
+    """
+    Write response rows to a columnar file.
+
+    Parquet and Arrow IPC need pyarrow; without it the data is written as
+    NumPy ``.npz`` next to the requested path instead.
+
+    Args:
+        rows: Iterable of flat response rows
+        filepath: Output path; the suffix picks the format unless given
+        format: "parquet", "arrow" or "npz"
+
+    Returns:
+        Path actually written
+    """
+    format = format or _FORMATS_BY_SUFFIX.get(os.path.splitext(filepath)[1], "parquet")
+    if format not in ("parquet", "arrow", "npz"):
+        raise ValueError(f"Unknown columnar format: {format!r}")
+
+    if format != "npz" and pa is None:
+        filepath = os.path.splitext(filepath)[0] + ".npz"
+        print(f"⚠️  pyarrow not installed, writing NumPy archive instead: {filepath}")
+        format = "npz"
+
+    columns = rows_to_columns(rows)
+    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
+
+    if format == "npz":
+        # Uncompressed so loading is a straight read
+        np.savez(filepath, **{name: _to_numpy(name, values) for name, values in columns.items()})
+    else:
+        table = pa.table({name: _to_arrow(name, values) for name, values in columns.items()})
+        if format == "parquet":
+            pa_parquet.write_table(table, filepath)
+        else:
+            with pa_ipc.new_file(filepath, table.schema) as writer:
+                writer.write_table(table)
+
+    print(f"✅ Exported {len(columns['model'])} rows to: {filepath}")
+    return filepath
+
+
+def load_columnar(filepath):
+    """
+    Load an exported file as a dictionary of NumPy arrays.
+
+    Arrow IPC files are memory-mapped, so numeric columns are not copied
+    into memory until used.
+
+    Args:
+        filepath: File written by export_columnar
+
+    Returns:
+        Dictionary of column name -> numpy array
+    """
+    format = _FORMATS_BY_SUFFIX.get(os.path.splitext(filepath)[1])
+
+    if format == "npz":
+        with np.load(filepath) as archive:
+            return {name: archive[name] for name in archive.files}
+
+    if pa is None:
+        raise ImportError(f"Reading {filepath} needs pyarrow")
+
+    if format == "arrow":
+        table = pa_ipc.open_file(pa.memory_map(filepath, "r")).read_all()
+    else:
+        table = pa_parquet.read_table(filepath, memory_map=True)
+    return {name: table.column(name).to_numpy() for name in table.column_names}
+
+
+def _column_kind(name):
+    if name in _STRING_COLUMNS:
+        return "string"
+    if name == "token_count":
+        return "int"
+    if name in ("passed", "error") or name.endswith("_passed"):
+        return "bool"
+    return "float"
+
+
+def _to_numpy(name, values):
+    """NumPy has no nulls: '' for strings, -1 for counts and flags, NaN for floats."""
+    kind = _column_kind(name)
+    if kind == "string":
+        return np.array(["" if v is None else str(v) for v in values], dtype=str)
+    if kind == "int":
+        return np.array([-1 if v is None else v for v in values], dtype=np.int64)
+    if kind == "bool":
+        return np.array([-1 if v is None else int(v) for v in values], dtype=np.int8)
+    return np.array([math.nan if v is None else v for v in values], dtype=np.float64)
+
+
+def _to_arrow(name, values):
+    kind = _column_kind(name)
+    arrow_type = {
+        "string": pa.string(),
+        "int": pa.int64(),
+        "bool": pa.bool_(),
+        "float": pa.float64(),
+    }[kind]
+    if kind == "string":
+        values = [None if v is None else str(v) for v in values]
+    return pa.array(values, type=arrow_type)
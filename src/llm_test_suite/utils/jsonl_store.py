@@ -0,0 +1,125 @@
+# src/llm_test_suite/utils/jsonl_store.py
+"""Append-only JSON Lines storage for test results."""
+
+import gzip
+import io
+import json
+import os
+
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional
+    zstandard = None
+
+
+COMPRESSION_SUFFIXES = {
+    None: "",
+    "gzip": ".gz",
+    "zstd": ".zst",
+}
+
+
+class JsonlResultStore:
+    """Appends one JSON record per line to a (optionally compressed) file."""
+
+    def __init__(self, filepath, compression=None, buffer_size=64 * 1024):
+        """
+        Initialize the store. The file is opened on the first write.
+
+        Args:
+            filepath: File to append to
+            compression: None, "gzip" or "zstd"
+            buffer_size: Bytes to buffer in memory before writing
+        """
+        if compression not in COMPRESSION_SUFFIXES:
+            raise ValueError(f"Unknown compression: {compression!r}")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstd compression needs the 'zstandard' package")
+
+        self.filepath = filepath
+        self.compression = compression
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._raw = None
+
+    def write(self, record):
+        """Queue a record; it reaches disk once the buffer fills or on flush."""
+        line = (json.dumps(record, default=str) + "\n").encode("utf-8")
+        self._buffer.append(line)
+        self._buffered_bytes += len(line)
+
+        if self._buffered_bytes >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered records to the file."""
+        if not self._buffer:
+            return
+
+        if self._raw is None:
+            os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
+            self._raw = open(self.filepath, "ab")
+
+        data = b"".join(self._buffer)
+        # Each flush is a complete gzip member / zstd frame, so the file stays
+        # readable while the run is still appending to it
+        if self.compression == "gzip":
+            with gzip.GzipFile(fileobj=self._raw, mode="ab") as writer:
+                writer.write(data)
+        elif self.compression == "zstd":
+            with zstandard.ZstdCompressor().stream_writer(self._raw, closefd=False) as writer:
+                writer.write(data)
+        else:
+            self._raw.write(data)
+        self._raw.flush()
+
+        self._buffer = []
+        self._buffered_bytes = 0
+
+    def close(self):
+        """Flush and fsync the file."""
+        self.flush()
+        if self._raw is None:
+            return
+
+        os.fsync(self._raw.fileno())
+        self._raw.close()
+        self._raw = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        """Iterate over records already on disk."""
+        return iter_jsonl(self.filepath)
+
+
+def iter_jsonl(filepath):
+    """
+    Stream records from a JSON Lines file, compressed or not.
+
+    The compression is inferred from the file extension (.gz or .zst).
+
+    Args:
+        filepath: File to read
+
+    Yields:
+        One dictionary per line
+    """
+    with open(filepath, "rb") as raw:
+        if filepath.endswith(".gz"):
+            stream = gzip.GzipFile(fileobj=raw, mode="rb")
+        elif filepath.endswith(".zst"):
+            if zstandard is None:
+                raise ImportError("Reading .zst files needs the 'zstandard' package")
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True)
+        else:
+            stream = raw
+
+        for line in io.TextIOWrapper(stream, encoding="utf-8"):
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,128 @@
+# src/llm_test_suite/utils/records.py
+"""Flatten the different result shapes into one row per model response."""
+
+from datetime import datetime
+
+# Evaluator fields that carry a numeric score, in order of preference
+_SCORE_KEYS = ('quality_score', 'similarity_score', 'max_similarity')
+
+_TIMESTAMP_FORMATS = ("%Y%m%d_%H%M%S_%f", "%Y%m%d_%H%M%S")
+
+
+def normalize_timestamp(value):
+    """
+    Convert the timestamp formats used across the suite to ISO 8601.
+
+    Handles ``20240115_143022`` style stamps (ResultsManager, comparator)
+    and isoformat strings (LLMTester). Unknown string formats are returned
+    as-is; values that are not strings (e.g. epoch numbers) become None.
+
+    Args:
+        value: Timestamp string or None
+
+    Returns:
+        ISO 8601 string, or None
+    """
+    if not value or not isinstance(value, str):
+        return None
+
+    for fmt in _TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).isoformat()
+        except ValueError:
+            pass
+
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        return value
+
+
+def _evaluation_summary(evaluations):
+    """Reduce evaluator results to {name: {'passed', 'score'}}."""
+    summary = {}
+    for name, result in (evaluations or {}).items():
+        score = next((result[key] for key in _SCORE_KEYS if key in result), None)
+        summary[name] = {'passed': result.get('passed'), 'score': score}
+    return summary
+
+
+def _row(test_name, model, prompt, passed, timestamp, latency=None,
+         token_count=None, evaluations=None, error=False):
+    return {
+        'test_name': test_name,
+        'model': model,
+        'prompt': prompt,
+        'passed': passed,
+        'timestamp': normalize_timestamp(timestamp),
+        'latency': latency,
+        'token_count': token_count,
+        'evaluations': _evaluation_summary(evaluations),
+        'error': error
+    }
+
+
+def iter_response_rows(record, default_test_name=None):
+    """
+    Yield one flat row per model response contained in a result record.
+
+    Understands ModelComparator suites and single comparisons, LLMTester
+    suite output, ResultsManager suite summaries and single evaluation
+    results.
+
+    Args:
+        record: A result dictionary as written by any part of the suite
+        default_test_name: Test name to use when the record has none
+
+    Yields:
+        Dictionaries with test_name, model, prompt, passed, timestamp (ISO),
+        latency, token_count, evaluations and error
+    """
+    test_name = record.get('test_name', default_test_name)
+
+    # ModelComparator.run_comparison_suite
+    if 'test_results' in record:
+        for test_result in record['test_results']:
+            yield from iter_response_rows(test_result, test_name)
+        return
+
+    # ModelComparator.compare_single_prompt / compare_with_evaluators
+    if 'model_responses' in record:
+        for model_name, response in record['model_responses'].items():
+            evaluations = response.get('evaluations')
+            if response.get('error'):
+                passed = False
+            elif evaluations:
+                passed = all(result.get('passed', False) for result in evaluations.values())
+            else:
+                passed = None
+            yield _row(test_name, model_name, record.get('prompt'), passed,
+                       record.get('timestamp'), response.get('generation_time'),
+                       response.get('token_count'), evaluations, bool(response.get('error')))
+        return
+
+    # LLMTester.run_test_suite
+    if 'completion_tests' in record:
+        model_name = record.get('model')
+        for test in record['completion_tests']:
+            yield _row(test.get('test_name', test.get('category', test_name)), model_name,
+                       test.get('prompt'), test.get('all_passed'), test.get('timestamp'),
+                       test.get('time_taken'), test.get('token_count'),
+                       test.get('evaluations'), 'error' in test)
+        return
+
+    # ResultsManager.save_multiple_results
+    if isinstance(record.get('results'), list):
+        for result in record['results']:
+            result = dict(result)
+            result.setdefault('timestamp', record.get('timestamp'))
+            yield from iter_response_rows(result, test_name)
+        return
+
+    # ResultsManager.save_result: a single evaluation, possibly with metadata
+    latency = next((record[key] for key in ('generation_time', 'time_taken', 'duration')
+                    if key in record), None)
+    passed = record.get('passed', record.get('all_passed'))
+    yield _row(test_name, record.get('model'), record.get('prompt'), passed,
+               record.get('timestamp'), latency, record.get('token_count'),
+               record.get('evaluations'), 'error' in record)
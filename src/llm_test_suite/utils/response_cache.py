@@ -0,0 +1,96 @@
+# src/llm_test_suite/utils/response_cache.py
+"""On-disk cache of generated responses, so evaluators can be re-run without the model."""
+
+import hashlib
+import json
+import os
+
+from .cache_files import atomic_write, entry_path
+
+
+def resolve_revision(model_name):
+    """
+    Commit hash of a Hugging Face model, read from its (locally cached) config.
+
+    Only config.json is fetched, so this is cheap compared to loading the
+    model. Local checkpoints and offline misses return None.
+
+    Args:
+        model_name: Hugging Face model name or path
+
+    Returns:
+        Revision string, or None if it cannot be determined
+    """
+    try:
+        from transformers import AutoConfig
+        return getattr(AutoConfig.from_pretrained(model_name), "_commit_hash", None)
+    except Exception:
+        return None
+
+
+class ResponseCache:
+    """Generated responses keyed on model, revision, prompt, generation kwargs and seed."""
+
+    def __init__(self, cache_dir, revisions=None, lookup_revisions=True):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for the cached responses (.json files)
+            revisions: Optional {model_name: revision} overriding the
+                revision looked up from the model config
+            lookup_revisions: Look up models missing from revisions on the
+                Hugging Face Hub. Turn off for models that are not Hub
+                checkpoints (e.g. served over HTTP); they get no revision
+        """
+        self.cache_dir = cache_dir
+        self._revisions = dict(revisions or {})
+        self.lookup_revisions = lookup_revisions
+        self.hits = 0
+        self.misses = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def revision(self, model_name):
+        """Revision used in keys for model_name (looked up once per model)."""
+        if model_name not in self._revisions:
+            self._revisions[model_name] = (
+                resolve_revision(model_name) if self.lookup_revisions else None
+            )
+        return self._revisions[model_name]
+
+    def key(self, model_name, prompt, generation_kwargs, seed=None):
+        """Cache key: hash of the canonical JSON of everything that determines the output."""
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "revision": self.revision(model_name),
+                "prompt": prompt,
+                "generation_kwargs": generation_kwargs,
+                "seed": seed,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, model_name, prompt, generation_kwargs, seed=None):
+        """Return the cached response dictionary, or None."""
+        path = self._path(self.key(model_name, prompt, generation_kwargs, seed))
+        try:
+            with open(path, "r") as f:
+                response = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return response
+
+    def put(self, model_name, prompt, generation_kwargs, seed, response):
+        """Store a response dictionary."""
+        path = self._path(self.key(model_name, prompt, generation_kwargs, seed))
+        atomic_write(path, lambda f: json.dump(response, f, default=str))
+
+    def _path(self, key):
+        return entry_path(self.cache_dir, key, ".json")
@@ -1,24 +1,61 @@
 # src/llm_test_suite/utils/results_manager.py
 """Simple results manager to save test results."""
 
+import atexit
+import glob
 import json
 import os
 from datetime import datetime
 
+from .columnar import export_columnar
+from .jsonl_store import COMPRESSION_SUFFIXES, JsonlResultStore, iter_jsonl
+from .records import iter_response_rows
+from .sqlite_store import SqliteResultStore
+
 
 class ResultsManager:
     """Handles saving test results to files."""
     
-    def __init__(self, results_dir="results"):
+    def __init__(self, results_dir="results", storage="json", compression=None, run_id=None):
         """
         Initialize results manager.
         
         Args:
             results_dir: Where to save results
+            storage: "json" writes one file per result; "jsonl" appends
+                every result of this run to a single JSON Lines file;
+                "sqlite" adds indexed rows to results_dir/results.db
+            compression: For jsonl storage: None, "gzip" or "zstd"
+            run_id: Identifies this run in jsonl/sqlite storage (default: timestamp)
+        
+        jsonl and sqlite storage buffer writes until close(). Use the manager
+        as a context manager or call close(); buffered results are also
+        flushed when the interpreter exits.
         """
+        if storage not in ("json", "jsonl", "sqlite"):
+            raise ValueError(f"Unknown storage: {storage!r}")
+        if compression is not None and storage != "jsonl":
+            raise ValueError(f"compression is only supported with storage=\"jsonl\", not {storage!r}")
+        
         self.results_dir = results_dir
+        self.storage = storage
+        self.run_id = run_id or datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         # Create directory if it doesn't exist
         os.makedirs(results_dir, exist_ok=True)
+        
+        self._store = None
+        if storage == "jsonl":
+            filename = f"run_{self.run_id}.jsonl{COMPRESSION_SUFFIXES.get(compression, '')}"
+            self._store = JsonlResultStore(os.path.join(results_dir, filename), compression)
+        
+        self._db = None
+        if storage == "sqlite":
+            self._db = SqliteResultStore(os.path.join(results_dir, "results.db"))
+        
+        self._closed = False
+        if self._store is not None or self._db is not None:
+            # Don't lose the last buffer of a script that never calls close()
+            atexit.register(self.close)
     
     def save_result(self, test_name, evaluation_result):
         """
@@ -31,14 +68,22 @@ class ResultsManager:
         # Create timestamp for unique filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Create filename
-        filename = f"{test_name}_{timestamp}.json"
-        filepath = os.path.join(self.results_dir, filename)
-        
         # Add timestamp to results
         evaluation_result['timestamp'] = timestamp
         evaluation_result['test_name'] = test_name
         
+        if self._store is not None:
+            # Buffered append; no per-result message for large runs
+            self._store.write(evaluation_result)
+            return self._store.filepath
+        
+        if self._db is not None:
+            self._db.write(evaluation_result, self.run_id)
+            return self._db.db_path
+        
+        # Create filename
+        filepath = self._unique_path(f"{test_name}_{timestamp}")
+        
         # Save to file
         with open(filepath, 'w') as f:
             json.dump(evaluation_result, f, indent=2)
@@ -57,10 +102,6 @@ class ResultsManager:
         # Create timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Create filename
-        filename = f"{test_name}_suite_{timestamp}.json"
-        filepath = os.path.join(self.results_dir, filename)
-        
         # Create summary
         summary = {
             'test_name': test_name,
@@ -71,9 +112,126 @@ class ResultsManager:
             'results': all_results
         }
         
+        if self._store is not None:
+            self._store.write(summary)
+            self._store.flush()
+            print(f" Test suite results appended to: {self._store.filepath}")
+            return self._store.filepath
+        
+        if self._db is not None:
+            self._db.write(summary, self.run_id)
+            self._db.flush()
+            print(f" Test suite results stored in: {self._db.db_path}")
+            return self._db.db_path
+        
+        # Create filename
+        filepath = self._unique_path(f"{test_name}_suite_{timestamp}")
+        
         # Save to file
         with open(filepath, 'w') as f:
             json.dump(summary, f, indent=2)
         
         print(f" Test suite results saved to: {filepath}")
-        return filepath
\ No newline at end of file
+        return filepath
+    
+    def iter_results(self):
+        """
+        Iterate over every stored record in results_dir.
+        
+        Reads both per-result JSON files and JSON Lines run files.
+        
+        Yields:
+            Result dictionaries
+        """
+        for filepath in sorted(glob.glob(os.path.join(self.results_dir, "*.json"))):
+            with open(filepath, 'r') as f:
+                yield json.load(f)
+        
+        if self._store is not None:
+            self._store.flush()
+        for pattern in ("*.jsonl", "*.jsonl.gz", "*.jsonl.zst"):
+            for filepath in sorted(glob.glob(os.path.join(self.results_dir, pattern))):
+                yield from iter_jsonl(filepath)
+    
+    def export_columnar(self, filepath, format=None):
+        """
+        Export per-response metrics as typed columns.
+        
+        Writes Parquet or Arrow IPC when pyarrow is installed, otherwise a
+        NumPy .npz archive.
+        
+        Args:
+            filepath: Output file (.parquet, .arrow or .npz)
+            format: Override the format implied by the suffix
+        
+        Returns:
+            Path actually written
+        """
+        if self._db is not None:
+            rows = self._db.query(order_by="id")
+        else:
+            rows = (row for record in self.iter_results() for row in iter_response_rows(record))
+        return export_columnar(rows, filepath, format)
+    
+    def query(self, **filters):
+        """
+        Fetch stored result rows (sqlite storage).
+        
+        Args:
+            **filters: See SqliteResultStore.query
+        
+        Returns:
+            List of row dictionaries
+        """
+        return self._require_db().query(**filters)
+    
+    def aggregate(self, group_by=("model",), **filters):
+        """
+        Pass rate and latency statistics per group (sqlite storage).
+        
+        Args:
+            group_by: Columns to group on
+            **filters: See SqliteResultStore.aggregate
+        """
+        return self._require_db().aggregate(group_by, **filters)
+    
+    def import_json_results(self, directory=None):
+        """
+        Load existing JSON/JSONL result files into the database (sqlite storage).
+        
+        Args:
+            directory: Directory to import (default: results_dir)
+        """
+        return self._require_db().import_json_files(directory or self.results_dir)
+    
+    def close(self):
+        """Flush and fsync the run file (jsonl) or commit the database (sqlite)."""
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        if self._store is not None:
+            self._store.close()
+        if self._db is not None:
+            self._db.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def _require_db(self):
+        if self._db is None:
+            raise ValueError("Queries need ResultsManager(storage=\"sqlite\")")
+        return self._db
+    
+    def _unique_path(self, stem):
+        """Path for stem.json, numbered if a file with that name exists."""
+        filepath = os.path.join(self.results_dir, f"{stem}.json")
+        counter = 1
+        # Timestamps have one-second resolution, so names can collide
+        while os.path.exists(filepath):
+            filepath = os.path.join(self.results_dir, f"{stem}_{counter}.json")
+            counter += 1
+        return filepath
@@ -0,0 +1,260 @@
+# src/llm_test_suite/utils/sqlite_store.py
+"""Indexed SQLite storage for test results."""
+
+import glob
+import json
+import os
+import sqlite3
+
+from .jsonl_store import iter_jsonl
+from .records import iter_response_rows
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT,
+    test_name TEXT,
+    model TEXT,
+    passed INTEGER,
+    timestamp TEXT,
+    latency REAL,
+    token_count INTEGER,
+    error INTEGER,
+    prompt TEXT,
+    evaluations TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_run_id ON results (run_id);
+CREATE INDEX IF NOT EXISTS idx_results_test_name ON results (test_name);
+CREATE INDEX IF NOT EXISTS idx_results_model ON results (model, timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_passed ON results (passed);
+CREATE INDEX IF NOT EXISTS idx_results_timestamp ON results (timestamp);
+CREATE INDEX IF NOT EXISTS idx_results_latency ON results (latency);
+"""
+
+# Columns callers may filter and group on
+_FILTER_COLUMNS = ('run_id', 'test_name', 'model', 'passed', 'error')
+_GROUP_COLUMNS = ('run_id', 'test_name', 'model', 'passed', 'error', 'day')
+
+
+class SqliteResultStore:
+    """Stores one row per model response with indexed query columns."""
+
+    def __init__(self, db_path, commit_every=500):
+        """
+        Open (or create) the database.
+
+        Args:
+            db_path: SQLite database file
+            commit_every: Rows inserted per transaction
+        """
+        self.db_path = db_path
+        self.commit_every = commit_every
+        self._pending = 0
+
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(_SCHEMA)
+
+    def write(self, record, run_id=None):
+        """
+        Store a result record (any shape the suite produces).
+
+        Args:
+            record: Result dictionary
+            run_id: Run the record belongs to
+
+        Returns:
+            Number of rows inserted
+        """
+        inserted = self._insert(record, run_id)
+        self._pending += inserted
+        if self._pending >= self.commit_every:
+            self.flush()
+        return inserted
+
+    def _insert(self, record, run_id):
+        """Insert a record's rows into the open transaction without committing."""
+        rows = [
+            (run_id, row['test_name'], row['model'], _to_int(row['passed']),
+             row['timestamp'], row['latency'], row['token_count'], int(row['error']),
+             row['prompt'], json.dumps(row['evaluations']))
+            for row in iter_response_rows(record)
+        ]
+        self.connection.executemany(
+            "INSERT INTO results (run_id, test_name, model, passed, timestamp, latency,"
+            " token_count, error, prompt, evaluations) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        return len(rows)
+
+    def flush(self):
+        """Commit pending inserts."""
+        self.connection.commit()
+        self._pending = 0
+
+    def close(self):
+        """Commit and close the database."""
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def query(self, since=None, until=None, min_latency=None, limit=None,
+              order_by="timestamp", **filters):
+        """
+        Fetch result rows.
+
+        Args:
+            since: Earliest ISO timestamp (inclusive)
+            until: Latest ISO timestamp (exclusive)
+            min_latency: Only rows at least this slow (seconds)
+            limit: Maximum rows to return
+            order_by: Column to sort by ("timestamp" or "latency")
+            **filters: Equality filters on run_id, test_name, model, passed, error
+
+        Returns:
+            List of row dictionaries
+        """
+        if order_by not in ("timestamp", "latency", "id"):
+            raise ValueError(f"Cannot order by {order_by!r}")
+
+        where, params = self._where(since, until, min_latency, filters)
+        sql = f"SELECT * FROM results{where} ORDER BY {order_by}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        self.flush()
+        return [self._row_to_dict(row) for row in self.connection.execute(sql, params)]
+
+    def aggregate(self, group_by=("model",), since=None, until=None, **filters):
+        """
+        Pass rate and latency statistics per group.
+
+        Args:
+            group_by: Columns to group on (run_id, test_name, model, passed,
+                error, or "day" for the date part of the timestamp)
+            since: Earliest ISO timestamp (inclusive)
+            until: Latest ISO timestamp (exclusive)
+            **filters: Equality filters as in query()
+
+        Returns:
+            One dictionary per group with count, passed, pass_rate,
+            avg_latency, max_latency and avg_token_count
+        """
+        if isinstance(group_by, str):
+            group_by = (group_by,)
+        for column in group_by:
+            if column not in _GROUP_COLUMNS:
+                raise ValueError(f"Cannot group by {column!r}")
+
+        selected = [
+            "substr(timestamp, 1, 10) AS day" if column == "day" else column
+            for column in group_by
+        ]
+        where, params = self._where(since, until, None, filters)
+        sql = (
+            f"SELECT {', '.join(selected)}, COUNT(*) AS count, SUM(passed = 1) AS passed,"
+            " AVG(latency) AS avg_latency, MAX(latency) AS max_latency,"
+            " AVG(token_count) AS avg_token_count"
+            f" FROM results{where} GROUP BY {', '.join(group_by)} ORDER BY {', '.join(group_by)}"
+        )
+
+        self.flush()
+        groups = []
+        for row in self.connection.execute(sql, params):
+            group = dict(row)
+            group['passed'] = group['passed'] or 0
+            group['pass_rate'] = group['passed'] / group['count'] if group['count'] else 0.0
+            groups.append(group)
+        return groups
+
+    def import_json_files(self, directory, patterns=("*.json", "*.jsonl", "*.jsonl.gz", "*.jsonl.zst")):
+        """
+        Import existing result files, using each file name as its run id.
+
+        Files whose run id is already in the database are skipped. Each file
+        is imported in one transaction, so a file that fails partway (e.g. a
+        corrupt line) leaves no rows behind and is retried on the next import.
+
+        Args:
+            directory: Directory holding result files
+            patterns: Glob patterns of files to import
+
+        Returns:
+            Number of rows imported
+        """
+        # Commit earlier writes so a failed file's rollback cannot undo them
+        self.flush()
+        imported = 0
+        for pattern in patterns:
+            for filepath in sorted(glob.glob(os.path.join(directory, pattern))):
+                run_id = os.path.basename(filepath).split(".")[0]
+                # Importing the same directory twice must not duplicate rows
+                if self.connection.execute(
+                    "SELECT 1 FROM results WHERE run_id = ? LIMIT 1", (run_id,)
+                ).fetchone():
+                    continue
+                file_rows = 0
+                try:
+                    if pattern == "*.json":
+                        with open(filepath, 'r') as f:
+                            records = [json.load(f)]
+                    else:
+                        records = iter_jsonl(filepath)
+                    for record in records:
+                        if isinstance(record, dict):
+                            file_rows += self._insert(record, run_id)
+                except Exception as e:
+                    # Whatever went wrong, a half-imported file must not stay
+                    # in the open transaction and get committed by close()
+                    self.connection.rollback()
+                    print(f"⚠️  Skipped {filepath}: {e}")
+                    continue
+                self.connection.commit()
+                imported += file_rows
+
+        self.flush()
+        print(f"✅ Imported {imported} rows into {self.db_path}")
+        return imported
+
+    def _where(self, since, until, min_latency, filters):
+        clauses = []
+        params = []
+        for column, value in filters.items():
+            if column not in _FILTER_COLUMNS:
+                raise ValueError(f"Cannot filter on {column!r}")
+            if value is None:
+                continue
+            clauses.append(f"{column} = ?")
+            params.append(_to_int(value) if column in ('passed', 'error') else value)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if min_latency is not None:
+            clauses.append("latency >= ?")
+            params.append(min_latency)
+
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        return where, params
+
+    def _row_to_dict(self, row):
+        result = dict(row)
+        result['passed'] = None if result['passed'] is None else bool(result['passed'])
+        result['error'] = bool(result['error'])
+        result['evaluations'] = json.loads(result['evaluations']) if result['evaluations'] else {}
+        return result
+
+
+def _to_int(value):
+    """SQLite has no bool type; keep None as NULL."""
+    return None if value is None else int(bool(value))
@@ -0,0 +1,85 @@
+# src/llm_test_suite/utils/stats.py
+"""Small statistics helpers for latency measurements."""
+
+import math
+
+
+def percentile(values, pct):
+    """
+    Percentile with linear interpolation between closest ranks.
+
+    Matches numpy's default ``percentile`` method without needing numpy.
+
+    Args:
+        values: Sequence of numbers
+        pct: Percentile in the range 0-100
+
+    Returns:
+        The interpolated percentile, or None for an empty sequence
+    """
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_latencies(values):
+    """
+    Summary statistics for a list of latencies in seconds.
+
+    Args:
+        values: Sequence of latencies
+
+    Returns:
+        Dictionary with count, mean, stdev, min, max, p50, p90 and p99
+    """
+    count = len(values)
+    if count == 0:
+        return {'count': 0}
+
+    mean = sum(values) / count
+    # Sample standard deviation, 0 for a single measurement
+    variance = sum((v - mean) ** 2 for v in values) / (count - 1) if count > 1 else 0.0
+
+    return {
+        'count': count,
+        'mean': mean,
+        'stdev': math.sqrt(variance),
+        'min': min(values),
+        'max': max(values),
+        'p50': percentile(values, 50),
+        'p90': percentile(values, 90),
+        'p99': percentile(values, 99)
+    }
+
+
+def token_timing_metrics(start_time, end_time, token_times):
+    """
+    Latency breakdown of a streamed generation from per-token timestamps.
+
+    Args:
+        start_time: When the request started (perf_counter seconds)
+        end_time: When the stream finished
+        token_times: perf_counter timestamp of every generated token
+
+    Returns:
+        Dictionary with total time, time to first token, per-token
+        latencies and decode tokens/second (prefill excluded)
+    """
+    latencies = [b - a for a, b in zip(token_times, token_times[1:])]
+    decode_time = token_times[-1] - token_times[0] if token_times else 0
+
+    return {
+        'total_time': end_time - start_time,
+        'time_to_first_token': token_times[0] - start_time if token_times else None,
+        'token_latencies': latencies,
+        'inter_token_latency': sum(latencies) / len(latencies) if latencies else None,
+        'tokens_per_second': len(latencies) / decode_time if decode_time > 0 else None,
+        'generated_tokens': len(token_times)
+    }
@@ -0,0 +1,103 @@
+# src/llm_test_suite/utils/streaming.py
+"""Streaming text generation with per-token timing."""
+
+import threading
+import time
+
+from transformers import TextIteratorStreamer
+
+from .stats import token_timing_metrics
+
+
+class TimingStreamer(TextIteratorStreamer):
+    """Text streamer that timestamps every generated token."""
+
+    def __init__(self, tokenizer, timeout=None):
+        """
+        Initialize the streamer.
+
+        Args:
+            tokenizer: Tokenizer used to decode generated ids
+            timeout: Seconds to wait for the next chunk before giving up
+        """
+        super().__init__(tokenizer, skip_prompt=True, timeout=timeout,
+                         skip_special_tokens=True)
+        self.token_times = []
+
+    def put(self, value):
+        # The first call carries the prompt ids, which are not generated tokens
+        if not (self.skip_prompt and self.next_tokens_are_prompt):
+            now = time.perf_counter()
+            self.token_times.extend([now] * value.numel())
+        super().put(value)
+
+
+class StreamingGeneration:
+    """Stream a pipeline's output while recording latency metrics.
+
+    Generation runs on a background thread. Iterate over the instance to
+    receive decoded text chunks as they are produced; once iteration is done
+    ``metrics()`` returns time-to-first-token, inter-token latency and
+    tokens/second.
+    """
+
+    def __init__(self, text_pipeline, prompt, timeout=None, **generate_kwargs):
+        """
+        Prepare a streaming generation.
+
+        Args:
+            text_pipeline: A transformers text-generation pipeline
+            prompt: Input prompt
+            timeout: Seconds to wait for each chunk (None waits forever)
+            **generate_kwargs: Passed through to ``model.generate``
+        """
+        self.prompt = prompt
+        self.streamer = TimingStreamer(text_pipeline.tokenizer, timeout=timeout)
+        self.text = ""
+        self.start_time = None
+        self.end_time = None
+        self.error = None
+
+        model = text_pipeline.model
+        inputs = text_pipeline.tokenizer(prompt, return_tensors="pt").to(model.device)
+        self._generate_kwargs = {**inputs, **generate_kwargs, "streamer": self.streamer}
+        self._model = model
+        self._thread = threading.Thread(target=self._generate, daemon=True)
+
+    def _generate(self):
+        try:
+            self._model.generate(**self._generate_kwargs)
+        except Exception as e:
+            self.error = e
+            # Unblock the consumer, which would otherwise wait for more text
+            self.streamer.end()
+
+    def __iter__(self):
+        self.start_time = time.perf_counter()
+        self._thread.start()
+
+        for chunk in self.streamer:
+            self.text += chunk
+            yield chunk
+
+        self._thread.join()
+        self.end_time = time.perf_counter()
+
+        if self.error is not None:
+            raise self.error
+
+    def run(self):
+        """Consume the whole stream and return the generated text."""
+        for _ in self:
+            pass
+        return self.text
+
+    def metrics(self):
+        """
+        Latency breakdown of the finished generation.
+
+        Returns:
+            Dictionary with total time, time to first token, per-token
+            latencies and decode tokens/second (prefill excluded)
+        """
+        return token_timing_metrics(self.start_time, self.end_time, self.streamer.token_times)
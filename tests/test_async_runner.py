@@ -0,0 +1,119 @@
+import threading
+import time
+
+import pytest
+
+from llm_test_suite.runners.async_runner import AsyncSuiteRunner
+
+
+def test_results_come_back_in_order():
+    # Later cases finish evaluation first
+    def evaluate(case, result):
+        time.sleep(0.01 * (5 - case))
+        return result * 10
+
+    runner = AsyncSuiteRunner(lambda case: case + 1, evaluate, evaluation_concurrency=3)
+    seen = []
+
+    results = runner.run(range(5), on_result=lambda i, case, result: seen.append((i, case, result)))
+
+    assert results == [10, 20, 30, 40, 50]
+    assert seen == [(i, i, (i + 1) * 10) for i in range(5)]
+
+
+def test_without_evaluate_stage():
+    assert AsyncSuiteRunner(str).run([1, 2]) == ["1", "2"]
+
+
+def test_generation_overlaps_evaluation():
+    evaluating = threading.Event()
+    overlapped = []
+
+    def generate(case):
+        overlapped.append(evaluating.is_set())
+        return case
+
+    def evaluate(case, result):
+        evaluating.set()
+        time.sleep(0.05)
+        evaluating.clear()
+        return result
+
+    AsyncSuiteRunner(generate, evaluate, evaluation_concurrency=1).run(range(4))
+
+    assert any(overlapped)
+
+
+def test_backpressure_limits_pending_results():
+    generated = []
+    evaluated = []
+    max_ahead = []
+
+    def generate(case):
+        generated.append(case)
+        max_ahead.append(len(generated) - len(evaluated))
+        return case
+
+    def evaluate(case, result):
+        time.sleep(0.01)
+        evaluated.append(case)
+        return result
+
+    AsyncSuiteRunner(generate, evaluate, evaluation_concurrency=1, max_pending=2).run(range(20))
+
+    # Queue of 2, one being evaluated, one being generated
+    assert max(max_ahead) <= 4
+
+
+def test_test_cases_are_read_lazily():
+    read = []
+
+    def cases():
+        for i in range(100):
+            read.append(i)
+            yield i
+
+    def evaluate(case, result):
+        if case == 3:
+            raise RuntimeError("stop")
+        return result
+
+    with pytest.raises(RuntimeError):
+        AsyncSuiteRunner(lambda case: case, evaluate, max_pending=1).run(cases())
+
+    assert len(read) < 100
+
+
+def test_generation_failure_is_raised():
+    def generate(case):
+        if case == 2:
+            raise ValueError("bad case")
+        return case
+
+    with pytest.raises(ValueError, match="bad case"):
+        AsyncSuiteRunner(generate, lambda case, result: result, max_pending=1).run(range(10))
+
+
+def test_evaluation_failure_does_not_deadlock_full_queue():
+    def evaluate(case, result):
+        time.sleep(0.01)
+        raise RuntimeError("evaluator broke")
+
+    with pytest.raises(RuntimeError, match="evaluator broke"):
+        AsyncSuiteRunner(lambda case: case, evaluate, evaluation_concurrency=1, max_pending=1).run(range(50))
+
+
+def test_keep_results_false_streams_to_on_result():
+    seen = []
+
+    results = AsyncSuiteRunner(lambda case: case * 2).run(
+        range(5), on_result=lambda i, case, result: seen.append(result), keep_results=False
+    )
+
+    assert results == []
+    assert seen == [0, 2, 4, 6, 8]
+
+
+def test_invalid_limits():
+    with pytest.raises(ValueError):
+        AsyncSuiteRunner(str, max_pending=0)
@@ -0,0 +1,106 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from llm_test_suite.cases import iter_test_cases, load_test_cases, normalize_test_case
+
+
+def test_normalize_fills_defaults():
+    case = normalize_test_case({"prompt": "Hi"}, 3)
+
+    assert case == {
+        "id": "case-3",
+        "name": "case-3",
+        "prompt": "Hi",
+        "category": "general",
+        "expected_words": [],
+        "expected_answers": [],
+        "generation": {},
+        "evaluators": [],
+    }
+
+
+def test_normalize_maps_max_tokens():
+    case = normalize_test_case({"name": "n", "prompt": "Hi", "max_tokens": 12})
+
+    assert case["id"] == "n"
+    assert case["generation"] == {"max_new_tokens": 12}
+    assert case["max_tokens"] == 12
+
+
+@pytest.mark.parametrize("raw", [
+    "just a prompt",
+    {"expected_words": ["x"]},
+    {"prompt": 5},
+    {"prompt": "Hi", "generation": {"top_k": 5}},
+])
+def test_normalize_rejects_invalid_cases(raw):
+    with pytest.raises(ValueError):
+        normalize_test_case(raw)
+
+
+def test_jsonl_streams_one_case_at_a_time(tmp_path):
+    path = tmp_path / "cases.jsonl.gz"
+    with gzip.open(path, "wt") as f:
+        f.write(json.dumps({"prompt": "a"}) + "\n" + "\n" + json.dumps({"id": "b", "prompt": "b"}) + "\n")
+
+    cases = iter_test_cases(str(path))
+
+    assert next(cases)["id"] == "case-0"
+    assert next(cases)["id"] == "b"
+    assert list(cases) == []
+
+
+def test_json_list(tmp_path):
+    path = tmp_path / "cases.json"
+    path.write_text(json.dumps([{"prompt": "a"}, {"prompt": "b"}]))
+
+    assert [c["prompt"] for c in load_test_cases(str(path))] == ["a", "b"]
+
+    path.write_text(json.dumps({"prompt": "a"}))
+    with pytest.raises(ValueError, match="expected a list"):
+        load_test_cases(str(path))
+
+
+def test_yaml_list_and_documents(tmp_path):
+    pytest.importorskip("yaml")
+    listed = tmp_path / "list.yaml"
+    listed.write_text(
+        "- id: one\n"
+        "  prompt: First\n"
+        "  generation: {max_new_tokens: 20}\n"
+        "  evaluators: [quality, {type: length, max_words: 80}]\n"
+        "- prompt: Second\n"
+    )
+    documents = tmp_path / "docs.yml"
+    documents.write_text("prompt: First\n---\nprompt: Second\n...\n")
+
+    cases = load_test_cases(str(listed))
+    assert [c["id"] for c in cases] == ["one", "case-1"]
+    assert cases[0]["max_tokens"] == 20
+    assert cases[0]["evaluators"] == ["quality", {"type": "length", "max_words": 80}]
+    assert [c["prompt"] for c in load_test_cases(str(documents))] == ["First", "Second"]
+
+
+def test_yaml_items_are_parsed_lazily(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "cases.yaml"
+    path.write_text("- prompt: fine\n- prompt: [not, a, string]\n")
+
+    cases = iter_test_cases(str(path))
+
+    assert next(cases)["prompt"] == "fine"
+    with pytest.raises(ValueError, match="cases.yaml: Test case 1"):
+        next(cases)
+
+
+def test_the_example_file_loads():
+    pytest.importorskip("yaml")
+    path = os.path.join(os.path.dirname(__file__), os.pardir, "examples", "test_cases.yaml")
+
+    cases = load_test_cases(path)
+
+    assert [c["id"] for c in cases] == ["intro-name", "fibonacci", "capital-france"]
+    assert cases[2]["expected_answers"]
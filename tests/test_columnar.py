@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+import pytest
+
+from llm_test_suite.utils import columnar
+from llm_test_suite.utils.columnar import export_columnar, load_columnar, rows_to_columns
+
+ROWS = [
+    {"test_name": "t1", "model": "a", "prompt": "p", "passed": True, "error": False,
+     "latency": 2.0, "token_count": 10, "timestamp": "2024-01-15T10:00:00",
+     "evaluations": {"quality": {"passed": True, "score": 0.8}}},
+    {"test_name": "t2", "model": "b", "prompt": None, "passed": None, "error": True,
+     "latency": None, "token_count": None, "timestamp": None, "evaluations": {}},
+    {"test_name": "t3", "model": "a", "prompt": "q", "passed": False, "error": False,
+     "latency": 0.5, "token_count": 4, "timestamp": "2024-01-15T11:00:00",
+     "evaluations": {"semantic": {"passed": False, "score": 0.2}}},
+]
+
+
+def test_rows_to_columns_aligns_evaluator_columns():
+    columns = rows_to_columns(ROWS)
+
+    assert all(len(values) == 3 for values in columns.values())
+    assert columns["eval_quality_score"] == [0.8, None, None]
+    assert columns["eval_semantic_passed"] == [None, None, False]
+    assert columns["tokens_per_second"] == [5.0, None, 8.0]
+    assert columns["error"] == [False, True, False]
+
+
+def test_npz_round_trip_encodes_missing_values(tmp_path):
+    path = export_columnar(ROWS, str(tmp_path / "metrics.npz"))
+    data = load_columnar(path)
+
+    assert data["model"].tolist() == ["a", "b", "a"]
+    assert data["prompt"].tolist() == ["p", "", "q"]
+    assert data["passed"].tolist() == [1, -1, 0]
+    assert data["token_count"].tolist() == [10, -1, 4]
+    assert data["latency"][0] == 2.0 and math.isnan(data["latency"][1])
+    assert data["passed"].dtype == np.int8
+
+
+def test_falls_back_to_npz_without_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setattr(columnar, "pa", None)
+
+    path = export_columnar(ROWS, str(tmp_path / "metrics.parquet"))
+
+    assert path.endswith("metrics.npz")
+    assert load_columnar(path)["model"].tolist() == ["a", "b", "a"]
+
+
+def test_unknown_format_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        export_columnar(ROWS, str(tmp_path / "metrics.csv"), format="csv")
+
+
+def test_parquet_round_trip(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    data = load_columnar(export_columnar(ROWS, str(tmp_path / "metrics.parquet")))
+
+    assert data["model"].tolist() == ["a", "b", "a"]
+    assert data["token_count"][0] == 10
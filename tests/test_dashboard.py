@@ -0,0 +1,117 @@
+import json
+import os
+
+import pytest
+
+from llm_test_suite.reporting import dashboard
+from llm_test_suite.reporting.dashboard import DashboardGenerator
+
+
+def write_result(directory, name, **fields):
+    data = {"test_name": name, "passed": True, "timestamp": "2024-01-15T10:00:00", **fields}
+    (directory / f"{name}.json").write_text(json.dumps(data))
+
+
+def table_rows(path):
+    with open(path) as f:
+        return f.read().count("<tr>\n") - 1  # Minus the header row
+
+
+def test_dashboard_counts_and_orders_results(tmp_path):
+    write_result(tmp_path, "old", timestamp="2024-01-01T00:00:00")
+    write_result(tmp_path, "new", timestamp="2024-02-01T00:00:00", passed=False)
+
+    path = DashboardGenerator(str(tmp_path)).generate_dashboard()
+
+    html = open(path).read()
+    assert '<div class="stat-number total">2</div>' in html
+    assert '<div class="stat-number passed">1</div>' in html
+    assert html.index("<strong>new</strong>") < html.index("<strong>old</strong>")
+
+
+def test_empty_directory_writes_nothing(tmp_path):
+    assert DashboardGenerator(str(tmp_path)).generate_dashboard() is None
+
+
+def test_incremental_run_parses_only_changed_files(tmp_path, monkeypatch):
+    for i in range(3):
+        write_result(tmp_path, f"r{i}")
+    DashboardGenerator(str(tmp_path)).generate_dashboard(incremental=True)
+
+    parsed = []
+    original = dashboard._parse_result_file
+    monkeypatch.setattr(dashboard, "_parse_result_file",
+                        lambda path: parsed.append(os.path.basename(path)) or original(path))
+    write_result(tmp_path, "r1", passed=False, message="changed")
+    os.remove(tmp_path / "r2.json")
+    write_result(tmp_path, "r3")
+
+    path = DashboardGenerator(str(tmp_path)).generate_dashboard(incremental=True)
+
+    assert sorted(parsed) == ["r1.json", "r3.json"]
+    html = open(path).read()
+    assert '<div class="stat-number total">3</div>' in html
+    assert '<div class="stat-number passed">2</div>' in html
+    assert "changed" in html
+
+
+def test_pages_split_results_and_stale_pages_are_removed(tmp_path):
+    for i in range(5):
+        write_result(tmp_path, f"r{i}")
+    generator = DashboardGenerator(str(tmp_path))
+
+    first = generator.generate_dashboard(page_size=2)
+
+    pages = [first, tmp_path / "dashboard_page_2.html", tmp_path / "dashboard_page_3.html"]
+    assert [table_rows(page) for page in pages] == [2, 2, 1]
+    assert 'href="dashboard_page_3.html"' in open(first).read()
+
+    generator.generate_dashboard(page_size=None)
+    assert table_rows(first) == 5
+    assert not (tmp_path / "dashboard_page_2.html").exists()
+
+
+@pytest.mark.parametrize("content, skipped", [
+    ("{corrupt", True),
+    ("[1, 2]", True),
+    (json.dumps({"test_name": "shape", "model_responses": ["x"]}), True),
+    # Listed, just left out of the daily trends
+    (json.dumps({"test_name": "epoch", "timestamp": 1700000000}), False),
+])
+def test_bad_files_are_skipped_with_a_report(tmp_path, content, skipped):
+    write_result(tmp_path, "good")
+    (tmp_path / "bad.json").write_text(content)
+    generator = DashboardGenerator(str(tmp_path))
+
+    path = generator.generate_dashboard()
+
+    assert list(generator.load_errors) == (["bad.json"] if skipped else [])
+    assert table_rows(path) == (1 if skipped else 2)
+
+
+def test_non_string_model_names_render(tmp_path):
+    (tmp_path / "suite.json").write_text(json.dumps({
+        "model": 7,
+        "completion_tests": [{"prompt": "p", "category": "code", "all_passed": True,
+                              "time_taken": 1.0, "timestamp": "2024-01-15T10:00:00"}],
+    }))
+    generator = DashboardGenerator(str(tmp_path))
+
+    html = open(generator.generate_dashboard()).read()
+
+    assert generator.load_errors == {}
+    assert "<strong>7</strong> / code" in html
+
+
+def test_parallel_parsing_matches_serial(tmp_path, monkeypatch):
+    monkeypatch.setattr(dashboard, "PARALLEL_MIN_FILES", 2)
+    for i in range(6):
+        write_result(tmp_path, f"r{i}", passed=i % 2 == 0)
+    (tmp_path / "bad.json").write_text("{corrupt")
+
+    serial = DashboardGenerator(str(tmp_path), max_workers=1)
+    parallel = DashboardGenerator(str(tmp_path), max_workers=2)
+    paths = [str(path) for path in sorted(tmp_path.glob("*.json"))]
+
+    assert parallel._parse_files(paths) == serial._parse_files(paths)
+    assert serial._parse_files(paths)[0][2] is not None
@@ -0,0 +1,47 @@
+import numpy as np
+
+from llm_test_suite.evaluators.embedding_cache import EmbeddingCache
+
+
+def vector(seed):
+    return np.random.default_rng(seed).random(4).astype(np.float32)
+
+
+def test_memory_cache_is_a_bounded_lru():
+    cache = EmbeddingCache("m", max_entries=2)
+    cache.put("a", vector(0))
+    cache.put("b", vector(1))
+    cache.get("a")  # "b" is now least recently used
+    cache.put("c", vector(2))
+
+    assert cache.get("b") is None
+    np.testing.assert_array_equal(cache.get("a"), vector(0))
+    np.testing.assert_array_equal(cache.get("c"), vector(2))
+    assert len(cache._memory) == 2
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_disk_round_trip(tmp_path):
+    EmbeddingCache("m", cache_dir=str(tmp_path)).put("a", vector(0))
+
+    fresh = EmbeddingCache("m", cache_dir=str(tmp_path))
+    loaded = fresh.get("a")
+
+    np.testing.assert_array_equal(loaded, vector(0))
+    assert loaded.dtype == np.float32
+    assert fresh.hits == 1
+    # Entries evicted from memory are still served from disk
+    small = EmbeddingCache("m", max_entries=1, cache_dir=str(tmp_path))
+    small.put("b", vector(1))
+    np.testing.assert_array_equal(small.get("a"), vector(0))
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_keys_separate_models_and_normalization(tmp_path):
+    raw = EmbeddingCache("m", cache_dir=str(tmp_path))
+    raw.put("a", vector(0))
+
+    assert EmbeddingCache("other", cache_dir=str(tmp_path)).get("a") is None
+    assert EmbeddingCache("m", cache_dir=str(tmp_path), normalized=True).get("a") is None
+    assert EmbeddingCache("m", cache_dir=str(tmp_path)).get("a") is not None
+    assert len({raw.key("a"), raw.key("b"), EmbeddingCache("m", normalized=True).key("a")}) == 3
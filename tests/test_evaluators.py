@@ -0,0 +1,147 @@
+import random
+import re
+
+import numpy as np
+import pytest
+
+from llm_test_suite.evaluators.analysis import TextAnalysis, as_analysis
+from llm_test_suite.evaluators.length import LengthEvaluator
+from llm_test_suite.evaluators.pipeline import EvaluationPipeline
+from llm_test_suite.evaluators.quality import QualityEvaluator
+from llm_test_suite.evaluators.repetition import RepetitionEvaluator
+from llm_test_suite.evaluators.sentence import SentenceEvaluator
+
+ALPHABET = "aAbB zZ.!?:\n\t@#$%^&*é"
+
+
+def random_texts(count, seed=0):
+    rng = random.Random(seed)
+    texts = ["", " ", "...", "Hello world.", "the the the the", "A b. C d! E f? G"]
+    texts += ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 80))) for _ in range(count)]
+    # Word-level text, so repetition and length checks see real words
+    words = ["the", "cat", "sat", "on", "mat", "The", "Mat."]
+    texts += [" ".join(rng.choice(words) for _ in range(rng.randint(0, 40))) for _ in range(count)]
+    return texts
+
+
+def test_text_analysis_views_match_string_operations():
+    for text in random_texts(500):
+        analysis = TextAnalysis(text)
+        assert analysis.stripped == text.strip()
+        assert analysis.lower == text.lower()
+        assert analysis.words == text.split()
+        assert analysis.lower_words == text.lower().split()
+        assert analysis.word_count == len(text.split())
+        assert analysis.sentences == [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+        assert analysis.has_upper == any(c.isupper() for c in text)
+        assert analysis.has_special_chars == any(c in text for c in "@#$%^&*")
+
+
+def test_as_analysis_reuses_an_existing_analysis():
+    analysis = TextAnalysis("x")
+    assert as_analysis(analysis) is analysis
+    assert as_analysis("x").text == "x"
+
+
+@pytest.mark.parametrize("evaluator", [
+    LengthEvaluator(), SentenceEvaluator(), QualityEvaluator(), RepetitionEvaluator(),
+])
+def test_evaluators_give_the_same_result_for_string_and_analysis(evaluator):
+    for text in random_texts(200):
+        shared = TextAnalysis(text)
+        # A shared analysis may already have its views computed by another evaluator
+        QualityEvaluator().evaluate(shared)
+        assert evaluator.evaluate(shared) == evaluator.evaluate(text)
+
+
+class Recording:
+    def __init__(self, accepts_analysis):
+        self.accepts_analysis = accepts_analysis
+        self.seen = []
+
+    def evaluate(self, response):
+        self.seen.append(response)
+        return {"passed": True}
+
+
+class References:
+    def evaluate_references(self, responses, references):
+        return [{"passed": responses in references, "references": references}]
+
+
+class Failing:
+    def evaluate(self, response):
+        raise RuntimeError("boom")
+
+
+def test_pipeline_shares_one_analysis():
+    first, second, plain = Recording(True), Recording(True), Recording(False)
+
+    results = EvaluationPipeline([first, second, plain]).evaluate("some text")
+
+    assert isinstance(first.seen[0], TextAnalysis)
+    assert first.seen[0] is second.seen[0]
+    assert plain.seen == ["some text"]
+    assert results == {"Recording": {"passed": True}}
+
+
+def test_pipeline_passes_references_and_reports_errors():
+    pipeline = EvaluationPipeline([References(), Failing()])
+
+    results = pipeline.evaluate("yes", references=["yes", "sure"])
+    assert results["References"] == {"passed": True, "references": ["yes", "sure"]}
+    assert results["Failing"] == {"error": "boom", "passed": False}
+
+    # Without references a reference-based evaluator fails instead of raising
+    assert pipeline.evaluate("yes")["References"]["passed"] is False
+
+
+def test_pipeline_matches_individual_evaluators():
+    evaluators = [LengthEvaluator(), SentenceEvaluator(), QualityEvaluator(), RepetitionEvaluator()]
+    texts = random_texts(50)
+
+    results = EvaluationPipeline(evaluators).evaluate_batch(texts)
+
+    for text, result in zip(texts, results):
+        assert result == {e.__class__.__name__: e.evaluate(text) for e in evaluators}
+
+
+@pytest.mark.parametrize("evaluator", [
+    LengthEvaluator(), LengthEvaluator(min_words=0, max_words=3), SentenceEvaluator(),
+    SentenceEvaluator(max_sentences=0), QualityEvaluator(),
+])
+def test_evaluate_batch_matches_evaluate(evaluator):
+    texts = random_texts(300, seed=1)
+
+    assert evaluator.evaluate_batch(texts) == [evaluator.evaluate(text) for text in texts]
+    # Shared analyses work as batch input too
+    assert evaluator.evaluate_batch([TextAnalysis(text) for text in texts[:20]]) == \
+        [evaluator.evaluate(text) for text in texts[:20]]
+    assert evaluator.evaluate_batch([]) == []
+
+
+def test_evaluate_batch_columns():
+    texts = random_texts(100, seed=2)
+    count = len(texts)
+
+    length = LengthEvaluator().evaluate_batch(texts, as_columns=True)
+    assert length["word_count"].dtype == np.int64 and length["passed"].dtype == bool
+    assert length["word_count"].tolist() == [len(text.split()) for text in texts]
+
+    sentence = SentenceEvaluator().evaluate_batch(texts, as_columns=True)
+    assert sentence["sentence_count"].dtype == np.int64 and sentence["passed"].dtype == bool
+    assert sentence["first_sentence"] == [r["first_sentence"] for r in map(SentenceEvaluator().evaluate, texts)]
+
+    quality = QualityEvaluator().evaluate_batch(texts, as_columns=True)
+    expected = [QualityEvaluator().evaluate(text) for text in texts]
+    for name in expected[0]["checks"]:
+        assert quality[name].dtype == bool
+        assert quality[name].tolist() == [r["checks"][name] for r in expected]
+    assert quality["passed_checks"].dtype == np.int64
+    assert quality["quality_score"].dtype == np.float64
+    assert quality["quality_score"].tolist() == [r["quality_score"] for r in expected]
+    assert quality["passed"].tolist() == [r["passed"] for r in expected]
+    assert all(column.shape == (count,) for column in quality.values())
+
+    empty = QualityEvaluator().evaluate_batch([], as_columns=True)
+    assert empty["passed"].shape == (0,)
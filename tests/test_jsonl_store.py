@@ -0,0 +1,95 @@
+import gzip
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from llm_test_suite.utils.jsonl_store import JsonlResultStore, iter_jsonl
+from llm_test_suite.utils.results_manager import ResultsManager
+
+
+@pytest.mark.parametrize("compression, suffix", [(None, ".jsonl"), ("gzip", ".jsonl.gz")])
+def test_round_trip(tmp_path, compression, suffix):
+    path = str(tmp_path / f"run{suffix}")
+    records = [{"i": i, "text": "ü" * i} for i in range(50)]
+
+    with JsonlResultStore(path, compression, buffer_size=100) as store:
+        for record in records:
+            store.write(record)
+
+    assert list(iter_jsonl(path)) == records
+
+
+def test_records_are_buffered_until_flush(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    store = JsonlResultStore(path, buffer_size=1 << 20)
+
+    store.write({"a": 1})
+    assert not os.path.exists(path)
+
+    store.flush()
+    assert list(store) == [{"a": 1}]
+    store.close()
+
+
+def test_appends_to_existing_file(tmp_path):
+    path = str(tmp_path / "run.jsonl.gz")
+    for i in range(3):
+        with JsonlResultStore(path, "gzip") as store:
+            store.write({"i": i})
+
+    # One gzip member per flush; all of them are read back
+    assert [r["i"] for r in iter_jsonl(path)] == [0, 1, 2]
+    with gzip.open(path, "rt") as f:
+        assert len(f.readlines()) == 3
+
+
+def test_blank_lines_are_skipped(tmp_path):
+    path = tmp_path / "run.jsonl"
+    path.write_text('{"a": 1}\n\n{"a": 2}\n')
+
+    assert list(iter_jsonl(str(path))) == [{"a": 1}, {"a": 2}]
+
+
+def test_unknown_compression_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        JsonlResultStore(str(tmp_path / "run.jsonl"), "lz4")
+
+
+def test_results_manager_jsonl_storage(tmp_path):
+    with ResultsManager(str(tmp_path), storage="jsonl", run_id="r1") as manager:
+        manager.save_result("first", {"passed": True})
+        manager.save_multiple_results("suite", [{"passed": True}, {"passed": False}])
+
+    records = list(ResultsManager(str(tmp_path)).iter_results())
+    assert [r["test_name"] for r in records] == ["first", "suite"]
+    assert records[1]["failed"] == 1
+    assert os.listdir(tmp_path) == ["run_r1.jsonl"]
+
+
+def test_results_manager_close_is_idempotent(tmp_path):
+    manager = ResultsManager(str(tmp_path), storage="jsonl", run_id="r1")
+    manager.save_result("first", {"passed": True})
+    manager.close()
+    manager.close()
+
+    assert len(list(iter_jsonl(str(tmp_path / "run_r1.jsonl")))) == 1
+
+
+def test_results_manager_flushes_at_exit(tmp_path):
+    script = textwrap.dedent(f"""
+        from llm_test_suite.utils.results_manager import ResultsManager
+        manager = ResultsManager({str(tmp_path)!r}, storage="jsonl", run_id="r1")
+        manager.save_result("unclosed", {{"passed": True}})
+    """)
+    src = os.path.join(os.path.dirname(__file__), os.pardir, "src")
+    subprocess.run([sys.executable, "-c", script], check=True, env=dict(os.environ, PYTHONPATH=src))
+
+    assert [r["test_name"] for r in iter_jsonl(str(tmp_path / "run_r1.jsonl"))] == ["unclosed"]
+
+
+def test_results_manager_rejects_compression_without_jsonl(tmp_path):
+    with pytest.raises(ValueError):
+        ResultsManager(str(tmp_path), compression="gzip")
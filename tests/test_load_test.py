@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from llm_test_suite.backends.base import GenerationBackend
+from llm_test_suite.benchmarks.load_test import LoadGenerator, find_saturation
+
+
+class SleepBackend(GenerationBackend):
+    """Answers after a fixed delay; fails prompts containing 'fail'."""
+
+    model_name = "sleepy"
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.prompts = []
+        self.lock = threading.Lock()
+
+    def generate(self, prompt, max_new_tokens=50, temperature=0.7, do_sample=None, seed=None):
+        with self.lock:
+            self.prompts.append((prompt, max_new_tokens))
+        time.sleep(self.delay)
+        if "fail" in prompt:
+            raise RuntimeError("server said no")
+        return {"text": "x", "full_text": prompt + "x", "generation_time": self.delay,
+                "token_count": 4}
+
+    def generate_stream(self, prompt, max_new_tokens=50, temperature=0.7, do_sample=None,
+                        seed=None, timeout=None, on_token=None):
+        result = self.generate(prompt, max_new_tokens)
+        result["time_to_first_token"] = self.delay / 2
+        return result
+
+
+def level(p99, throughput, error_rate=0.0):
+    return {"latency": {"p99": p99}, "throughput": throughput, "error_rate": error_rate}
+
+
+def test_requires_test_cases():
+    with pytest.raises(ValueError):
+        LoadGenerator(SleepBackend(), [])
+
+
+def test_closed_loop_keeps_concurrency_clients_busy():
+    backend = SleepBackend(delay=0.02)
+    generator = LoadGenerator(backend, [{"prompt": "a"}, {"prompt": "b", "max_tokens": 5}],
+                              max_new_tokens=9)
+
+    result = generator.run_closed_loop(concurrency=4, duration=0.2)
+
+    assert result["mode"] == "closed" and result["concurrency"] == 4
+    assert result["errors"] == 0
+    # 4 clients x ~10 sequential 20 ms requests each
+    assert 20 <= result["requests"] <= 50
+    assert result["throughput"] == pytest.approx(result["requests"] / result["duration"])
+    assert result["tokens_per_second"] == pytest.approx(4 * result["throughput"])
+    assert {("a", 9), ("b", 5)} == set(backend.prompts)
+
+
+def test_open_loop_sends_at_target_rate():
+    generator = LoadGenerator(SleepBackend(delay=0.05), [{"prompt": "a"}])
+
+    result = generator.run_open_loop(rate=100, duration=0.3, poisson=False)
+
+    assert result["mode"] == "open"
+    assert 25 <= result["requests"] <= 31
+    assert result["achieved_rate"] == pytest.approx(100, rel=0.2)
+    # Requests overlap instead of queueing behind each other
+    assert result["latency"]["p50"] < 0.2
+
+
+def test_open_loop_counts_queueing_delay():
+    generator = LoadGenerator(SleepBackend(delay=0.05), [{"prompt": "a"}])
+
+    result = generator.run_open_loop(rate=100, duration=0.2, max_in_flight=1, poisson=False)
+
+    # One request at a time at 50 ms each falls behind a 10 ms schedule
+    assert result["latency"]["max"] > 0.3
+
+
+def test_errors_are_counted_and_sampled():
+    generator = LoadGenerator(SleepBackend(), [{"prompt": "ok"}, {"prompt": "fail"}])
+
+    result = generator.run_closed_loop(concurrency=1, duration=0.1)
+
+    assert result["error_rate"] == pytest.approx(0.5, abs=0.1)
+    assert result["error_samples"] == ["server said no"]
+    assert result["latency"]["count"] == result["requests"] - result["errors"]
+
+
+def test_streaming_records_time_to_first_token():
+    generator = LoadGenerator(SleepBackend(), [{"prompt": "a"}], streaming=True)
+
+    result = generator.run_closed_loop(concurrency=1, duration=0.05)
+
+    assert result["time_to_first_token"]["p50"] == pytest.approx(0.005)
+
+
+def test_sweep_report():
+    generator = LoadGenerator(SleepBackend(), [{"prompt": "a"}], warmup_requests=1)
+
+    report = generator.sweep([1, 2], mode="closed", duration=0.05)
+
+    assert report["benchmark"] == "load"
+    assert report["config"]["levels"] == [1, 2]
+    assert [lvl["concurrency"] for lvl in report["levels"]] == [1, 2]
+    assert "saturation_level" in report
+    with pytest.raises(ValueError):
+        generator.sweep([1], mode="burst")
+
+
+def test_find_saturation():
+    assert find_saturation([level(1.0, 10), level(1.1, 20), level(1.2, 40)]) is None
+    # p99 more than doubles
+    assert find_saturation([level(1.0, 10), level(1.5, 20), level(2.5, 40)]) == 2
+    # Throughput stops growing
+    assert find_saturation([level(1.0, 10), level(1.1, 20), level(1.2, 20.5)]) == 2
+    # Errors
+    assert find_saturation([level(1.0, 10), level(1.0, 20, error_rate=0.05)]) == 1
+    assert find_saturation([]) is None
@@ -0,0 +1,107 @@
+
+from llm_test_suite.comparisons.model_pool import ModelPool, model_size_bytes
+
+MB = 1024 * 1024
+
+
+class FakeModel:
+    def __init__(self, name, size):
+        self.name = name
+        self.size = size
+        self.closed = False
+
+    def size_bytes(self):
+        return self.size
+
+    def close(self):
+        self.closed = True
+
+
+class Loader:
+    """Loads FakeModels and records peak loaded bytes during each load."""
+
+    def __init__(self, sizes_mb, fail=()):
+        self.sizes = {name: size * MB for name, size in sizes_mb.items()}
+        self.fail = set(fail)
+        self.calls = []
+        self.pool = None
+        self.peak = 0
+
+    def __call__(self, name):
+        self.calls.append(name)
+        if name in self.fail:
+            raise RuntimeError(f"cannot load {name}")
+        self.peak = max(self.peak, self.pool.loaded_bytes() + self.sizes[name])
+        return FakeModel(name, self.sizes[name])
+
+
+def make_pool(sizes_mb, budget_mb, estimate=True, fail=()):
+    loader = Loader(sizes_mb, fail)
+    estimator = (lambda name: loader.sizes.get(name)) if estimate else (lambda name: None)
+    loader.pool = ModelPool(loader, budget_mb, size_estimator=estimator)
+    return loader.pool, loader
+
+
+def test_loaded_models_are_reused():
+    pool, loader = make_pool({"a": 10}, None)
+
+    assert pool.get("a") is pool.get("a")
+    assert loader.calls == ["a"]
+
+
+def test_least_recently_used_model_is_evicted():
+    pool, loader = make_pool({"a": 40, "b": 40, "c": 40}, 100)
+
+    model_a = pool.get("a")
+    pool.get("b")
+    pool.get("a")  # b is now least recently used
+    pool.get("c")
+
+    assert list(pool.loaded) == ["a", "c"]
+    assert not model_a.closed
+    assert pool.loaded_bytes() == 80 * MB
+
+
+def test_budget_holds_during_first_load():
+    pool, loader = make_pool({"a": 60, "b": 60}, 100)
+
+    pool.get("a")
+    pool.get("b")
+
+    assert loader.peak <= 100 * MB
+    assert list(pool.loaded) == ["b"]
+
+
+def test_unknown_size_evicts_every_idle_model_first():
+    pool, loader = make_pool({"a": 30, "b": 30, "c": 30}, 100, estimate=False)
+
+    model_a = pool.get("a")
+    pool.get("b")
+
+    assert model_a.closed
+    assert list(pool.loaded) == ["b"]
+    # Once loaded, the measured size is used for later loads
+    pool.get("a")
+    assert list(pool.loaded) == ["b", "a"]
+
+
+def test_no_budget_keeps_everything():
+    pool, loader = make_pool({"a": 500, "b": 500}, None)
+
+    pool.get("a")
+    pool.get("b")
+
+    assert list(pool.loaded) == ["a", "b"]
+
+
+def test_failed_load_is_remembered():
+    pool, loader = make_pool({"a": 10}, 100, fail={"a"})
+
+    assert pool.get("a") is None
+    assert pool.get("a") is None
+    assert loader.calls == ["a"]
+    assert "cannot load a" in pool.failed["a"]
+
+
+def test_model_size_bytes_prefers_backend_size():
+    assert model_size_bytes(FakeModel("a", 123)) == 123
@@ -0,0 +1,145 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from llm_test_suite.backends.base import BackendError, GenerationBackend
+from llm_test_suite.backends.openai_http import OpenAICompatibleBackend
+
+WORDS = ["hello", " world", " again"]
+TOKEN_DELAY = 0.02
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Minimal /v1/completions server: JSON or SSE, plus scripted failures."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.clients.add(self.client_address)
+            failures = server.failures.get(self.path, 0)
+            if failures:
+                server.failures[self.path] = failures - 1
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+
+        if failures:
+            self._send(503, b"busy", {"Retry-After": "0"})
+        elif body["prompt"] == "bad":
+            self._send(400, b"bad request")
+        elif not body["stream"]:
+            data = {"choices": [{"text": "".join(WORDS)}], "usage": {"completion_tokens": len(WORDS)}}
+            self._send(200, json.dumps(data).encode(), {"Content-Type": "application/json"})
+        else:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for word in WORDS:
+                time.sleep(TOKEN_DELAY)
+                self._chunk(b"data: " + json.dumps({"choices": [{"text": word}]}).encode() + b"\n\n")
+            self._chunk(b"data: [DONE]\n\n")
+            self._chunk(b"")
+
+    def _send(self, status, payload, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _chunk(self, data):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.lock = threading.Lock()
+    httpd.requests = 0
+    httpd.clients = set()
+    httpd.failures = {}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def backend(server):
+    client = OpenAICompatibleBackend(
+        f"http://127.0.0.1:{server.server_address[1]}/v1", "stub", backoff=0.0
+    )
+    yield client
+    client.close()
+
+
+def test_backend_must_implement_generation():
+    class Incomplete(GenerationBackend):
+        def generate(self, prompt, **kwargs):
+            return {}
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_generate_reuses_keep_alive_connection(backend, server):
+    for _ in range(3):
+        result = backend.generate("hi")
+        assert result["text"] == "hello world again"
+        assert result["full_text"] == "hihello world again"
+        assert result["token_count"] == 3
+
+    assert server.requests == 3
+    assert len(server.clients) == 1
+
+
+def test_generate_retries_server_errors(backend, server):
+    server.failures["/v1/completions"] = 2
+
+    assert backend.generate("hi")["text"] == "hello world again"
+    assert server.requests == 3
+    assert backend.retries == 2
+
+
+def test_generate_gives_up_after_max_retries(server):
+    server.failures["/v1/completions"] = 10
+    client = OpenAICompatibleBackend(
+        f"http://127.0.0.1:{server.server_address[1]}/v1", "stub", max_retries=1, backoff=0.0
+    )
+
+    with pytest.raises(BackendError):
+        client.generate("hi")
+    assert server.requests == 2
+    client.close()
+
+
+def test_client_errors_are_not_retried(backend, server):
+    with pytest.raises(BackendError):
+        backend.generate("bad")
+    assert server.requests == 1
+
+
+def test_generate_stream_measures_time_to_first_token(backend, server):
+    tokens = []
+    result = backend.generate_stream("hi", on_token=tokens.append)
+
+    assert tokens == WORDS
+    assert result["text"] == "hello world again"
+    assert result["token_count"] == 3
+    assert TOKEN_DELAY <= result["time_to_first_token"] < result["generation_time"]
+    assert len(result["token_latencies"]) == len(WORDS) - 1  # Gaps between tokens
+
+    # The drained stream leaves the connection reusable
+    backend.generate_stream("hi")
+    assert len(server.clients) == 1
@@ -0,0 +1,74 @@
+from llm_test_suite.utils.records import iter_response_rows, normalize_timestamp
+
+
+def test_normalize_timestamp_formats():
+    assert normalize_timestamp("20240115_143022") == "2024-01-15T14:30:22"
+    assert normalize_timestamp("20240115_143022_000500") == "2024-01-15T14:30:22.000500"
+    assert normalize_timestamp("2024-01-15T14:30:22") == "2024-01-15T14:30:22"
+    assert normalize_timestamp("yesterday") == "yesterday"
+    assert normalize_timestamp(None) is None
+    assert normalize_timestamp(1700000000) is None
+
+
+def test_comparator_suite_rows():
+    record = {
+        "test_name": "suite",
+        "test_results": [{
+            "test_name": "greeting",
+            "prompt": "Hi",
+            "timestamp": "20240115_143022",
+            "model_responses": {
+                "gpt2": {
+                    "generation_time": 0.5,
+                    "token_count": 7,
+                    "evaluations": {"QualityEvaluator": {"passed": True, "quality_score": 0.8}},
+                },
+                "distilgpt2": {"error": "boom"},
+            },
+        }],
+    }
+
+    rows = list(iter_response_rows(record))
+
+    assert [(r["model"], r["passed"], r["error"]) for r in rows] == [
+        ("gpt2", True, False), ("distilgpt2", False, True)
+    ]
+    assert rows[0]["test_name"] == "greeting"
+    assert rows[0]["latency"] == 0.5
+    assert rows[0]["timestamp"] == "2024-01-15T14:30:22"
+    assert rows[0]["evaluations"] == {"QualityEvaluator": {"passed": True, "score": 0.8}}
+
+
+def test_llmtester_suite_rows():
+    record = {
+        "model": "gpt2",
+        "completion_tests": [
+            {"prompt": "a", "category": "code", "all_passed": True, "time_taken": 1.2,
+             "token_count": 9, "timestamp": "2024-01-15T14:30:22"},
+            {"prompt": "b", "test_name": "named", "all_passed": False, "error": "timeout"},
+        ],
+    }
+
+    rows = list(iter_response_rows(record))
+
+    assert [r["test_name"] for r in rows] == ["code", "named"]
+    assert [r["error"] for r in rows] == [False, True]
+    assert all(r["model"] == "gpt2" for r in rows)
+    assert rows[0]["latency"] == 1.2
+
+
+def test_results_manager_records():
+    suite = {
+        "test_name": "suite",
+        "timestamp": "20240115_143022",
+        "results": [{"passed": True, "prompt": "x"}, {"passed": False, "timestamp": "20240116_000000"}],
+    }
+    single = {"test_name": "one", "passed": True, "duration": 0.3}
+
+    suite_rows = list(iter_response_rows(suite))
+    (single_row,) = iter_response_rows(single)
+
+    assert [r["passed"] for r in suite_rows] == [True, False]
+    assert [r["timestamp"][:10] for r in suite_rows] == ["2024-01-15", "2024-01-16"]
+    assert single_row["test_name"] == "one"
+    assert single_row["latency"] == 0.3
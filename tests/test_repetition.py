@@ -0,0 +1,61 @@
+import pytest
+
+from llm_test_suite.evaluators.repetition import RepetitionEvaluator, repetition_stats
+
+
+def naive_repeated_ratio(tokens, n):
+    ngrams = [tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+    return 1 - len(set(ngrams)) / len(ngrams) if ngrams else 0.0
+
+
+@pytest.mark.parametrize("text", [
+    "the cat sat on the mat and the cat sat on the hat",
+    "a b c d e f g h",
+    "go go go go go",
+    "one two one two one two three",
+    "x",
+])
+def test_repeated_ratios_match_naive_count(text):
+    tokens = text.split()
+    stats = repetition_stats(tokens)
+
+    for n in (1, 2, 3, 4):
+        assert stats['repeated_ratios'][n] == pytest.approx(naive_repeated_ratio(tokens, n))
+    assert stats['token_count'] == len(tokens)
+
+
+def test_longest_run_and_most_common_share():
+    stats = repetition_stats("a b b b c b".split(), ngram_sizes=(2,))
+
+    assert stats['longest_run'] == 3
+    assert stats['most_common_share'] == pytest.approx(4 / 6)
+
+
+def test_empty_input():
+    stats = repetition_stats([])
+
+    assert stats['token_count'] == 0
+    assert stats['repeated_ratios'] == {1: 0.0, 2: 0.0, 3: 0.0, 4: 0.0}
+    assert stats['longest_run'] == 0
+    assert stats['most_common_share'] == 0.0
+
+
+def test_evaluator_flags_phrase_loops():
+    evaluator = RepetitionEvaluator()
+
+    looping = evaluator.evaluate("I think that I think that I think that I think that")
+    natural = evaluator.evaluate("The quick brown fox jumps over the lazy dog near the river.")
+
+    assert not looping['passed']
+    assert "Repetitive" in looping['message']
+    assert natural['passed']
+    assert set(natural['repeated_ratios']) == {1, 2, 3, 4}
+
+
+def test_evaluator_custom_limits():
+    evaluator = RepetitionEvaluator(ngram_sizes=(1,), max_repeated_ratio={1: 0.9})
+
+    result = evaluator.evaluate("yes yes yes no")
+
+    assert result['passed']
+    assert list(result['repeated_ratios']) == [1]
@@ -0,0 +1,110 @@
+import json
+import os
+
+import pytest
+
+from llm_test_suite.backends.base import GenerationBackend
+from llm_test_suite.utils import response_cache
+from llm_test_suite.utils.response_cache import ResponseCache
+
+KWARGS = {"max_new_tokens": 20, "temperature": 0.7}
+
+
+@pytest.fixture(autouse=True)
+def no_hub(monkeypatch):
+    lookups = []
+    monkeypatch.setattr(response_cache, "resolve_revision",
+                        lambda model_name: lookups.append(model_name) or "hub-rev")
+    return lookups
+
+
+def test_round_trip_and_counters(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+
+    assert cache.get("m", "p", KWARGS, 1) is None
+    cache.put("m", "p", KWARGS, 1, {"completion": "hi"})
+
+    assert cache.get("m", "p", KWARGS, 1) == {"completion": "hi"}
+    assert (cache.hits, cache.misses) == (1, 1)
+    # Fanned out by key prefix, with no temporary files left behind
+    key = cache.key("m", "p", KWARGS, 1)
+    assert os.listdir(tmp_path / key[:2]) == [f"{key}.json"]
+
+
+def test_key_covers_everything_that_determines_the_output(tmp_path):
+    cache = ResponseCache(str(tmp_path), revisions={"m": "r1", "n": "r1"})
+    base = cache.key("m", "p", KWARGS, 1)
+
+    assert cache.key("m", "p", dict(reversed(list(KWARGS.items()))), 1) == base
+    assert cache.key("n", "p", KWARGS, 1) != base
+    assert cache.key("m", "q", KWARGS, 1) != base
+    assert cache.key("m", "p", dict(KWARGS, temperature=0.8), 1) != base
+    assert cache.key("m", "p", KWARGS, 2) != base
+    assert ResponseCache(str(tmp_path), revisions={"m": "r2"}).key("m", "p", KWARGS, 1) != base
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.put("m", "p", KWARGS, 1, {"completion": "hi"})
+    path = cache._path(cache.key("m", "p", KWARGS, 1))
+    with open(path, "w") as f:
+        f.write("{corrupt")
+
+    assert cache.get("m", "p", KWARGS, 1) is None
+
+
+def test_revisions_are_looked_up_once_unless_disabled(tmp_path, no_hub):
+    cache = ResponseCache(str(tmp_path), revisions={"given": "r"})
+    cache.key("m", "p", KWARGS)
+    cache.key("m", "q", KWARGS)
+    cache.key("given", "p", KWARGS)
+    assert no_hub == ["m"]
+
+    offline = ResponseCache(str(tmp_path), lookup_revisions=False)
+    assert offline.revision("m") is None
+    assert no_hub == ["m"]
+
+
+def comparator_class():
+    # The comparator module imports the local transformers backend
+    pytest.importorskip("transformers")
+    from llm_test_suite.comparisons.model_comparator import ModelComparator
+    return ModelComparator
+
+
+class Served(GenerationBackend):
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.calls = 0
+
+    @property
+    def revision(self):
+        return f"{self.model_name}-served"
+
+    def generate(self, prompt, max_new_tokens=50, temperature=0.7, do_sample=None, seed=None):
+        self.calls += 1
+        return {"text": f"{self.model_name}: {prompt}", "full_text": prompt, "generation_time": 0.1,
+                "token_count": 2}
+
+    def generate_stream(self, prompt, **kwargs):
+        return self.generate(prompt)
+
+
+def test_comparator_keys_on_backend_revisions(tmp_path, no_hub):
+    with comparator_class()(["a", "b"], backend=Served, cache_dir=str(tmp_path)) as comparator:
+        first = comparator.compare_single_prompt("hi")
+        second = comparator.compare_single_prompt("hi")
+
+        assert comparator.response_cache.revision("a") == "a-served"
+        assert comparator.models["a"].calls == 1
+    assert no_hub == []
+    assert "cached" not in first["model_responses"]["a"]
+    assert second["model_responses"]["a"]["cached"] is True
+    assert second["model_responses"]["b"]["response"] == "b: hi"
+
+
+def test_lazy_custom_backends_skip_the_hub(tmp_path, no_hub):
+    with comparator_class()(["a"], backend=Served, lazy=True, cache_dir=str(tmp_path)) as comparator:
+        comparator.compare_single_prompt("hi")
+        assert comparator.compare_single_prompt("hi")["model_responses"]["a"]["cached"] is True
+    assert no_hub == []
@@ -0,0 +1,148 @@
+import pytest
+
+from llm_test_suite.runners.sharding import (
+    case_id,
+    iter_shard,
+    merge_shard_results,
+    parse_shard,
+    shard_of,
+    suite_summary,
+)
+
+
+def make_cases(count):
+    return [{"id": f"t{i}", "prompt": f"prompt {i}"} for i in range(count)]
+
+
+def make_result(case, passed=True):
+    return {"prompt": case["prompt"], "all_passed": passed, "case_index": case["case_index"]}
+
+
+def shard_result(shard_index, count, cases, model="m", timestamp="2026-01-01T00:00:00", consistency=()):
+    results = [make_result(case, passed=case["case_index"] % 3 != 0)
+               for case in iter_shard(cases, shard_index, count)]
+    summary = suite_summary(sum(r["all_passed"] for r in results), len(results))
+    summary["timestamp"] = timestamp
+    return {
+        "model": model,
+        "completion_tests": results,
+        "consistency_tests": list(consistency),
+        "summary": summary,
+        "shard": {"index": shard_index, "count": count},
+    }
+
+
+@pytest.mark.parametrize("spec, expected", [("0/1", (0, 1)), ("2/4", (2, 4)), (" 3 / 4 ", (3, 4))])
+def test_parse_shard(spec, expected):
+    assert parse_shard(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["1", "a/b", "1/2/3", "4/4", "-1/4", "0/0"])
+def test_parse_shard_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        parse_shard(spec)
+
+
+def test_case_id_falls_back_to_position():
+    assert case_id({"id": "x"}, 5) == "x"
+    assert case_id({"prompt": "p"}, 5) == "case-5"
+
+
+def test_shard_of_is_stable_and_in_range():
+    # Pinned values: assignments must not change between processes or releases
+    assert [shard_of(f"t{i}", 4) for i in range(8)] == [0, 2, 0, 2, 1, 3, 3, 1]
+    assert shard_of("case-0", 1000) == 807
+    assert all(0 <= shard_of(f"t{i}", 7) < 7 for i in range(100))
+    assert shard_of("t0", 1) == 0
+
+
+def test_shards_cover_every_case_exactly_once():
+    cases = make_cases(200)
+    indices = [case["case_index"] for i in range(4) for case in iter_shard(cases, i, 4)]
+
+    assert sorted(indices) == list(range(200))
+    # A stable hash spreads ids roughly evenly
+    sizes = [sum(1 for _ in iter_shard(cases, i, 4)) for i in range(4)]
+    assert min(sizes) > 25
+
+
+def test_iter_shard_is_lazy_and_copies_cases():
+    cases = make_cases(10)
+    consumed = []
+
+    def source():
+        for case in cases:
+            consumed.append(case["id"])
+            yield case
+
+    shard = iter_shard(source(), 0, 1)
+    first = next(shard)
+    assert consumed == ["t0"]
+    assert first == dict(cases[0], case_index=0)
+    assert "case_index" not in cases[0]
+
+
+def test_merge_restores_single_process_order_and_summary():
+    cases = make_cases(50)
+    single = [make_result(dict(case, case_index=i), passed=i % 3 != 0) for i, case in enumerate(cases)]
+    shards = [shard_result(i, 3, cases, consistency=[{"i": i}] if i == 0 else []) for i in (2, 0, 1)]
+
+    merged = merge_shard_results(shards)
+
+    expected = [{k: v for k, v in r.items() if k != "case_index"} for r in single]
+    assert merged["completion_tests"] == expected
+    assert merged["consistency_tests"] == [{"i": 0}]
+    assert merged["model"] == "m"
+    passed = sum(r["all_passed"] for r in single)
+    assert merged["summary"]["total_tests"] == 50
+    assert merged["summary"]["passed"] == passed
+    assert merged["summary"]["failed"] == 50 - passed
+    assert merged["summary"]["pass_rate"] == f"{passed / 50 * 100:.1f}%"
+
+
+def test_merge_does_not_modify_shard_results():
+    shards = [shard_result(i, 2, make_cases(10)) for i in range(2)]
+    merge_shard_results(shards)
+    assert all("case_index" in r for s in shards for r in s["completion_tests"])
+
+
+def test_merge_rejects_missing_shards():
+    cases = make_cases(20)
+    with pytest.raises(ValueError, match=r"missing \[1\]"):
+        merge_shard_results([shard_result(0, 3, cases), shard_result(2, 3, cases)])
+    with pytest.raises(ValueError):
+        merge_shard_results([])
+
+
+def test_merge_rejects_mismatched_runs():
+    cases = make_cases(20)
+    with pytest.raises(ValueError, match="shard counts"):
+        merge_shard_results([shard_result(0, 2, cases), shard_result(1, 3, cases)])
+    with pytest.raises(ValueError, match="different models"):
+        merge_shard_results([shard_result(0, 2, cases), shard_result(1, 2, cases, model="other")])
+
+
+def test_merge_keeps_newest_result_of_a_rerun_shard():
+    cases = make_cases(20)
+    stale = shard_result(1, 2, cases, timestamp="2026-01-01T00:00:00")
+    stale["completion_tests"] = []
+    stale["summary"] = suite_summary(0, 0)
+    stale["summary"]["timestamp"] = "2026-01-01T00:00:00"
+    retry = shard_result(1, 2, cases, timestamp="2026-01-01T01:00:00")
+
+    merged = merge_shard_results([stale, shard_result(0, 2, cases), retry])
+
+    assert merged["summary"]["total_tests"] == 20
+    assert [r["prompt"] for r in merged["completion_tests"]] == [c["prompt"] for c in cases]
+
+
+def test_merge_of_streamed_shards_uses_summary_counts():
+    cases = make_cases(20)
+    shards = [shard_result(i, 2, cases) for i in range(2)]
+    for shard in shards:
+        shard["completion_tests"] = []
+
+    merged = merge_shard_results(shards)
+
+    assert merged["completion_tests"] == []
+    assert merged["summary"]["total_tests"] == 20
@@ -0,0 +1,112 @@
+import gzip
+import json
+
+import pytest
+
+from llm_test_suite.utils.sqlite_store import SqliteResultStore
+
+
+def result(model, passed, latency, timestamp="2024-01-15T10:00:00", test_name="t"):
+    return {"test_name": test_name, "model": model, "prompt": "p", "passed": passed,
+            "time_taken": latency, "timestamp": timestamp}
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SqliteResultStore(str(tmp_path / "results.db"), commit_every=2) as db:
+        yield db
+
+
+def test_write_and_query(store):
+    store.write(result("a", True, 0.5), run_id="r1")
+    store.write(result("a", False, 2.0, "2024-01-16T10:00:00"), run_id="r1")
+    store.write(result("b", True, 1.0), run_id="r2")
+
+    assert len(store.query()) == 3
+    assert [r["model"] for r in store.query(run_id="r2")] == ["b"]
+    assert [r["latency"] for r in store.query(passed=False)] == [2.0]
+    assert [r["latency"] for r in store.query(min_latency=1.0, order_by="latency")] == [1.0, 2.0]
+    assert len(store.query(since="2024-01-16")) == 1
+    assert len(store.query(limit=2)) == 2
+    row = store.query(model="b")[0]
+    assert row["passed"] is True and row["error"] is False
+
+
+def test_invalid_query_arguments(store):
+    with pytest.raises(ValueError):
+        store.query(order_by="prompt; DROP TABLE results")
+    with pytest.raises(ValueError):
+        store.query(prompt="p")
+    with pytest.raises(ValueError):
+        store.aggregate(group_by=("prompt",))
+
+
+def test_aggregate(store):
+    store.write(result("a", True, 1.0))
+    store.write(result("a", False, 3.0, "2024-01-16T10:00:00"))
+    store.write(result("b", True, 2.0))
+
+    by_model = {g["model"]: g for g in store.aggregate()}
+    assert by_model["a"]["count"] == 2
+    assert by_model["a"]["pass_rate"] == 0.5
+    assert by_model["a"]["avg_latency"] == 2.0
+    assert by_model["a"]["max_latency"] == 3.0
+
+    by_day = store.aggregate(group_by=("model", "day"), model="a")
+    assert [(g["day"], g["passed"]) for g in by_day] == [("2024-01-15", 1), ("2024-01-16", 0)]
+
+
+def test_import_skips_files_already_imported(tmp_path, store):
+    (tmp_path / "run_a.json").write_text(json.dumps(result("a", True, 1.0)))
+    with gzip.open(tmp_path / "run_b.jsonl.gz", "wt") as f:
+        f.write(json.dumps(result("b", True, 1.0)) + "\n" + json.dumps(result("b", False, 2.0)) + "\n")
+
+    assert store.import_json_files(str(tmp_path)) == 3
+    assert store.import_json_files(str(tmp_path)) == 0
+    assert {r["run_id"] for r in store.query()} == {"run_a", "run_b"}
+
+
+def test_failed_file_import_leaves_no_rows_and_is_retried(tmp_path, store):
+    path = tmp_path / "run_c.jsonl"
+    lines = [json.dumps(result("c", True, 1.0))] * 3
+    path.write_text("\n".join(lines[:2] + ["{corrupt"] + lines[2:]) + "\n")
+
+    assert store.import_json_files(str(tmp_path)) == 0
+    assert store.query() == []
+
+    path.write_text("\n".join(lines) + "\n")
+    assert store.import_json_files(str(tmp_path)) == 3
+
+
+def test_failed_import_keeps_earlier_writes(tmp_path, store):
+    store.write(result("a", True, 1.0), run_id="live")
+    (tmp_path / "run_d.jsonl").write_text("{corrupt\n")
+
+    store.import_json_files(str(tmp_path))
+
+    assert [r["run_id"] for r in store.query()] == ["live"]
+
+
+def test_import_of_non_string_timestamp(tmp_path, store):
+    (tmp_path / "run_e.jsonl").write_text(
+        json.dumps(result("e", True, 1.0)) + "\n" + json.dumps(result("e", False, 2.0, timestamp=1700000000)) + "\n"
+    )
+
+    assert store.import_json_files(str(tmp_path)) == 2
+    assert sorted(r["timestamp"] or "" for r in store.query()) == ["", "2024-01-15T10:00:00"]
+
+
+def test_any_error_rolls_back_the_file(tmp_path):
+    db_path = str(tmp_path / "other.db")
+    path = tmp_path / "run_f.jsonl"
+    good = json.dumps(result("f", True, 1.0))
+    # A list where a mapping is expected fails with AttributeError, not ValueError
+    path.write_text(good + "\n" + json.dumps({"model_responses": ["x"]}) + "\n")
+
+    # close() commits; the good line must not be committed with it
+    with SqliteResultStore(db_path) as db:
+        assert db.import_json_files(str(tmp_path)) == 0
+    with SqliteResultStore(db_path) as db:
+        assert db.query() == []
+        path.write_text(good + "\n")
+        assert db.import_json_files(str(tmp_path)) == 1
@@ -0,0 +1,56 @@
+import math
+
+import numpy as np
+import pytest
+
+from llm_test_suite.utils.stats import percentile, summarize_latencies, token_timing_metrics
+
+
+@pytest.mark.parametrize("pct", [0, 10, 25, 50, 90, 99, 100])
+def test_percentile_matches_numpy(pct):
+    values = [0.31, 0.12, 0.5, 0.07, 0.44, 0.29, 0.18]
+    assert percentile(values, pct) == pytest.approx(np.percentile(values, pct))
+
+
+def test_percentile_edge_cases():
+    assert percentile([], 50) is None
+    assert percentile([2.0], 99) == 2.0
+    assert percentile([1.0, 3.0], 50) == 2.0
+
+
+def test_summarize_latencies():
+    stats = summarize_latencies([1.0, 2.0, 3.0, 4.0])
+
+    assert stats['count'] == 4
+    assert stats['mean'] == 2.5
+    assert stats['stdev'] == pytest.approx(math.sqrt(5 / 3))
+    assert (stats['min'], stats['max']) == (1.0, 4.0)
+    assert stats['p50'] == 2.5
+    assert stats['p99'] == pytest.approx(3.97)
+
+
+def test_summarize_latencies_small_samples():
+    assert summarize_latencies([]) == {'count': 0}
+    single = summarize_latencies([0.5])
+    assert single['stdev'] == 0.0
+    assert single['p50'] == single['p99'] == 0.5
+
+
+def test_token_timing_metrics():
+    metrics = token_timing_metrics(10.0, 11.0, [10.2, 10.4, 10.6, 10.8])
+
+    assert metrics['total_time'] == pytest.approx(1.0)
+    assert metrics['time_to_first_token'] == pytest.approx(0.2)
+    assert metrics['token_latencies'] == pytest.approx([0.2, 0.2, 0.2])
+    assert metrics['inter_token_latency'] == pytest.approx(0.2)
+    assert metrics['tokens_per_second'] == pytest.approx(5.0)
+    assert metrics['generated_tokens'] == 4
+
+
+def test_token_timing_metrics_without_tokens():
+    metrics = token_timing_metrics(0.0, 1.0, [])
+
+    assert metrics['time_to_first_token'] is None
+    assert metrics['inter_token_latency'] is None
+    assert metrics['tokens_per_second'] is None
+    assert metrics['generated_tokens'] == 0
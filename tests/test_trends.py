@@ -0,0 +1,86 @@
+import pytest
+
+from llm_test_suite.reporting.trends import build_series, daily_buckets, detect_regressions, render_trends
+
+
+def suite(day, latencies, passed=True, model="gpt2"):
+    return {
+        "model": model,
+        "completion_tests": [
+            {"prompt": "p", "category": "code", "all_passed": passed, "time_taken": latency,
+             "token_count": 10, "timestamp": f"{day}T12:00:00"}
+            for latency in latencies
+        ],
+    }
+
+
+def series_for(days):
+    """days: list of (day, mean latency) for one model/test."""
+    return build_series(daily_buckets(suite(day, [latency])) for day, latency in days)
+
+
+def test_buckets_are_additive_across_files():
+    series = build_series([
+        daily_buckets(suite("2024-01-01", [1.0, 3.0])),
+        daily_buckets(suite("2024-01-01", [2.0], passed=False)),
+        daily_buckets(suite("2024-01-02", [4.0])),
+    ])
+
+    points = series[("gpt2", "code")]
+    assert [p["day"] for p in points] == ["2024-01-01", "2024-01-02"]
+    assert points[0]["count"] == 3
+    assert points[0]["mean_latency"] == pytest.approx(2.0)
+    assert points[0]["pass_rate"] == pytest.approx(2 / 3)
+    assert points[0]["tokens_per_second"] == pytest.approx(30 / 6)
+
+
+def test_rows_without_timestamp_or_latency():
+    record = {"model": "m", "completion_tests": [
+        {"prompt": "p", "category": "c", "all_passed": True},
+        {"prompt": "p", "category": "c", "all_passed": True, "timestamp": "2024-01-01T00:00:00"},
+    ]}
+
+    (point,) = build_series([daily_buckets(record)])[("m", "c")]
+
+    assert point["count"] == 1
+    assert point["mean_latency"] is None
+    assert point["tokens_per_second"] is None
+
+
+def test_regression_against_median_baseline():
+    days = [(f"2024-01-0{i}", latency) for i, latency in enumerate([1.0, 1.1, 0.9, 5.0, 1.0], 1)]
+    days.append(("2024-01-06", 1.5))
+
+    (regression,) = detect_regressions(series_for(days), threshold=0.2)
+
+    assert regression["day"] == "2024-01-06"
+    assert regression["baseline"] == pytest.approx(1.0)
+    assert regression["change"] == pytest.approx(0.5)
+
+
+def test_no_regression_within_threshold_or_without_history():
+    assert detect_regressions(series_for([("2024-01-01", 1.0), ("2024-01-02", 1.1)]), threshold=0.2) == []
+    assert detect_regressions(series_for([("2024-01-01", 1.0)])) == []
+
+
+def test_baseline_uses_only_recent_days():
+    days = [("2024-01-01", 10.0), ("2024-01-02", 1.0), ("2024-01-03", 1.0), ("2024-01-04", 2.0)]
+
+    assert detect_regressions(series_for(days), baseline_days=2)[0]["baseline"] == pytest.approx(1.0)
+
+
+def test_render_trends_puts_regressions_first_and_escapes():
+    series = build_series([
+        daily_buckets(suite("2024-01-01", [1.0], model="<a>")),
+        daily_buckets(suite("2024-01-01", [1.0], model="z")),
+        daily_buckets(suite("2024-01-02", [3.0], model="z")),
+    ])
+    regressions = detect_regressions(series)
+
+    html = render_trends(series, regressions)
+
+    assert "Latency regressions" in html
+    assert html.index("trend-card regressed") < html.index("&lt;a&gt;")
+    assert "<a>" not in html
+    assert html.count("<svg") == 4
+    assert render_trends({}, []) == ""